@@ -0,0 +1,90 @@
+import asyncio
+import statistics
+import sys
+import time
+
+from wizwalker import ClientHandler
+
+
+TICK = 0.001
+DURATION = 10
+
+
+async def measure_loop_latency(stop: asyncio.Event) -> list:
+    # how late the loop wakes up a task that only sleeps
+    lags = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+    return lags
+
+
+async def load_client(client, stop: asyncio.Event) -> int:
+    reads = 0
+    while not stop.is_set():
+        await asyncio.gather(
+            client.body.position(),
+            client.body.yaw(),
+            client.stats.current_hitpoints(),
+            client.stats.current_mana(),
+            client.stats.max_hitpoints(),
+            client.stats.max_mana(),
+        )
+        reads += 6
+
+    return reads
+
+
+async def run(clients, use_io_worker: bool):
+    for client in clients:
+        if use_io_worker:
+            client.hook_handler.enable_io_worker()
+
+        else:
+            client.hook_handler.disable_io_worker()
+
+    stop = asyncio.Event()
+    latency_task = asyncio.create_task(measure_loop_latency(stop))
+    load_tasks = [asyncio.create_task(load_client(client, stop)) for client in clients]
+
+    await asyncio.sleep(DURATION)
+    stop.set()
+
+    lags = await latency_task
+    reads = sum(await asyncio.gather(*load_tasks))
+
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    print(
+        f"io worker {'on ' if use_io_worker else 'off'}:"
+        f" reads/s={reads / DURATION:.0f}"
+        f" loop lag p50={statistics.median(lags_ms):.2f}ms"
+        f" p99={lags_ms[int(len(lags_ms) * 0.99)]:.2f}ms"
+        f" max={lags_ms[-1]:.2f}ms"
+    )
+
+
+async def main():
+    handler = ClientHandler()
+    clients = handler.get_new_clients()
+
+    if len(clients) < 10:
+        print(f"Only found {len(clients)} clients; open at least 10 for a meaningful run")
+
+    try:
+        print("Preparing")
+        await handler.activate_all_client_hooks()
+
+        await run(clients, use_io_worker=False)
+        await run(clients, use_io_worker=True)
+    finally:
+        print("Closing")
+        await handler.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        DURATION = int(sys.argv[1])
+
+    asyncio.run(main())
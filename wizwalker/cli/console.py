@@ -12,6 +12,7 @@ from pymem import Pymem
 
 from wizwalker import XYZ
 from wizwalker.memory import InstanceFinder
+from wizwalker.memory.memory_object import DynamicMemoryObject
 
 
 def init_console_server(host: str, port: int, _locals, loop):
@@ -212,15 +213,34 @@ class WizWalkerConsole(Monitor):
 
     def do_findinstances(self, class_name: str):
         """Find instances of a class"""
-        if self.instance_finders.get(class_name):
-            finder = self.instance_finders[class_name]
+        walker = self.get_local("walker")
+        # instances are wrapped with the first client's hook handler
+        client = walker.clients[0] if walker.clients else None
+
+        finder_key = (client.process_id if client is not None else None, class_name)
+        if self.instance_finders.get(finder_key):
+            finder = self.instance_finders[finder_key]
 
         else:
-            pm = Pymem("WizardGraphicalClient.exe")
+            if client is not None:
+                pm = client.hook_handler.process
+
+            else:
+                pm = Pymem("WizardGraphicalClient.exe")
+
             finder = InstanceFinder(pm, class_name)
-            self.instance_finders[class_name] = finder
+            self.instance_finders[finder_key] = finder
+
+        if client is not None:
+            instances = self.run_coro(
+                finder.get_instance_objects(
+                    client.hook_handler, default=DynamicMemoryObject
+                ),
+                None,
+            )
 
-        instances = self.run_coro(finder.get_instances(), None)
+        else:
+            instances = self.run_coro(finder.get_instances(), None)
 
         self.write(str(instances))
 
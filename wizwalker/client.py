@@ -27,10 +27,12 @@ from .memory import (
     CurrentRenderContext,
     TeleportHelper,
     MovementTeleportHook,
+    WindowIndex,
 )
 from .mouse_handler import MouseHandler
 from .utils import (
     XYZ,
+    XYZArray,
     check_if_process_running,
     get_window_title,
     set_window_title,
@@ -64,6 +66,7 @@ class Client:
         self.quest_position = CurrentQuestPosition(self.hook_handler)
         self.client_object = CurrentClientObject(self.hook_handler)
         self.root_window = CurrentRootWindow(self.hook_handler)
+        self.window_index = WindowIndex(self.root_window)
         self.render_context = CurrentRenderContext(self.hook_handler)
         self.game_client = CurrentGameClient(self.hook_handler)
 
@@ -71,7 +74,6 @@ class Client:
 
         self._template_ids = None
         self._is_loading_addr = None
-        self._world_view_window = None
 
         self._movement_update_address = None
         self._movement_update_original_bytes = None
@@ -153,6 +155,22 @@ class Client:
         root_client = await self.client_object.parent()
         return await root_client.children()
 
+    async def get_base_entity_locations(self, entities: List = None) -> XYZArray:
+        """
+        Locations of entities read concurrently
+
+        Args:
+            entities: The entities or None to use get_base_entity_list
+
+        Returns:
+            The locations in the same order as the entities
+        """
+        if entities is None:
+            entities = await self.get_base_entity_list()
+
+        locations = await asyncio.gather(*(entity.location() for entity in entities))
+        return XYZArray.from_xyzs(locations)
+
     # TODO: add example
     async def get_base_entities_with_predicate(self, predicate: Callable):
         """
@@ -212,14 +230,19 @@ class Client:
         """
         Get the world view window
         """
-        if self._world_view_window:
-            return self._world_view_window
-
-        pos = await self.root_window.get_windows_with_name("WorldView")
         # TODO: test this claim on login screen
-        # world view always exists
-        self._world_view_window = pos[0]
-        return self._world_view_window
+        # world view always exists and only changes with the root window
+        return await self.window_index.get_window_with_name("WorldView", validate=False)
+
+    def snapshot(self, *, page_size: int = 0x1000):
+        """
+        Async context manager that serves this client's reads from pages
+        read once for the rest of the scope; see MemoryReader.snapshot
+
+        Keyword Args:
+            page_size: How many bytes to read at a time, must be a power of 2
+        """
+        return self.hook_handler.snapshot(page_size=page_size)
 
     async def activate_hooks(
             self, *, wait_for_ready: bool = True, timeout: float = None
@@ -300,7 +323,13 @@ class Client:
             self._is_loading_addr = mov_instruction_addr + 7 + rip_offset
 
         # 1 -> can't move (loading) 0 -> can move (not loading)
-        return await self.hook_handler.read_typed(self._is_loading_addr, "bool")
+        is_loading = await self.hook_handler.read_typed(self._is_loading_addr, "bool")
+
+        # everything gets reallocated during a loading screen
+        if is_loading:
+            self.hook_handler.pointer_cache.invalidate()
+
+        return is_loading
 
     async def is_in_dialog(self) -> bool:
         """
@@ -333,15 +362,13 @@ class Client:
         This client's backpack space used and max
         must be on inventory page to use
         """
-        maybe_space_window = await self.root_window.get_windows_with_name(
-            "inventorySpace"
-        )
+        maybe_space_window = await self.window_index.get_window_with_name("inventorySpace")
 
-        if not maybe_space_window:
+        if maybe_space_window is None:
             # TODO: replace error
             raise ValueError("must open inventory screen to get")
 
-        text = await maybe_space_window[0].maybe_text()
+        text = await maybe_space_window.maybe_text()
         text = text.replace("<center>", "")
         used, total = text.split("/")
         return int(used), int(total)
@@ -356,27 +383,37 @@ class Client:
             name: The name of the zone to wait to be changed from or None to read
             sleep_time: How long to sleep between reads or None to not
         """
+        # cached pointers would keep pointing at the old zone
+        pointer_cache = self.hook_handler.pointer_cache
+
         if name is None:
+            pointer_cache.invalidate()
             name = await self.zone_name()
 
-        while await self.zone_name() == name:
+        while True:
+            pointer_cache.invalidate()
+            if await self.zone_name() != name:
+                break
+
             await asyncio.sleep(sleep_time)
 
         while await self.is_loading():
             await asyncio.sleep(sleep_time)
 
+        pointer_cache.invalidate()
+
     async def current_energy(self) -> int:
         """
         Client's current energy
         energy globe must be visible to use
         """
-        maybe_energy_text = await self.root_window.get_windows_with_name("textEnergy")
+        maybe_energy_text = await self.window_index.get_window_with_name("textEnergy")
 
-        if not maybe_energy_text:
+        if maybe_energy_text is None:
             # TODO: replace error
             raise ValueError("Energy globe not on screen")
 
-        text = await maybe_energy_text[0].maybe_text()
+        text = await maybe_energy_text.maybe_text()
         text = text.replace("<center>", "")
         text = text.replace("</center>", "")
         return int(text)
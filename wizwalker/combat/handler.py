@@ -47,9 +47,12 @@ class CombatHandler:
             DeprecationWarning,
         )
 
-        hand = await self.client.root_window.get_windows_with_name("Hand")
         # this window is always in ui tree
-        hand = hand[0]
+        hand = await self.client.window_index.get_window_with_name("Hand")
+        if hand is None:
+            # TODO: replace error
+            raise ValueError("Hand window not found")
+
         while WindowFlags.visible not in await hand.flags():
             await asyncio.sleep(sleep_time)
 
@@ -58,18 +61,17 @@ class CombatHandler:
         Wait for the duel to enter the planning phase
 
         Args:
-            sleep_time: Time to sleep between checks
+            sleep_time: Most time to sleep between checks
         """
-        while True:
-            try:
-                phase = await self.client.duel.duel_phase()
-                if phase in (DuelPhase.planning, DuelPhase.ended):
-                    break
-
-                await asyncio.sleep(sleep_time)
-
-            except WizWalkerMemoryError:
-                break
+        try:
+            await self.client.hook_handler.watcher.wait_for(
+                self.client.duel.duel_phase,
+                lambda phase: phase in (DuelPhase.planning, DuelPhase.ended),
+                ignore_errors=False,
+                max_interval=sleep_time,
+            )
+        except WizWalkerMemoryError:
+            pass
 
     async def wait_for_combat(self, sleep_time: float = 0.5):
         """
@@ -401,15 +403,11 @@ class CombatHandler:
         """
         Click the pass button
         """
-        pos_done_window = await self.client.root_window.get_windows_with_name(
-            "DoneWindow"
-        )
-        if pos_done_window:
-            done_window = pos_done_window[0]
-
+        done_window = await self.client.window_index.get_window_with_name("DoneWindow")
+        if done_window is not None:
             if await done_window.is_visible():
                 pos_defeated_pass_button = await done_window.get_windows_with_name(
-                    "DefeatedPassButton"
+                    "DefeatedPassButton", find_first=True
                 )
                 defeated_pass_button = pos_defeated_pass_button[0]
 
@@ -429,15 +427,11 @@ class CombatHandler:
         """
         Click the free button
         """
-        pos_done_window = await self.client.root_window.get_windows_with_name(
-            "DoneWindow"
-        )
-        if pos_done_window:
-            done_window = pos_done_window[0]
-
+        done_window = await self.client.window_index.get_window_with_name("DoneWindow")
+        if done_window is not None:
             if await done_window.is_visible():
                 pos_defeated_flee_button = await done_window.get_windows_with_name(
-                    "DefeatedFleeButton"
+                    "DefeatedFleeButton", find_first=True
                 )
                 defeated_flee_button = pos_defeated_flee_button[0]
 
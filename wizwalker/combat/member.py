@@ -55,7 +55,7 @@ class CombatMember:
         Useful for targeting
         """
         possible = await wizwalker.utils.maybe_wait_for_any_value_with_timeout(
-            partial(self._combatant_control.get_windows_with_name, "Health"), timeout=5
+            partial(self._combatant_control.get_windows_with_name, "Health", find_first=True), timeout=5
         )
 
         if possible:
@@ -67,7 +67,7 @@ class CombatMember:
         """
         Get the name text window
         """
-        possible = await self._combatant_control.get_windows_with_name("Name")
+        possible = await self._combatant_control.get_windows_with_name("Name", find_first=True)
         if possible:
             return possible[0]
 
@@ -1,6 +1,13 @@
 from .handler import HookHandler
 from .hooks import *
 from .memory_object import MemoryObject
-from .memory_reader import MemoryReader
+from .memory_reader import MemoryReader, set_scan_workers
 from .memory_objects import *
 from .instance_finder import InstanceFinder
+from .window_index import WindowIndex
+from .pattern_cache import PatternCache, get_pattern_cache
+from .object_factory import dynamic_object_from_address, register_dynamic_type
+from .read_snapshot import ReadSnapshot, read_snapshot
+from .string_cache import StringCache, get_string_cache
+from .watcher import FieldWatch, FieldWatcher
+from .hook_events import HookEvent, HookEventDrainer
@@ -1,24 +1,35 @@
 import asyncio
 import struct
-from typing import Any
+from typing import Any, List
 
 import pymem
 import pymem.exception
+import pymem.process
 from loguru import logger
 
 from wizwalker import HookAlreadyActivated, HookNotActive, HookNotReady
 from .hooks import (
     ClientHook,
+    DuelEventHook,
     DuelHook,
+    EventRingHook,
+    MemoryHook,
     MouselessCursorMoveHook,
     PlayerHook,
     PlayerStatHook,
+    QuestEventHook,
     QuestHook,
     RootWindowHook,
     RenderContextHook,
     MovementTeleportHook,
 )
+from .hook_events import HookEventDrainer
 from .memory_reader import MemoryReader
+from .module_mirror import ModuleMirror, get_module_mirror, set_module_mirror
+from .pointer_cache import PointerCache
+from .io_worker import IOWorker, set_io_worker
+from .read_coalescer import ReadCoalescer, set_read_coalescer
+from .watcher import FieldWatcher
 
 
 # noinspection PyUnresolvedReferences
@@ -49,6 +60,24 @@ class HookHandler(MemoryReader):
         self._active_hooks = []
         self._base_addrs = {}
 
+        self.pointer_cache = PointerCache()
+        # pattern_scan_offset_cached results shared by this client's objects
+        self.offset_lookup_cache = {}
+        self._last_duel_base = None
+
+        self._exe_module = None
+        self._exe_module_key = None
+
+        # hook name -> drainer of that hook's event ring
+        self._hook_event_drainers = {}
+
+        # polls watched fields; see FieldWatcher
+        self.watcher = FieldWatcher(self)
+
+        # if activate_all_hooks should load a local copy of the exe's read-only
+        # sections; costs a few megabytes per client
+        self.mirror_module = False
+
     async def _get_open_autobot_address(self, size: int) -> int:
         if self._autobot_pos + size > self.AUTOBOT_SIZE:
             raise RuntimeError("Somehow went over autobot size")
@@ -106,6 +135,92 @@ class HookHandler(MemoryReader):
 
         return address
 
+    async def get_exe_module(self):
+        """
+        Get the module info of WizardGraphicalClient.exe; looked up once
+        """
+        if self._exe_module is None:
+            module_object = pymem.process.module_from_name(
+                self.process.process_handle, "WizardGraphicalClient.exe"
+            )
+
+            if module_object is None:
+                raise ValueError("WizardGraphicalClient.exe module not found.")
+
+            self._exe_module = module_object
+
+        return self._exe_module
+
+    async def get_exe_module_key(self) -> str:
+        """
+        Get the key of WizardGraphicalClient.exe's build, built from its PE
+        timestamp and image size like the pattern cache's keys; looked up once
+        """
+        if self._exe_module_key is None:
+            self._exe_module_key = await self._get_module_key(
+                "WizardGraphicalClient.exe", await self.get_exe_module()
+            )
+
+        return self._exe_module_key
+
+    async def load_module_mirror(self) -> ModuleMirror:
+        """
+        Copy the read-only sections of WizardGraphicalClient.exe so reads of
+        code and constant data are served locally; loaded once per process
+
+        Returns:
+            The loaded mirror
+        """
+        if (mirror := get_module_mirror(self.process)) is not None:
+            return mirror
+
+        module_object = await self.get_exe_module()
+        mirror = await ModuleMirror.from_module(self, module_object.lpBaseOfDll)
+        set_module_mirror(self.process, mirror)
+
+        logger.debug(f"Mirrored {len(mirror)} bytes of WizardGraphicalClient.exe")
+        return mirror
+
+    def enable_read_coalescing(self, *, max_gap: int = 64, max_size: int = 0x10000):
+        """
+        Merge this client's reads requested in the same loop iteration into
+        fewer larger reads; mostly useful when gathering many reads at once
+
+        Keyword Args:
+            max_gap: Largest gap between two ranges that still merges them
+            max_size: Largest merged read
+        """
+        set_read_coalescer(
+            self.process.process_id,
+            ReadCoalescer(self.process, max_gap=max_gap, max_size=max_size),
+        )
+
+    def disable_read_coalescing(self):
+        """
+        Go back to reading directly
+        """
+        set_read_coalescer(self.process.process_id, None)
+
+    def enable_io_worker(self, *, max_gap: int = 64, max_size: int = 0x10000):
+        """
+        Run this client's reads and writes on a dedicated thread so they don't
+        block the event loop; reads are merged like with read coalescing
+
+        Keyword Args:
+            max_gap: Largest gap between two reads that still merges them
+            max_size: Largest merged read
+        """
+        set_io_worker(
+            self.process.process_id,
+            IOWorker(self.process, max_gap=max_gap, max_size=max_size),
+        )
+
+    def disable_io_worker(self):
+        """
+        Go back to reading and writing on the event loop
+        """
+        set_io_worker(self.process.process_id, None)
+
     async def close(self):
         for hook in self._active_hooks:
             await hook.unhook()
@@ -116,6 +231,16 @@ class HookHandler(MemoryReader):
         self._autobot_pos = 0
         self._autobot_address = None
         self._base_addrs = {}
+        self.pointer_cache.invalidate()
+        set_module_mirror(self.process, None)
+        self.disable_read_coalescing()
+        self.disable_io_worker()
+        self.watcher.close()
+        for drainer in self._hook_event_drainers.values():
+            drainer.stop()
+        self._hook_event_drainers = {}
+        self._exe_module = None
+        self._exe_module_key = None
 
     async def _check_for_autobot(self):
         if self._autobot_lock is None:
@@ -139,42 +264,124 @@ class HookHandler(MemoryReader):
 
         return None
 
-    async def _read_hook_base_addr(self, addr_name: str, hook_name: str):
+    def _add_hook_event_drainer(self, hook_name: str, hook: EventRingHook):
+        self._hook_event_drainers[hook_name] = HookEventDrainer(
+            self, hook.ring_address, hook.capacity
+        )
+
+    def _remove_hook_event_drainer(self, hook_name: str):
+        if (drainer := self._hook_event_drainers.pop(hook_name, None)) is not None:
+            drainer.stop()
+
+    def get_hook_event_drainer(self, hook_name: str) -> HookEventDrainer:
+        """
+        Get the drainer of a hook activated with events=True
+
+        Args:
+            hook_name: Name of the hook i.e. Duel or Quest
+
+        Raises:
+            HookNotActive: If the hook isn't active with events
+        """
+        drainer = self._hook_event_drainers.get(hook_name)
+        if drainer is None:
+            raise HookNotActive(f"{hook_name} events")
+
+        return drainer
+
+    async def _read_hook_base_addr(
+        self, addr_name: str, hook_name: str, *, cache: bool = True
+    ):
         addr = self._base_addrs.get(addr_name)
         if addr is None:
             raise HookNotActive(hook_name)
 
+        if cache and (cached := self.pointer_cache.get(addr_name)) is not None:
+            return cached
+
         try:
-            return await self.read_typed(addr, "long long")
+            base_addr = await self.read_typed(addr, "long long")
         except pymem.exception.MemoryReadError:
             raise HookNotReady(hook_name)
 
+        # 0 means the hook hasn't run yet
+        if cache and base_addr != 0:
+            self.pointer_cache.set(addr_name, base_addr)
+
+        return base_addr
+
     # wait for an addr to be set and not 0
     async def _wait_for_value(self, address: int, timeout: int = None):
-        async def _wait_for_value_task():
-            while True:
-                try:
-                    value = await self.read_typed(address, "long long")
-                    logger.debug(
-                        f"Waiting for address {hex(address)}; got value {value}"
-                    )
-                except pymem.exception.MemoryReadError:
-                    pass
-                else:
-                    if value != 0:
-                        logger.debug(f"Address {hex(address)} is set")
-                        break
-                    else:
-                        logger.debug(f"Address {hex(address)} is not set yet; sleeping")
-                        await asyncio.sleep(0.5)
+        await self._wait_for_values([address], timeout)
+
+    # wait for every addr to be set and not 0
+    async def _wait_for_values(self, addresses: List[int], timeout: int = None):
+        logger.debug(f"Waiting for addresses {[hex(address) for address in addresses]}")
+        # the watcher polls these together each tick; read errors, i.e. the
+        # client closing, are raised instead of waiting forever
+        value_watches = [
+            self.watcher.watch_address(address, "long long", ignore_errors=False)
+            for address in addresses
+        ]
 
         try:
-            await asyncio.wait_for(_wait_for_value_task(), timeout)
-        except TimeoutError:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    *(
+                        value_watch.wait_for(lambda value: value != 0)
+                        for value_watch in value_watches
+                    )
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError:
             # TODO: replace error
             raise TimeoutError("Hook value took too long")
+        finally:
+            for value_watch in value_watches:
+                value_watch.close()
+
+        logger.debug(f"Addresses {[hex(address) for address in addresses]} are set")
+
+    async def _activate_hooks(self, hooks: List[MemoryHook]):
+        # patterns are scanned concurrently and every hook body is written before
+        # any jump; if anything fails the hooks written so far are unhooked
+        await asyncio.gather(*(hook.resolve_jump_address() for hook in hooks))
+
+        results = await asyncio.gather(
+            *(hook.write_hook_body() for hook in hooks), return_exceptions=True
+        )
+        written = [
+            hook for hook, result in zip(hooks, results) if not isinstance(result, Exception)
+        ]
+
+        for result in results:
+            if isinstance(result, Exception):
+                await self._unhook_written(written)
+                raise result
+
+        # jumps are written one at a time so each hook is tracked as soon as
+        # the game can run it
+        for hook in written:
+            try:
+                await hook.write_jump()
+            except Exception:
+                await self._unhook_written(written)
+                raise
+
+            self._active_hooks.append(hook)
+
+    async def _unhook_written(self, hooks: List[MemoryHook]):
+        for hook in hooks:
+            if hook in self._active_hooks:
+                self._active_hooks.remove(hook)
+
+            # the error that got us here is the one worth raising
+            try:
+                await hook.unhook()
+            except Exception as exc:
+                logger.error(f"Couldn't unhook {type(hook).__name__}: {exc}")
 
-    # TODO: make this faster
     async def activate_all_hooks(
         self, *, wait_for_ready: bool = True, timeout: float = None
     ):
@@ -185,32 +392,77 @@ class HookHandler(MemoryReader):
             wait_for_ready: Wait for hook values to be written
             timeout: How long to wait for hook values to be written (None for no timeout)
         """
-        await self.activate_player_hook(wait_for_ready=False)
-        # duel is only written to on battle join
-        await self.activate_duel_hook()
-        # quest hook is not written if the quest arrow is off
-        await self.activate_quest_hook()
-        await self.activate_player_stat_hook(wait_for_ready=False)
-        await self.activate_client_hook(wait_for_ready=False)
-        await self.activate_root_window_hook(wait_for_ready=False)
-        await self.activate_render_context_hook(wait_for_ready=False)
-        await self.activate_movement_teleport_hook(wait_for_ready=False)
+        for hook_type, hook_name in (
+            (PlayerHook, "Player"),
+            (DuelHook, "Duel"),
+            (QuestHook, "Quest"),
+            (PlayerStatHook, "Player stat"),
+            (ClientHook, "Client"),
+            (RootWindowHook, "Root window"),
+            (RenderContextHook, "Render context"),
+            (MovementTeleportHook, "Movement teleport"),
+        ):
+            if self._check_if_hook_active(hook_type):
+                raise HookAlreadyActivated(hook_name)
+
+        if self.mirror_module:
+            # pattern scans and code reads below are then served locally
+            await self.load_module_mirror()
 
-        if wait_for_ready:
-            wait_tasks = []
-            for atter_name in [
-                "player_struct",
-                "player_stat_struct",
-                "current_client",
-                "current_root_window",
-                "current_render_context",
-            ]:
-                value = self._base_addrs[atter_name]
-                wait_tasks.append(
-                    asyncio.create_task(self._wait_for_value(value, timeout))
-                )
+        await self._check_for_autobot()
+
+        player_hook = PlayerHook(self)
+        duel_hook = DuelHook(self)
+        quest_hook = QuestHook(self)
+        player_stat_hook = PlayerStatHook(self)
+        client_hook = ClientHook(self)
+        root_window_hook = RootWindowHook(self)
+        render_context_hook = RenderContextHook(self)
+        movement_teleport_hook = MovementTeleportHook(self)
+
+        await self._activate_hooks(
+            [
+                player_hook,
+                duel_hook,
+                quest_hook,
+                player_stat_hook,
+                client_hook,
+                root_window_hook,
+                render_context_hook,
+                movement_teleport_hook,
+            ]
+        )
 
-            await asyncio.gather(*wait_tasks)
+        self._base_addrs["player_struct"] = player_hook.player_struct
+        self._base_addrs["current_duel"] = duel_hook.current_duel_addr
+        self._base_addrs["current_duel_phase"] = duel_hook.current_duel_phase
+        self._base_addrs["quest_struct"] = quest_hook.cord_struct
+        self._base_addrs["player_stat_struct"] = player_stat_hook.stat_addr
+        self._base_addrs["current_client"] = client_hook.current_client_addr
+        self._base_addrs[
+            "current_root_window"
+        ] = root_window_hook.current_root_window_addr
+        self._base_addrs[
+            "current_render_context"
+        ] = render_context_hook.current_render_context_addr
+        self._base_addrs["teleport_helper"] = movement_teleport_hook.teleport_helper
+
+        if wait_for_ready:
+            # duel is only written to on battle join and
+            # quest hook is not written if the quest arrow is off
+            await self._wait_for_values(
+                [
+                    self._base_addrs[atter_name]
+                    for atter_name in [
+                        "player_struct",
+                        "player_stat_struct",
+                        "current_client",
+                        "current_root_window",
+                        "current_render_context",
+                    ]
+                ],
+                timeout,
+            )
 
     async def activate_player_hook(
         self, *, wait_for_ready: bool = True, timeout: float = None
@@ -248,6 +500,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["player_struct"]
+        self.pointer_cache.invalidate()
 
     async def read_current_player_base(self) -> int:
         """
@@ -259,7 +512,11 @@ class HookHandler(MemoryReader):
         return await self._read_hook_base_addr("player_struct", "Player")
 
     async def activate_duel_hook(
-        self, *, wait_for_ready: bool = False, timeout: float = None
+        self,
+        *,
+        wait_for_ready: bool = False,
+        timeout: float = None,
+        events: bool = False,
     ):
         """
         Activate duel hook
@@ -267,16 +524,24 @@ class HookHandler(MemoryReader):
         Keyword Args:
             wait_for_ready: Wait for hook values to be written
             timeout: How long to wait for hook values to be written (None for no timeout)
+            events: Also push changes to a ring buffer; see get_hook_event_drainer
         """
         if self._check_if_hook_active(DuelHook):
             raise HookAlreadyActivated("Duel")
 
         await self._check_for_autobot()
 
-        duel_hook = DuelHook(self)
+        if events:
+            duel_hook = DuelEventHook(self)
+
+        else:
+            duel_hook = DuelHook(self)
+
         await duel_hook.hook()
 
         self._active_hooks.append(duel_hook)
+        if events:
+            self._add_hook_event_drainer("Duel", duel_hook)
         self._base_addrs["current_duel"] = duel_hook.current_duel_addr
         self._base_addrs["current_duel_phase"] = duel_hook.current_duel_phase
 
@@ -293,8 +558,11 @@ class HookHandler(MemoryReader):
         hook = self._get_hook_by_type(DuelHook)
         self._active_hooks.remove(hook)
         await hook.unhook()
+        self._remove_hook_event_drainer("Duel")
 
         del self._base_addrs["current_duel"]
+        self._last_duel_base = None
+        self.pointer_cache.invalidate()
 
     async def read_current_duel_base(self) -> int:
         """
@@ -303,7 +571,15 @@ class HookHandler(MemoryReader):
         Returns:
             The current duel base address
         """
-        return await self._read_hook_base_addr("current_duel", "Duel")
+        # the duel is freed when the battle ends so the export is always read
+        duel_base = await self._read_hook_base_addr("current_duel", "Duel", cache=False)
+
+        # pointers cached below the old duel would point into freed memory
+        if duel_base != self._last_duel_base:
+            self._last_duel_base = duel_base
+            self.pointer_cache.invalidate("duel")
+
+        return duel_base
 
     async def read_current_duel_phase(self) -> int:
         """
@@ -317,12 +593,18 @@ class HookHandler(MemoryReader):
             raise HookNotActive("Duel")
 
         try:
-            return await self.read_typed(addr, "unsigned int")
+            duel_phase = await self.read_typed(addr, "unsigned int")
         except pymem.exception.MemoryReadError:
             raise HookNotReady("Duel")
 
+        return duel_phase
+
     async def activate_quest_hook(
-        self, *, wait_for_ready: bool = False, timeout: float = None
+        self,
+        *,
+        wait_for_ready: bool = False,
+        timeout: float = None,
+        events: bool = False,
     ):
         """
         Activate quest hook
@@ -330,16 +612,24 @@ class HookHandler(MemoryReader):
         Keyword Args:
             wait_for_ready: Wait for hook values to be written
             timeout: How long to wait for hook values to be written (None for no timeout)
+            events: Also push changes to a ring buffer; see get_hook_event_drainer
         """
         if self._check_if_hook_active(QuestHook):
             raise HookAlreadyActivated("Quest")
 
         await self._check_for_autobot()
 
-        quest_hook = QuestHook(self)
+        if events:
+            quest_hook = QuestEventHook(self)
+
+        else:
+            quest_hook = QuestHook(self)
+
         await quest_hook.hook()
 
         self._active_hooks.append(quest_hook)
+        if events:
+            self._add_hook_event_drainer("Quest", quest_hook)
         self._base_addrs["quest_struct"] = quest_hook.cord_struct
 
         if wait_for_ready:
@@ -355,8 +645,10 @@ class HookHandler(MemoryReader):
         hook = self._get_hook_by_type(QuestHook)
         self._active_hooks.remove(hook)
         await hook.unhook()
+        self._remove_hook_event_drainer("Quest")
 
         del self._base_addrs["quest_struct"]
+        self.pointer_cache.invalidate()
 
     async def read_current_quest_base(self) -> int:
         """
@@ -365,7 +657,8 @@ class HookHandler(MemoryReader):
         Returns:
             The quest base address
         """
-        return await self._read_hook_base_addr("quest_struct", "Quest")
+        # the quest struct moves whenever the tracked quest changes
+        return await self._read_hook_base_addr("quest_struct", "Quest", cache=False)
 
     async def activate_player_stat_hook(
         self, *, wait_for_ready: bool = True, timeout: float = None
@@ -403,6 +696,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["player_stat_struct"]
+        self.pointer_cache.invalidate()
 
     async def read_current_player_stat_base(self) -> int:
         """
@@ -449,6 +743,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["current_client"]
+        self.pointer_cache.invalidate()
 
     async def read_current_client_base(self) -> int:
         """
@@ -499,6 +794,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["current_root_window"]
+        self.pointer_cache.invalidate()
 
     async def read_current_root_window_base(self) -> int:
         """
@@ -549,6 +845,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["current_render_context"]
+        self.pointer_cache.invalidate()
 
     async def read_current_render_context_base(self) -> int:
         """
@@ -598,6 +895,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["teleport_helper"]
+        self.pointer_cache.invalidate()
 
     async def read_teleport_helper(self) -> int:
         """
@@ -642,6 +940,7 @@ class HookHandler(MemoryReader):
         await hook.unhook()
 
         del self._base_addrs["mouse_position"]
+        self.pointer_cache.invalidate()
 
     # TODO: 2.0 switch this to a helper object like movement teleport and quest
     async def write_mouse_position(self, x: int, y: int):
@@ -0,0 +1,159 @@
+import asyncio
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional
+
+from loguru import logger
+
+from wizwalker.errors import MemoryReadError
+from wizwalker.utils import run_callback
+from .memory_reader import MemoryReader
+
+
+# header: events written so far, last pointer, last payload, padding
+RING_HEADER_SIZE = 32
+# record: sequence (index + 1, 0 while unwritten), pointer, payload, padding
+RING_RECORD_SIZE = 32
+
+_ring_count_struct = struct.Struct("<Q")
+_ring_record_struct = struct.Struct("<QQQ")
+
+
+def ring_size(capacity: int) -> int:
+    """
+    Bytes an event ring with capacity records takes up
+
+    Args:
+        capacity: How many records the ring holds, must be a power of 2
+    """
+    if capacity <= 0 or capacity & (capacity - 1):
+        raise ValueError("capacity must be a power of 2")
+
+    return RING_HEADER_SIZE + capacity * RING_RECORD_SIZE
+
+
+@dataclass
+class HookEvent:
+    # 1 for the first event the hook pushed, 2 for the next, ...
+    sequence: int
+    pointer: int
+    payload: int
+
+
+class HookEventDrainer:
+    """
+    Reads events an EventRingHook pushed to its ring
+
+    The whole ring is read at once, so one read returns every event since the
+    last drain; events the hook pushed over before they were drained are
+    counted in dropped
+
+    Args:
+        reader: The reader to read the ring with
+        ring_address: Address of the ring
+        capacity: How many records the ring holds
+    """
+
+    def __init__(self, reader: MemoryReader, ring_address: int, capacity: int):
+        self.reader = reader
+        self.ring_address = ring_address
+        self.capacity = capacity
+        self.dropped = 0
+
+        self._size = ring_size(capacity)
+        self._next_sequence = 1
+        self._callbacks: List[Callable[[HookEvent], Any]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add_callback(self, callback: Callable[[HookEvent], Any]):
+        """
+        Call a function with each event drained; awaitables it returns are
+        scheduled and errors from either are logged
+
+        Args:
+            callback: The function to call
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[HookEvent], Any]):
+        """
+        Stop calling a function added with add_callback
+
+        Args:
+            callback: The function to stop calling
+        """
+        self._callbacks.remove(callback)
+
+    async def drain(self) -> List[HookEvent]:
+        """
+        Read every event pushed since the last drain and pass them to the callbacks
+
+        Returns:
+            The events in the order they were pushed
+        """
+        data = await self.reader.read_bytes(self.ring_address, self._size)
+        write_count = _ring_count_struct.unpack_from(data)[0]
+
+        # the hook went around the ring before we got to these
+        if (lapped := write_count - self.capacity - (self._next_sequence - 1)) > 0:
+            logger.warning(f"Dropped {lapped} hook events from {hex(self.ring_address)}")
+            self.dropped += lapped
+            self._next_sequence += lapped
+
+        events = []
+        while self._next_sequence <= write_count:
+            slot = (self._next_sequence - 1) & (self.capacity - 1)
+            sequence, pointer, payload = _ring_record_struct.unpack_from(
+                data, RING_HEADER_SIZE + slot * RING_RECORD_SIZE
+            )
+
+            # claimed but not written yet; picked up next drain
+            if sequence < self._next_sequence:
+                break
+
+            # written over while the ring was being read
+            if sequence > self._next_sequence:
+                self.dropped += 1
+
+            else:
+                events.append(HookEvent(sequence, pointer, payload))
+
+            self._next_sequence += 1
+
+        for event in events:
+            for callback in self._callbacks:
+                run_callback(callback, event)
+
+        return events
+
+    def start(self, interval: float = 0.05):
+        """
+        Drain in the background every interval seconds
+
+        Args:
+            interval: Seconds between drains
+        """
+        self.stop()
+        self._task = asyncio.ensure_future(self._run(interval))
+
+    def stop(self):
+        """
+        Stop draining in the background
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self, interval: float):
+        while True:
+            # the ring might not be readable for a moment i.e. while loading
+            try:
+                await self.drain()
+            except MemoryReadError as exc:
+                logger.debug(f"Couldn't drain hook events from {hex(self.ring_address)}: {exc}")
+            # i.e. the client closed
+            except Exception:
+                logger.exception(f"Stopped draining hook events from {hex(self.ring_address)}")
+                raise
+
+            await asyncio.sleep(interval)
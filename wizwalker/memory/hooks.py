@@ -8,6 +8,7 @@ import warnings
 
 from loguru import logger
 
+from .hook_events import RING_HEADER_SIZE, RING_RECORD_SIZE, ring_size
 from .memory_reader import MemoryReader
 from wizwalker.constants import kernel32
 
@@ -22,6 +23,9 @@ def pack_to_int_or_longlong(num: int) -> bytes:
 
 
 class MemoryHook(MemoryReader):
+    # bytes allocated for the hook bytecode
+    hook_size = 50
+
     def __init__(self, hook_handler):
         super().__init__(hook_handler.process)
         self.hook_handler = hook_handler
@@ -81,18 +85,24 @@ class MemoryHook(MemoryReader):
     async def get_pattern(self) -> Tuple[bytes, str]:
         raise NotImplemented()
 
-    async def hook(self):
+    async def resolve_jump_address(self):
         """
-        Writes jump_bytecode to jump address and hook bytecode to hook address
+        Finds the address to write the jump at
         """
         pattern, module = await self.get_pattern()
 
         self.jump_address = await self.get_jump_address(pattern, module=module)
-        self.hook_address = await self.get_hook_address(50)
 
-        logger.debug(f"Got hook address {self.hook_address} in {type(self)}")
         logger.debug(f"Got jump address {self.jump_address} in {type(self)}")
 
+    async def write_hook_body(self):
+        """
+        Writes hook bytecode to hook address; nothing jumps to it until write_jump
+        """
+        self.hook_address = await self.get_hook_address(self.hook_size)
+
+        logger.debug(f"Got hook address {self.hook_address} in {type(self)}")
+
         self.hook_bytecode = await self.get_hook_bytecode()
         self.jump_bytecode = await self.get_jump_bytecode()
 
@@ -110,10 +120,23 @@ class MemoryHook(MemoryReader):
         await self.prehook()
 
         await self.write_bytes(self.hook_address, self.hook_bytecode)
+
+    async def write_jump(self):
+        """
+        Writes jump_bytecode to jump address
+        """
         await self.write_bytes(self.jump_address, self.jump_bytecode)
 
         await self.posthook()
 
+    async def hook(self):
+        """
+        Writes jump_bytecode to jump address and hook bytecode to hook address
+        """
+        await self.resolve_jump_address()
+        await self.write_hook_body()
+        await self.write_jump()
+
     async def unhook(self):
         """
         Deallocates hook memory and rewrites jump addr to it's original code,
@@ -196,6 +219,107 @@ class SimpleHook(AutoBotBaseHook):
                 await self.free(getattr(self, export[0]))
 
 
+class EventRingHook(SimpleHook):
+    """
+    SimpleHook that also pushes a record to a ring buffer each time the
+    values it exports change; read the records with HookEventDrainer
+
+    Subclass with a SimpleHook subclass after this one i.e.
+    class DuelEventHook(EventRingHook, DuelHook); the record's pointer is the
+    first export's value and its payload is event_payload_export's value
+    (or 0 if None)
+    """
+
+    # how many records the ring holds, must be a power of 2
+    capacity = 256
+    event_payload_export = None
+    # 4 or 8
+    event_payload_size = 8
+
+    ring_address = None
+
+    def _ring_push_bytecode(
+        self, pointer_export: int, payload_export: int, ring_address: int
+    ) -> bytes:
+        # fmt: off
+        bytecode = (
+            b"\x9C"  # pushfq
+            b"\x50\x51\x52\x41\x50\x41\x51"  # push rax, rcx, rdx, r8, r9
+            b"\x49\xB8" + struct.pack("<Q", pointer_export) +  # mov r8, pointer_export
+            b"\x49\x8B\x10"  # mov rdx,[r8]
+        )
+
+        if self.event_payload_export is None:
+            bytecode += b"\x45\x31\xC0"  # xor r8d,r8d
+
+        else:
+            bytecode += b"\x49\xB8" + struct.pack("<Q", payload_export)  # mov r8, payload_export
+
+            if self.event_payload_size == 4:
+                bytecode += b"\x45\x8B\x00"  # mov r8d,[r8]
+
+            else:
+                bytecode += b"\x4D\x8B\x00"  # mov r8,[r8]
+
+        push = (
+            b"\x48\x89\x51\x08"  # mov [rcx+8],rdx
+            b"\x4C\x89\x41\x10"  # mov [rcx+10],r8
+            b"\xB8\x01\x00\x00\x00"  # mov eax,1
+            b"\xF0\x48\x0F\xC1\x01"  # lock xadd [rcx],rax
+            b"\x48\xFF\xC0"  # inc rax (sequence)
+            b"\x49\x89\xC1"  # mov r9,rax
+            b"\x49\xFF\xC9"  # dec r9
+            b"\x49\x81\xE1" + struct.pack("<I", self.capacity - 1) +  # and r9,capacity - 1
+            b"\x49\xC1\xE1" + struct.pack("<B", RING_RECORD_SIZE.bit_length() - 1) +  # shl r9,log2(record size)
+            b"\x49\x01\xC9"  # add r9,rcx
+            b"\x49\x83\xC1" + struct.pack("<B", RING_HEADER_SIZE) +  # add r9,header size
+            b"\x49\x89\x51\x08"  # mov [r9+8],rdx
+            b"\x4D\x89\x41\x10"  # mov [r9+10],r8
+            # sequence last so the drainer never sees a half written record
+            b"\x49\x89\x01"  # mov [r9],rax
+        )
+
+        bytecode += (
+            b"\x48\xB9" + struct.pack("<Q", ring_address) +  # mov rcx, ring_address
+            # only push when pointer or payload changed
+            b"\x48\x3B\x51\x08"  # cmp rdx,[rcx+8]
+            b"\x75\x06"  # jne 6 down (to push)
+            b"\x4C\x3B\x41\x10"  # cmp r8,[rcx+10]
+            b"\x74" + struct.pack("<B", len(push)) +  # je over push
+            push +
+            b"\x41\x59\x41\x58\x5A\x59\x58"  # pop r9, r8, rdx, rcx, rax
+            b"\x9D"  # popfq
+        )
+        # fmt: on
+
+        return bytecode
+
+    async def get_hook_address(self, size: int) -> int:
+        return await super().get_hook_address(size + len(self._ring_push_bytecode(0, 0, 0)))
+
+    async def get_hook_bytecode(self) -> bytes:
+        self.ring_address = self.hook_handler.process.allocate(ring_size(self.capacity))
+        return await super().get_hook_bytecode()
+
+    async def bytecode_generator(self, packed_exports):
+        bytecode = await super().bytecode_generator(packed_exports)
+
+        # runs after the original code, right before jumping back
+        pointer_export = getattr(self, self.exports[0][0])
+        payload_export = 0
+        if self.event_payload_export is not None:
+            payload_export = getattr(self, self.event_payload_export)
+
+        return bytecode + self._ring_push_bytecode(
+            pointer_export, payload_export, self.ring_address
+        )
+
+    async def unhook(self):
+        await super().unhook()
+        if self.ring_address:
+            await self.free(self.ring_address)
+
+
 class PlayerHook(SimpleHook):
     pattern = rb"\xF2\x0F\x10\x40\x58\xF2"
     exports = [("player_struct", 8)]
@@ -256,6 +380,12 @@ class QuestHook(SimpleHook):
         return bytecode
 
 
+class QuestEventHook(EventRingHook, QuestHook):
+    """
+    QuestHook that pushes the quest struct address each time it changes
+    """
+
+
 # NOTE: CombatPlanningPhaseWindow::handle
 class DuelHook(SimpleHook):
     pattern = (
@@ -291,6 +421,15 @@ class DuelHook(SimpleHook):
         await self.write_typed(self.current_duel_phase, 7, "unsigned int")
 
 
+class DuelEventHook(EventRingHook, DuelHook):
+    """
+    DuelHook that pushes (duel address, duel phase) each time either changes
+    """
+
+    event_payload_export = "current_duel_phase"
+    event_payload_size = 4
+
+
 class ClientHook(SimpleHook):
     pattern = (
         rb"\x18\x48......\x48\x8B\x7C\x24\x40\x48\x85\xFF\x74\x29\x8B\xC6\xF0\x0F\xC1\x47\x08\x83\xF8\x01\x75\x1D"
@@ -373,6 +512,7 @@ class MovementTeleportHook(SimpleHook):
     noops = 1
     # position vector = 12 + 1 for update bool + 8 for target object address
     exports = [("teleport_helper", 21)]
+    hook_size = 200
 
     _old_jes_bytes = None
     _old_collision_jes_bytes = None
@@ -490,39 +630,6 @@ class MovementTeleportHook(SimpleHook):
 
         return bytecode
 
-    async def hook(self):
-        """
-        Writes jump_bytecode to jump address and hook bytecode to hook address
-        """
-        pattern, module = await self.get_pattern()
-
-        self.jump_address = await self.get_jump_address(pattern, module=module)
-        self.hook_address = await self.get_hook_address(200)
-
-        logger.debug(f"Got hook address {self.hook_address} in {type(self)}")
-        logger.debug(f"Got jump address {self.jump_address} in {type(self)}")
-
-        self.hook_bytecode = await self.get_hook_bytecode()
-        self.jump_bytecode = await self.get_jump_bytecode()
-
-        logger.debug(f"Got hook bytecode {self.hook_bytecode} in {type(self)}")
-        logger.debug(f"Got jump bytecode {self.jump_bytecode} in {type(self)}")
-
-        self.jump_original_bytecode = await self.read_bytes(
-            self.jump_address, len(self.jump_bytecode)
-        )
-
-        logger.debug(
-            f"Got jump original bytecode {self.jump_original_bytecode} in {type(self)}"
-        )
-
-        await self.prehook()
-
-        await self.write_bytes(self.hook_address, self.hook_bytecode)
-        await self.write_bytes(self.jump_address, self.jump_bytecode)
-
-        await self.posthook()
-
     async def unhook(self):
         # with suppress(ExceptionalTimeout):
         #     await maybe_wait_for_value_with_timeout(
@@ -1,8 +1,13 @@
 import regex
 import struct
 from collections import defaultdict
+from typing import Dict, List, Tuple, Type
 
+import pymem.process
+
+from .memory_object import DynamicMemoryObject
 from .memory_reader import MemoryReader
+from .object_factory import dynamic_object_from_address
 from wizwalker import MemoryReadError, PatternFailed
 
 
@@ -23,6 +28,7 @@ class InstanceFinder(MemoryReader):
         self._all_type_name_functions = None
         self._type_name_function_map = None
         self._jmp_functions = None
+        self._jmp_target_map = None
 
     async def read_null_terminated_string(
         self, address: int, max_size: int = 20, encoding: str = "utf-8"
@@ -88,32 +94,94 @@ class InstanceFinder(MemoryReader):
         function_map = await self.get_type_name_function_map()
         return function_map[self.class_name]
 
-    # TODO: add worker tasks with workers kwarg and default of 3
+    @staticmethod
+    def _build_jmp_target_map(
+        regions: List[Tuple[int, bytes]]
+    ) -> Dict[int, List[int]]:
+        jmp_target_map = defaultdict(list)
+
+        for region_address, region_bytes in regions:
+            region_size = len(region_bytes)
+            # one int view per alignment so every rel32 is an index instead of an unpack
+            operand_views = []
+            for alignment in range(4):
+                end = region_size - (region_size - alignment) % 4
+                operand_views.append(memoryview(region_bytes)[alignment:end].cast("i"))
+
+            last_jmp = region_size - 5
+            position = region_bytes.find(b"\xE9")
+            while position != -1 and position <= last_jmp:
+                operand = position + 1
+                offset = operand_views[operand % 4][operand // 4]
+
+                jmp_address = region_address + position
+                jmp_target_map[jmp_address + 5 + offset].append(jmp_address)
+
+                position = region_bytes.find(b"\xE9", position + 1)
+
+        return jmp_target_map
+
+    async def get_jmp_target_map(self) -> Dict[int, List[int]]:
+        """
+        Map every jmp target in the exe to the jmps that go to it
+
+        The module is read once and every 0xE9 in it is decoded as a rel32 jmp
+
+        Returns:
+            A dict of target address to the addresses of jmps to it
+        """
+        if self._jmp_target_map:
+            return self._jmp_target_map
+
+        module_object = pymem.process.module_from_name(
+            self.process.process_handle, self.EXE_NAME
+        )
+
+        if module_object is None:
+            raise ValueError(f"{self.EXE_NAME} module not found.")
+
+        regions = await self.run_in_executor(
+            self._get_scan_regions,
+            self.process.process_handle,
+            module_object.lpBaseOfDll,
+            module_object.lpBaseOfDll + module_object.SizeOfImage,
+        )
+
+        region_bytes = []
+        for region_address, region_size in regions:
+            region_bytes.append(
+                (region_address, await self.read_bytes(region_address, region_size))
+            )
+
+        self._jmp_target_map = await self.run_in_executor(
+            self._build_jmp_target_map, region_bytes
+        )
+        return self._jmp_target_map
+
     async def get_jmp_functions(self):
         if self._jmp_functions:
             return self._jmp_functions
 
-        all_jmps = await self.get_all_jmp_instructions()
-
-        type_name_funcs = await self.get_type_name_functions()
+        jmp_target_map = await self.get_jmp_target_map()
 
         jmp_funcs = []
-        for jmp in all_jmps:
-            # I don't believe there are any cases where they have more than one
-            # per func
-            if len(jmp_funcs) == len(type_name_funcs):
-                break
-
-            offset = await self.read_typed(jmp + 1, "int")
-
-            for poss in type_name_funcs:
-                if (offset + 5) == poss - jmp:
-                    jmp_funcs.append(jmp)
+        for type_name_func in await self.get_type_name_functions():
+            jmp_funcs += jmp_target_map.get(type_name_func, [])
 
         self._jmp_functions = jmp_funcs
         return self._jmp_functions
 
-    async def get_instances(self):
+    async def get_instances(self, *, single_pass: bool = True):
+        """
+        Find instances of this finder's class
+
+        Keyword Args:
+            single_pass: Find every vtable function and then every instance
+                with one multi pointer sweep each instead of a full scan per pointer
+        """
+        if single_pass:
+            return await self._get_instances_single_pass()
+
         instances = []
 
         for jmp_function in await self.get_jmp_functions():
@@ -129,3 +197,52 @@ class InstanceFinder(MemoryReader):
                 instances += vtable_pointers
 
         return instances
+
+    async def get_instance_objects(
+        self,
+        hook_handler,
+        *,
+        default: Type[DynamicMemoryObject] = None,
+        single_pass: bool = True,
+    ) -> List[DynamicMemoryObject]:
+        """
+        Find instances of this finder's class wrapped in their Dynamic* class
+
+        Args:
+            hook_handler: The HookHandler of the client this finder reads
+
+        Keyword Args:
+            default: Class to use if the type isn't registered
+            single_pass: See get_instances
+
+        Raises:
+            ValueError: If the type isn't registered and there is no default
+
+        Returns:
+            The wrapped instances
+        """
+        return [
+            await dynamic_object_from_address(hook_handler, instance, default)
+            for instance in await self.get_instances(single_pass=single_pass)
+        ]
+
+    async def _get_instances_single_pass(self):
+        functions = [
+            *await self.get_jmp_functions(),
+            *await self.get_type_name_functions(),
+        ]
+
+        vtable_function_pointers = await self.scan_for_pointers(functions)
+        vtable_functions = [
+            vtable_function
+            for function in functions
+            for vtable_function in vtable_function_pointers.get(function, [])
+        ]
+
+        vtable_pointers = await self.scan_for_pointers(vtable_functions)
+
+        instances = []
+        for vtable_function in vtable_functions:
+            instances += vtable_pointers.get(vtable_function, [])
+
+        return instances
@@ -0,0 +1,205 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import pymem
+
+from .read_coalescer import merge_read_requests
+
+
+class IOWorker:
+    """
+    Runs one process's reads and writes on a dedicated thread
+
+    Requests made in the same loop iteration are sent to the thread as one
+    batch; writes run in the order they were requested and the reads
+    between them are merged like ReadCoalescer does, so the event loop
+    never waits on the process and clients are read in parallel
+
+    Args:
+        process: The process to read from and write to
+
+    Keyword Args:
+        max_gap: Largest gap between two reads that still merges them
+        max_size: Largest merged read
+    """
+
+    def __init__(
+        self, process: pymem.Pymem, *, max_gap: int = 64, max_size: int = 0x10000
+    ):
+        self.process = process
+        self.max_gap = max_gap
+        self.max_size = max_size
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"wizwalker-io-{process.process_id}"
+        )
+        # (address, size or bytes to write, future)
+        self._pending: List[Tuple[int, object, asyncio.Future]] = []
+        self._flush_scheduled = False
+        self._closed = False
+
+    def close(self):
+        """
+        Stop the worker thread once the queued batches finish; requests that
+        weren't sent to the thread yet fail
+        """
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+        pending = self._pending
+        self._pending = []
+        self._fail(pending, RuntimeError("IO worker was closed"))
+
+    @staticmethod
+    def _fail(batch, exc: Exception):
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    def _queue(self, address: int, request, loop) -> asyncio.Future:
+        if self._closed:
+            raise RuntimeError("IO worker was closed")
+
+        future = loop.create_future()
+        self._pending.append((address, request, future))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop.call_soon(self._flush, loop)
+
+        return future
+
+    async def read(self, address: int, size: int) -> bytes:
+        """
+        Read on the worker thread
+
+        Args:
+            address: The address to read from
+            size: The number of bytes to read
+
+        Raises:
+            pymem.exception.MemoryReadError: If the range couldn't be read
+        """
+        return await self._queue(address, size, asyncio.get_event_loop())
+
+    async def write(self, address: int, value: bytes):
+        """
+        Write on the worker thread
+
+        Args:
+            address: The address to write to
+            value: The bytes to write
+
+        Raises:
+            pymem.exception.MemoryWriteError: If the range couldn't be written
+        """
+        await self._queue(address, bytes(value), asyncio.get_event_loop())
+
+    def _flush(self, loop):
+        batch = self._pending
+        self._pending = []
+        self._flush_scheduled = False
+
+        if self._closed:
+            self._fail(batch, RuntimeError("IO worker was closed"))
+            return
+
+        try:
+            self._executor.submit(self._run_batch, batch, loop)
+        # the executor was shut down under us
+        except RuntimeError as exc:
+            self._fail(batch, exc)
+
+    def _run_batch(self, batch, loop):
+        results = []
+
+        reads = []
+        for request in batch:
+            if isinstance(request[1], int):
+                reads.append(request)
+                continue
+
+            # reads requested before a write have to see the old value
+            results += self._run_reads(reads)
+            reads = []
+
+            address, value, future = request
+            try:
+                self.process.write_bytes(address, value, len(value))
+                results.append((future, None, None))
+            # anything raised here has to reach the waiting task
+            except Exception as exc:
+                results.append((future, None, exc))
+
+        results += self._run_reads(reads)
+
+        loop.call_soon_threadsafe(self._resolve, results)
+
+    def _run_reads(self, reads) -> list:
+        results = []
+
+        for start, end, requests in merge_read_requests(reads, self.max_gap, self.max_size):
+            try:
+                data = self.process.read_bytes(start, end - start)
+            except Exception:
+                # one of the ranges or a gap isn't readable, read them alone
+                for address, size, future in requests:
+                    try:
+                        results.append((future, self.process.read_bytes(address, size), None))
+                    except Exception as exc:
+                        results.append((future, None, exc))
+
+                continue
+
+            for address, size, future in requests:
+                results.append(
+                    (future, data[address - start:address - start + size], None)
+                )
+
+        return results
+
+    @staticmethod
+    def _resolve(results):
+        for future, result, exc in results:
+            # the waiting task could have been cancelled
+            if future.done():
+                continue
+
+            if exc is not None:
+                future.set_exception(exc)
+
+            else:
+                future.set_result(result)
+
+
+# process id -> worker the process's reads and writes run on
+_io_workers: Dict[int, IOWorker] = {}
+
+
+def get_io_worker(process_id: int) -> Optional[IOWorker]:
+    """
+    Get the worker used for a process
+
+    Args:
+        process_id: Id of the process
+
+    Returns:
+        The worker or None if reads and writes run on the event loop
+    """
+    return _io_workers.get(process_id)
+
+
+def set_io_worker(process_id: int, worker: Optional[IOWorker]):
+    """
+    Set or remove the worker used for a process; a replaced worker is closed
+
+    Args:
+        process_id: Id of the process
+        worker: The worker or None to read and write on the event loop
+    """
+    if (old_worker := _io_workers.pop(process_id, None)) is not None:
+        old_worker.close()
+
+    if worker is not None:
+        _io_workers[process_id] = worker
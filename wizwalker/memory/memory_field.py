@@ -0,0 +1,98 @@
+import struct
+from types import MethodType
+from typing import Any
+
+from wizwalker.constants import type_format_dict
+
+
+class MemoryField:
+    """
+    A typed value at a fixed offset of a MemoryObject
+
+    Accessing the field on an instance returns an async accessor, so
+    declaring `base_mana = MemoryField(84, "int")` keeps `await stats.base_mana()`
+    working while letting the class know its whole layout
+
+    Args:
+        offset: Offset of the value from the object's base address
+        data_type: The type of the value (defined in constants)
+    """
+
+    def __init__(self, offset: int, data_type: str):
+        type_format = type_format_dict.get(data_type)
+        if type_format is None:
+            raise ValueError(f"{data_type} is not a valid data type")
+
+        self.offset = offset
+        self.data_type = data_type
+        self.name = None
+
+        self._struct = struct.Struct(type_format)
+        self._reader = None
+        self._writer = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+        field = self
+
+        async def reader(instance) -> Any:
+            base_address = await instance.read_base_address()
+            data = await instance.read_bytes(
+                base_address + field.offset, field._struct.size
+            )
+            return field._struct.unpack(data)[0]
+
+        async def writer(instance, value: Any):
+            base_address = await instance.read_base_address()
+            await instance.write_bytes(
+                base_address + field.offset, field._struct.pack(value)
+            )
+
+        reader.__name__ = name
+        reader.__qualname__ = f"{owner.__qualname__}.{name}"
+        writer.__name__ = f"write_{name}"
+        writer.__qualname__ = f"{owner.__qualname__}.write_{name}"
+
+        self._reader = reader
+        self._writer = writer
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return MethodType(self._reader, instance)
+
+    def __repr__(self):
+        return f"<MemoryField {self.name} {self.offset=} {self.data_type=}>"
+
+    def writer(self) -> "MemoryFieldWriter":
+        """
+        Get a descriptor that writes this field
+
+        Examples:
+            .. code-block:: py
+
+                class GameStats(PropertyClass):
+                    base_mana = MemoryField(84, "int")
+                    write_base_mana = base_mana.writer()
+        """
+        return MemoryFieldWriter(self)
+
+
+class MemoryFieldWriter:
+    """
+    Async writer for a MemoryField; see MemoryField.writer
+    """
+
+    def __init__(self, field: MemoryField):
+        self.field = field
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return MethodType(self.field._writer, instance)
+
+    def __repr__(self):
+        return f"<MemoryFieldWriter {self.field.name}>"
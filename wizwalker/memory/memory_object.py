@@ -1,6 +1,8 @@
+import asyncio
 import struct
 from enum import Enum
-from typing import Any, List, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from wizwalker.constants import type_format_dict
 from wizwalker.errors import (
@@ -12,11 +14,92 @@ from wizwalker.errors import (
 )
 from wizwalker.utils import XYZ
 from .handler import HookHandler
+from .memory_field import MemoryField
 from .memory_reader import MemoryReader
+from .string_cache import get_string_cache
+from .type_name_cache import get_type_name_cache
 
 
 MAX_STRING = 5_000
 
+# next node pointer, previous node pointer, then the shared pointer's address
+_shared_list_node_struct = struct.Struct("<q8xq")
+# buffer or pointer to it, then the length
+_string_header_struct = struct.Struct("<q8xi")
+# buffer, length and capacity
+STRING_HEADER_SIZE = 32
+# left, parent, right, color, is nil, padding, key, mapped value
+_std_map_node_struct = struct.Struct("<QQQ??6xQQ")
+
+
+class StructLayout:
+    """
+    Precompiled layout for decoding several typed fields out of one buffer
+
+    Args:
+        fields: (offset, data_type) pairs; data types are defined in constants
+    """
+
+    def __init__(self, fields: Sequence[Tuple[int, str]]):
+        if not fields:
+            raise ValueError("A layout needs at least one field")
+
+        # fields are packed in offset order but returned in the order they were given
+        order = sorted(range(len(fields)), key=lambda idx: fields[idx][0])
+
+        self.start = fields[order[0]][0]
+
+        format_string = "<"
+        position = self.start
+        for idx in order:
+            offset, data_type = fields[idx]
+
+            type_format = type_format_dict.get(data_type)
+            if type_format is None:
+                raise ValueError(f"{data_type} is not a valid data type")
+
+            if offset < position:
+                raise ValueError(f"Field at offset {offset} overlaps the previous field")
+
+            # pad bytes to skip over anything between fields
+            if offset > position:
+                format_string += f"{offset - position}x"
+
+            type_str = type_format.replace("<", "")
+            format_string += type_str
+            position = offset + struct.calcsize("<" + type_str)
+
+        self.size = position - self.start
+        self._struct = struct.Struct(format_string)
+        self._order = order
+
+    def unpack(self, data: bytes) -> tuple:
+        """
+        Decode the fields from a buffer starting at the first field's offset
+
+        Args:
+            data: The bytes to decode
+
+        Returns:
+            The values in the order the fields were given
+        """
+        values = [None] * len(self._order)
+        for idx, value in zip(self._order, self._struct.unpack_from(data)):
+            values[idx] = value
+
+        return tuple(values)
+
+
+@lru_cache(maxsize=None)
+def get_struct_layout(fields: Tuple[Tuple[int, str], ...]) -> StructLayout:
+    """
+    Get the cached StructLayout for some fields
+
+    Args:
+        fields: Tuple of (offset, data_type) pairs
+    """
+    return StructLayout(fields)
+
 
 # TODO: add .find_instances that find instances of whichever class used it
 class MemoryObject(MemoryReader):
@@ -24,11 +107,77 @@ class MemoryObject(MemoryReader):
     Class for any represented classes from memory
     """
 
+    __slots__ = ("hook_handler",)
+
+    # name -> MemoryField for every field declared on the class or its bases
+    _memory_fields: Dict[str, MemoryField] = {}
+    _memory_fields_layout: StructLayout = None
+
     def __init__(self, hook_handler: HookHandler):
         super().__init__(hook_handler.process)
         self.hook_handler = hook_handler
 
-        self._offset_lookup_cache = {}
+    @property
+    def _offset_lookup_cache(self) -> Dict[str, int]:
+        # offsets only depend on the exe so they're kept once per client
+        return self.hook_handler.offset_lookup_cache
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        fields = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, MemoryField):
+                    fields[name] = value
+
+                # a subclass can replace a field with a method
+                elif name in fields:
+                    del fields[name]
+
+        cls._memory_fields = fields
+
+        if fields:
+            cls._memory_fields_layout = get_struct_layout(
+                tuple((field.offset, field.data_type) for field in fields.values())
+            )
+        else:
+            cls._memory_fields_layout = None
+
+    async def read_fields(self, *names: str) -> Dict[str, Any]:
+        """
+        Read some of this object's declared fields with a single memory read
+
+        Args:
+            names: Names of the fields to read
+
+        Returns:
+            Mapping of field names to their values
+        """
+        try:
+            fields = [self._memory_fields[name] for name in names]
+        except KeyError as exc:
+            raise ValueError(f"{type(self).__name__} has no field {exc.args[0]}")
+
+        values = await self.read_values_from_offsets(
+            tuple((field.offset, field.data_type) for field in fields)
+        )
+        return dict(zip(names, values))
+
+    async def read_all_fields(self) -> Dict[str, Any]:
+        """
+        Read every declared field of this object with a single memory read
+
+        Returns:
+            Mapping of field names to their values
+        """
+        layout = self._memory_fields_layout
+        if layout is None:
+            return {}
+
+        base_address = await self.read_base_address()
+        data = await self.read_bytes(base_address + layout.start, layout.size)
+        return dict(zip(self._memory_fields.keys(), layout.unpack(data)))
 
     async def read_base_address(self) -> int:
         raise NotImplementedError()
@@ -41,6 +190,69 @@ class MemoryObject(MemoryReader):
         base_address = await self.read_base_address()
         await self.write_typed(base_address + offset, value, data_type)
 
+    async def read_pointer_from_offset(self, offset: int, *, cache_tag: str = "zone") -> int:
+        """
+        Read a pointer through the hook handler's pointer cache
+
+        Args:
+            offset: Offset of the pointer
+            cache_tag: Group the cached pointer is invalidated with
+
+        Returns:
+            The pointer's value
+        """
+        base_address = await self.read_base_address()
+
+        pointer_cache = self.hook_handler.pointer_cache
+        key = (base_address, offset)
+
+        if (cached := pointer_cache.get(key)) is not None:
+            return cached
+
+        addr = await self.read_typed(base_address + offset, "long long")
+
+        if addr != 0:
+            pointer_cache.set(key, addr, cache_tag)
+
+        return addr
+
+    async def read_values_from_offsets(self, fields: Sequence[Tuple[int, str]]) -> tuple:
+        """
+        Read several typed values with a single memory read
+
+        Args:
+            fields: (offset, data_type) pairs to read
+
+        Returns:
+            The values in the order the fields were given
+        """
+        layout = get_struct_layout(tuple((offset, data_type) for offset, data_type in fields))
+
+        base_address = await self.read_base_address()
+        data = await self.read_bytes(base_address + layout.start, layout.size)
+        return layout.unpack(data)
+
+    async def read_snapshot(self, fields: Dict[str, Tuple[int, str]]) -> Dict[str, Any]:
+        """
+        Read several named values with a single memory read
+
+        Examples:
+            .. code-block:: py
+
+                snapshot = await stats.read_snapshot({
+                    "base_hitpoints": (80, "int"),
+                    "current_hitpoints": (108, "int"),
+                })
+
+        Args:
+            fields: Mapping of names to (offset, data_type) pairs
+
+        Returns:
+            Mapping of the same names to the values read
+        """
+        values = await self.read_values_from_offsets(tuple(fields.values()))
+        return dict(zip(fields.keys(), values))
+
     async def pattern_scan_offset(
             self,
             pattern: bytes,
@@ -85,25 +297,158 @@ class MemoryObject(MemoryReader):
         string_bytes = search_bytes[:string_end]
         return string_bytes.decode(encoding)
 
-    async def read_wide_string(self, address: int, encoding: str = "utf-16") -> str:
-        string_len = await self.read_typed(address + 16, "int")
-        if string_len == 0:
-            return ""
+    @staticmethod
+    def _string_data_location(
+        address: int, header: bytes, wide: bool
+    ) -> Tuple[Optional[int], int]:
+        # (address of the characters or None if the string is empty, size in bytes)
+        string_address, string_len = _string_header_struct.unpack_from(header)
 
-        # wide chars take 2 bytes
-        string_len *= 2
+        if wide:
+            if string_len <= 0:
+                return None, 0
 
-        # wide strings larger than 8 bytes are pointers
-        if string_len >= 8:
-            string_address = await self.read_typed(address, "long long")
-        else:
-            string_address = address
+            # wide chars take 2 bytes
+            string_len *= 2
 
+            # wide strings larger than 8 bytes are pointers
+            if string_len >= 8:
+                return string_address, string_len
+
+            return address, string_len
+
+        if not 1 <= string_len <= MAX_STRING:
+            return None, 0
+
+        # strings larger than 16 bytes are pointers
+        if string_len >= 16:
+            return string_address, string_len
+
+        return address, string_len
+
+    @staticmethod
+    def _decode_string(string_bytes: bytes, encoding: str) -> str:
         try:
-            return (await self.read_bytes(string_address, string_len)).decode(encoding)
+            return string_bytes.decode(encoding)
         except UnicodeDecodeError:
             return ""
 
+    async def _read_heap_strings(
+        self, locations: List[Tuple[int, int]], encoding: str
+    ) -> List[str]:
+        string_cache = get_string_cache()
+
+        if not string_cache.enabled:
+            heap_data = await asyncio.gather(
+                *(self.read_bytes(address, size) for address, size in locations)
+            )
+            return [self._decode_string(data, encoding) for data in heap_data]
+
+        # only the start of each buffer is read to find cached strings
+        prefixes = await asyncio.gather(
+            *(
+                self.read_bytes(address, min(size, string_cache.check_size))
+                for address, size in locations
+            )
+        )
+
+        process_id = self.process.process_id
+        keys = []
+        entries = []
+        for (address, size), prefix in zip(locations, prefixes):
+            key = string_cache.make_key(process_id, address, size, encoding, prefix)
+            keys.append(key)
+            entries.append(string_cache.get(key))
+
+        async def _read_full(index: int) -> bytes:
+            address, size = locations[index]
+
+            if size <= string_cache.check_size:
+                return prefixes[index]
+
+            return await self.read_bytes(address, size)
+
+        full_indexes = [
+            index
+            for index, entry in enumerate(entries)
+            if entry is None or string_cache.verify
+        ]
+        full_data = dict(
+            zip(
+                full_indexes,
+                await asyncio.gather(*(_read_full(index) for index in full_indexes)),
+            )
+        )
+
+        strings = []
+        for index, entry in enumerate(entries):
+            data = full_data.get(index)
+
+            if entry is not None and (data is None or data == entry[0]):
+                strings.append(entry[1])
+                continue
+
+            string = self._decode_string(data, encoding)
+            if string:
+                string_cache.set(keys[index], data, string)
+
+            strings.append(string)
+
+        return strings
+
+    async def _read_strings(
+        self, addresses: Sequence[int], encoding: str, wide: bool
+    ) -> List[str]:
+        # every header then every heap buffer, so the reads can be merged
+        headers = await asyncio.gather(
+            *(self.read_bytes(address, STRING_HEADER_SIZE) for address in addresses)
+        )
+        locations = [
+            self._string_data_location(address, header, wide)
+            for address, header in zip(addresses, headers)
+        ]
+
+        heap_locations = [
+            (string_address, string_len)
+            for address, (string_address, string_len) in zip(addresses, locations)
+            if string_address is not None and string_address != address
+        ]
+        heap_strings = iter(await self._read_heap_strings(heap_locations, encoding))
+
+        strings = []
+        for address, header, (string_address, string_len) in zip(
+            addresses, headers, locations
+        ):
+            if string_address is None:
+                strings.append("")
+
+            # short strings are stored in the header itself
+            elif string_address == address:
+                strings.append(self._decode_string(header[:string_len], encoding))
+
+            else:
+                strings.append(next(heap_strings))
+
+        return strings
+
+    async def read_wide_string(self, address: int, encoding: str = "utf-16") -> str:
+        return (await self._read_strings((address,), encoding, True))[0]
+
+    async def read_wide_strings(
+        self, addresses: Sequence[int], encoding: str = "utf-16"
+    ) -> List[str]:
+        """
+        Read many wide strings; see read_strings
+
+        Args:
+            addresses: Addresses of the strings
+            encoding: Encoding of the strings
+
+        Returns:
+            The strings in the same order as the addresses
+        """
+        return await self._read_strings(addresses, encoding, True)
+
     async def read_wide_string_from_offset(
         self, offset: int, encoding: str = "utf-16"
     ) -> str:
@@ -148,21 +493,23 @@ class MemoryObject(MemoryReader):
         await self.write_wide_string(base_address + offset, string, encoding)
 
     async def read_string(self, address: int, encoding: str = "utf-8") -> str:
-        string_len = await self.read_typed(address + 16, "int")
+        return (await self._read_strings((address,), encoding, False))[0]
 
-        if not 1 <= string_len <= MAX_STRING:
-            return ""
+    async def read_strings(
+        self, addresses: Sequence[int], encoding: str = "utf-8"
+    ) -> List[str]:
+        """
+        Read many strings; all the headers are read concurrently and then
+        the buffers of every string too long to be stored inline
 
-        # strings larger than 16 bytes are pointers
-        if string_len >= 16:
-            string_address = await self.read_typed(address, "long long")
-        else:
-            string_address = address
+        Args:
+            addresses: Addresses of the strings
+            encoding: Encoding of the strings
 
-        try:
-            return (await self.read_bytes(string_address, string_len)).decode(encoding)
-        except UnicodeDecodeError:
-            return ""
+        Returns:
+            The strings in the same order as the addresses
+        """
+        return await self._read_strings(addresses, encoding, False)
 
     async def read_string_from_offset(
         self, offset: int, encoding: str = "utf-8"
@@ -248,10 +595,12 @@ class MemoryObject(MemoryReader):
     async def read_shared_vector(
         self, offset: int, *, max_size: int = 1000
     ) -> List[int]:
-        start_address = await self.read_value_from_offset(offset, "long long")
-        end_address = await self.read_value_from_offset(offset + 8, "long long")
+        start_address, end_address = await self.read_values_from_offsets(
+            ((offset, "long long"), (offset + 8, "long long"))
+        )
         size = end_address - start_address
 
+        # Shared pointers are 16 in length
         element_number = size // 16
 
         if size == 0:
@@ -265,50 +614,40 @@ class MemoryObject(MemoryReader):
             raise ValueError(f"Size was {element_number} and the max was {max_size}")
 
         try:
-            shared_pointers_data = await self.read_bytes(start_address, size)
+            shared_pointers_data = await self.read_bytes(start_address, element_number * 16)
         except (ValueError, AddressOutOfRange, MemoryError):
             return []
 
-        pointers = []
-        data_pos = 0
-        # Shared pointers are 16 in length
-        for _ in range(element_number):
-            # fmt: off
-            shared_pointer_data = shared_pointers_data[data_pos: data_pos + 16]
-            # fmt: on
-
-            # first 8 bytes are the address
-            pointers.append(struct.unpack("<q", shared_pointer_data[:8])[0])
-
-            data_pos += 16
-
-        return pointers
+        # first 8 bytes of each shared pointer are the address
+        return memoryview(shared_pointers_data).cast("q")[::2].tolist()
 
     async def read_dynamic_vector(
-        self, offset: int, data_type: str = "long long"
+        self, offset: int, data_type: str = "long long", *, max_size: int = 1000
     ) -> List[int]:
         """
         Read a vector that changes in size
+
+        Raises:
+            ValueError: If the vector has more than max_size elements
         """
-        start_address = await self.read_value_from_offset(offset, "long long")
-        end_address = await self.read_value_from_offset(offset + 8, "long long")
+        start_address, end_address = await self.read_values_from_offsets(
+            ((offset, "long long"), (offset + 8, "long long"))
+        )
 
         type_str = type_format_dict[data_type].replace("<", "")
         size_per_type = struct.calcsize(type_str)
 
         size = (end_address - start_address) // size_per_type
 
-        if size == 0:
+        # dealloc
+        if size <= 0:
             return []
 
-        current_address = start_address
-        pointers = []
-        for _ in range(size):
-            pointers.append(await self.read_typed(current_address, data_type))
+        if size > max_size:
+            raise ValueError(f"Size was {size} and the max was {max_size}")
 
-            current_address += size_per_type
-
-        return pointers
+        vector_data = await self.read_bytes(start_address, size * size_per_type)
+        return list(struct.unpack(f"<{size}{type_str}", vector_data))
 
     async def read_inlined_vector(
             self,
@@ -324,35 +663,49 @@ class MemoryObject(MemoryReader):
         current_addr = start
 
         res = []
-        for _ in total_size:
+        for _ in range(total_size):
             res.append(object_type(self.hook_handler, current_addr))
             current_addr += object_size
 
         return res
 
-    async def read_shared_linked_list(self, offset: int):
-        list_addr = await self.read_value_from_offset(offset, "long long")
+    async def read_shared_linked_list(self, offset: int, *, max_size: int = 1000) -> List[int]:
+        list_addr, list_size = await self.read_values_from_offsets(
+            ((offset, "long long"), (offset + 8, "int"))
+        )
+
+        if list_size < 1:
+            return []
+
+        if list_size > max_size:
+            raise ValueError(f"Size was {list_size} and the max was {max_size}")
 
         addrs = []
         # TODO: ensure this is always the case
         # skip first node
         next_node_addr = await self.read_typed(list_addr, "long long")
-        list_size = await self.read_value_from_offset(offset + 8, "int")
 
-        for i in range(list_size):
-            addr = await self.read_typed(next_node_addr + 16, "long long")
+        for _ in range(list_size):
+            # next pointer and the shared pointer's address in one read
+            next_node, addr = _shared_list_node_struct.unpack(
+                await self.read_bytes(next_node_addr, _shared_list_node_struct.size)
+            )
             addrs.append(addr)
-            next_node_addr = await self.read_typed(next_node_addr, "long long")
+            next_node_addr = next_node
 
         return addrs
 
-    async def read_linked_list(self, offset: int) -> List[int]:
-        list_addr = await self.read_value_from_offset(offset, "long long")
-        list_size = await self.read_value_from_offset(offset + 8, "int")
+    async def read_linked_list(self, offset: int, *, max_size: int = 1000) -> List[int]:
+        list_addr, list_size = await self.read_values_from_offsets(
+            ((offset, "long long"), (offset + 8, "int"))
+        )
 
         if list_size < 1:
             return []
 
+        if list_size > max_size:
+            raise ValueError(f"Size was {list_size} and the max was {max_size}")
+
         addrs = []
         list_node = await self.read_typed(list_addr, "long long")
         # object starts +16 from node
@@ -364,37 +717,69 @@ class MemoryObject(MemoryReader):
 
         return addrs
 
-    async def _get_std_map_children(self, node, mapped_type, mapped_return):
-        # some keys may be smaller but the entire 8 bytes seemed to always be reserved
-        key = await self.read_typed(node + 0x20, "unsigned long long")
-        mapped_data = await self.read_typed(node + 0x28, "unsigned long long")
-
-        mapped_return[key] = mapped_type(self.hook_handler, mapped_data)
-
-        is_leaf = await self.read_typed(node + 0x19, "bool")
-        if not is_leaf:
-            if left_node := await self.read_typed(node, "unsigned long long"):
-                await self._get_std_map_children(left_node, mapped_return)
-
-            if right_node := await self.read_typed(node + 0x10, "unsigned long long"):
-                await self._get_std_map_children(right_node, mapped_return)
-
     # TODO: 2.0 replace this with complex memory read type
     #  class StdMap(MemoryComplex):
     #      # impl method to read here
     #      ...
     #  read_complex_from_offset(0x80, StdMap)
-    async def read_std_map(self, offset: int, mapped_type: Type["MemoryObject"]) -> dict:
+    async def read_std_map(
+        self,
+        offset: int,
+        mapped_type: Type["MemoryObject"],
+        *,
+        max_size: int = 10_000,
+    ) -> dict:
+        head, map_size = await self.read_values_from_offsets(
+            ((offset, "unsigned long long"), (offset + 8, "unsigned long long"))
+        )
+
+        if map_size == 0:
+            return {}
+
+        if map_size > max_size:
+            raise ValueError(f"Size was {map_size} and the max was {max_size}")
+
+        root = await self.read_typed(head + 0x8, "unsigned long long")
+
         mapped_return = {}
+        seen = {head}
+        # walk the tree a level at a time reading every node of a level together
+        level = [root]
+        while level:
+            node_headers = await asyncio.gather(
+                *(self.read_bytes(node, _std_map_node_struct.size) for node in level)
+            )
+
+            next_level = []
+            for node_header in node_headers:
+                left, _, right, _, is_nil, key, mapped_data = _std_map_node_struct.unpack(
+                    node_header
+                )
 
-        root = await self.read_value_from_offset(offset, "unsigned long long")
-        first_node = await self.read_typed(root + 0x8, "unsigned long long")
+                # leaves point back to the head node which is the only nil node
+                if is_nil:
+                    continue
+
+                # some keys may be smaller but the entire 8 bytes seemed to always be reserved
+                mapped_return[key] = mapped_type(self.hook_handler, mapped_data)
+
+                for child in (left, right):
+                    if child and child not in seen:
+                        seen.add(child)
+                        next_level.append(child)
+
+            # a corrupted tree could otherwise be walked forever
+            if len(mapped_return) > map_size:
+                raise ValueError(f"Read more than {map_size} nodes from std map")
+
+            level = next_level
 
-        await self._get_std_map_children(first_node, mapped_type, mapped_return)
         return mapped_return
 
 
 class DynamicMemoryObject(MemoryObject):
+    __slots__ = ("base_address",)
+
     def __init__(self, hook_handler: HookHandler, base_address: int):
         super().__init__(hook_handler)
 
@@ -412,8 +797,24 @@ class DynamicMemoryObject(MemoryObject):
     def __repr__(self):
         return f"<{type(self).__name__} {self.base_address=}>"
 
+    # wrappers of the same object are interchangeable; this lets them be
+    # used as set members and cache keys
+    def __eq__(self, other):
+        if not isinstance(other, DynamicMemoryObject):
+            return NotImplemented
+
+        return (
+            self.base_address == other.base_address
+            and self.hook_handler is other.hook_handler
+        )
+
+    def __hash__(self):
+        return hash((id(self.hook_handler), self.base_address))
+
 
 class PropertyClass(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -425,6 +826,23 @@ class PropertyClass(MemoryObject):
 
     async def read_type_name(self) -> str:
         vtable = await self.read_value_from_offset(0, "long long")
+
+        # vtables are keyed relative to the exe so clients of a build share them
+        exe_module = await self.hook_handler.get_exe_module()
+        cache_key = (
+            await self.hook_handler.get_exe_module_key(),
+            vtable - exe_module.lpBaseOfDll,
+        )
+
+        type_name_cache = get_type_name_cache()
+        if (type_name := type_name_cache.get(cache_key)) is not None:
+            return type_name
+
+        type_name = await self._read_type_name_from_vtable(vtable)
+        type_name_cache.set(cache_key, type_name)
+        return type_name
+
+    async def _read_type_name_from_vtable(self, vtable: int) -> str:
         # first function
         get_class_name = await self.read_typed(vtable, "long long")
         # sometimes is a function with a jmp, sometimes just a body pointer
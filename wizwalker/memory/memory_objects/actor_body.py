@@ -10,6 +10,8 @@ class ActorBody(PropertyClass):
     Base class for ActorBody
     """
 
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -164,4 +166,6 @@ class DynamicActorBody(DynamicMemoryObject, ActorBody):
     Dynamic actor body that can take an address
     """
 
+    __slots__ = ()
+
     pass
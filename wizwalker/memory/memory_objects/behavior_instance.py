@@ -9,6 +9,8 @@ class BehaviorInstance(PropertyClass):
     Base class for behavior instances
     """
 
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -51,4 +53,6 @@ class DynamicBehaviorInstance(DynamicMemoryObject, BehaviorInstance):
     Dynamic behavior instance that can be given an address
     """
 
+    __slots__ = ()
+
     pass
@@ -6,6 +6,8 @@ class BehaviorTemplate(PropertyClass):
     Base class for behavior templates
     """
 
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -30,4 +32,6 @@ class DynamicBehaviorTemplate(DynamicMemoryObject, BehaviorTemplate):
     Dynamic behavior template that can be given an address
     """
 
+    __slots__ = ()
+
     pass
@@ -7,6 +7,8 @@ from .client_object import DynamicClientObject, ClientObject
 
 
 class CameraController(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -38,11 +40,15 @@ class CameraController(MemoryObject):
 
 
 class FreeCameraController(CameraController):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
 
 class ElasticCameraController(CameraController):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -98,12 +104,12 @@ class ElasticCameraController(CameraController):
 
 
 class DynamicCameraController(DynamicMemoryObject, CameraController):
-    pass
+    __slots__ = ()
 
 
 class DynamicFreeCameraController(DynamicMemoryObject, FreeCameraController):
-    pass
+    __slots__ = ()
 
 
 class DynamicElasticCameraController(DynamicMemoryObject, ElasticCameraController):
-    pass
+    __slots__ = ()
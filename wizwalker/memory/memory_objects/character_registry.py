@@ -4,6 +4,8 @@ from wizwalker.memory.memory_object import PropertyClass, DynamicMemoryObject
 
 
 class CharacterRegistry(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -32,4 +34,4 @@ class CharacterRegistry(PropertyClass):
 
 
 class DynamicCharacterRegistry(DynamicMemoryObject, CharacterRegistry):
-    pass
+    __slots__ = ()
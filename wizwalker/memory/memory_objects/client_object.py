@@ -14,6 +14,8 @@ class ClientObject(PropertyClass):
     Base class for ClientObjects
     """
 
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -107,7 +109,7 @@ class ClientObject(PropertyClass):
         Returns:
             DynamicClientZone
         """
-        addr = await self.read_value_from_offset(304, "long long")
+        addr = await self.read_pointer_from_offset(304)
 
         if addr == 0:
             return None
@@ -122,7 +124,7 @@ class ClientObject(PropertyClass):
         Returns:
             DynamicWizGameObjectTemplate
         """
-        addr = await self.read_value_from_offset(88, "long long")
+        addr = await self.read_pointer_from_offset(88)
 
         if addr == 0:
             return None
@@ -349,4 +351,6 @@ class DynamicClientObject(DynamicMemoryObject, ClientObject):
     Dynamic client object that can take an address
     """
 
+    __slots__ = ()
+
     pass
@@ -6,6 +6,8 @@ class ClientZone(PropertyClass):
     Base class for ClientZones
     """
 
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -45,4 +47,6 @@ class DynamicClientZone(DynamicMemoryObject, ClientZone):
     Dynamic client zone that can take an address
     """
 
+    __slots__ = ()
+
     pass
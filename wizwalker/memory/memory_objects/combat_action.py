@@ -6,6 +6,8 @@ from .spell import DynamicSpell
 
 # TODO: document
 class CombatAction(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -184,4 +186,4 @@ class CombatAction(MemoryObject):
 
 
 class DynamicCombatAction(DynamicMemoryObject, CombatAction):
-    pass
+    __slots__ = ()
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from wizwalker.memory.memory_field import MemoryField
 from wizwalker.memory.memory_object import DynamicMemoryObject, PropertyClass
 from .enums import PipAquiredByEnum
 from .game_stats import DynamicGameStats
@@ -13,236 +14,185 @@ class CombatParticipant(PropertyClass):
     Base class for CombatParticipants
     """
 
+    __slots__ = ()
+
     def read_base_address(self) -> int:
         raise NotImplementedError()
 
-    async def owner_id_full(self) -> int:
-        """
-        This combat participant's owner id
-        """
-        return await self.read_value_from_offset(112, "unsigned long long")
-
-    async def write_owner_id_full(self, owner_id_full: int):
-        """
-        Write this combat participant's owner id
-
-        Args:
-            owner_id_full: The owner id to write
-        """
-        await self.write_value_to_offset(112, owner_id_full, "unsigned long long")
-
-    async def template_id_full(self) -> int:
-        """
-        This combat participant's template id
-        """
-        return await self.read_value_from_offset(120, "unsigned long long")
-
-    async def write_template_id_full(self, template_id_full: int):
-        """
-        Write this combat participant's template id
-
-        Args:
-            template_id_full: The template id to write
-        """
-        await self.write_value_to_offset(120, template_id_full, "unsigned long long")
-
-    async def is_player(self) -> bool:
-        """
-        If this combat participant is a player
-        """
-        return await self.read_value_from_offset(128, "bool")
-
-    async def write_is_player(self, is_player: bool):
-        """
-        Write if this combat participant is a player
-
-        Args:
-            is_player: The bool to write
-        """
-        await self.write_value_to_offset(128, is_player, "bool")
-
-    async def zone_id_full(self) -> int:
-        """
-        This combat participant's zone id
-        """
-        return await self.read_value_from_offset(136, "unsigned long long")
-
-    async def write_zone_id_full(self, zone_id_full: int):
-        """
-        Write this combat participant's zone id
-
-        Args:
-            zone_id_full: The zone id to write
-        """
-        await self.write_value_to_offset(136, zone_id_full, "unsigned long long")
+    owner_id_full = MemoryField(112, "unsigned long long")
+    """
+    This combat participant's owner id
+    """
+
+    write_owner_id_full = owner_id_full.writer()
+    """
+    Write this combat participant's owner id
+
+    Args:
+        owner_id_full: The owner id to write
+    """
+
+    template_id_full = MemoryField(120, "unsigned long long")
+    """
+    This combat participant's template id
+    """
+
+    write_template_id_full = template_id_full.writer()
+    """
+    Write this combat participant's template id
+
+    Args:
+        template_id_full: The template id to write
+    """
+
+    is_player = MemoryField(128, "bool")
+    """
+    If this combat participant is a player
+    """
+
+    write_is_player = is_player.writer()
+    """
+    Write if this combat participant is a player
+
+    Args:
+        is_player: The bool to write
+    """
+
+    zone_id_full = MemoryField(136, "unsigned long long")
+    """
+    This combat participant's zone id
+    """
+
+    write_zone_id_full = zone_id_full.writer()
+    """
+    Write this combat participant's zone id
+
+    Args:
+        zone_id_full: The zone id to write
+    """
 
     # TODO: look into what a team id is; i.e is it always the two ids
-    async def team_id(self) -> int:
-        """
-        This combat participant's team id
-        """
-        return await self.read_value_from_offset(144, "int")
+    team_id = MemoryField(144, "int")
+    """
+    This combat participant's team id
+    """
 
-    async def write_team_id(self, team_id: int):
-        """
-        Write this combat participant's team id
+    write_team_id = team_id.writer()
+    """
+    Write this combat participant's team id
 
-        Args:
-            team_id: The team id to write
-        """
-        await self.write_value_to_offset(144, team_id, "int")
+    Args:
+        team_id: The team id to write
+    """
 
     # TODO: turn this into an enum?
-    async def primary_magic_school_id(self) -> int:
-        """
-        This combat participant's primary school id
-
-        Notes:
-            This is a template id
-        """
-        return await self.read_value_from_offset(148, "int")
-
-    async def write_primary_magic_school_id(self, primary_magic_school_id: int):
-        """
-        Write this combat participant's primate school id
-
-        Args:
-            primary_magic_school_id: The school id to write
-
-        Notes:
-            this is a template id
-        """
-        await self.write_value_to_offset(148, primary_magic_school_id, "int")
-
-    async def num_pips(self) -> int:
-        """
-        The number of pips this combat participant has
-        """
-        return await self.read_value_from_offset(152, "unsigned char")
-
-    async def write_num_pips(self, num_pips: int):
-        """
-        Write this participant's pip number
-
-        Args:
-            num_pips: The pip number to write
-        """
-        await self.write_value_to_offset(152, num_pips, "unsigned char")
-
-    async def num_power_pips(self) -> int:
-        """
-        The number of power pips this combat participant has
-        """
-        return await self.read_value_from_offset(153, "unsigned char")
-
-    async def write_num_power_pips(self, num_power_pips: int):
-        """
-        Write the number of power pips this combat participant has
-
-        Args:
-            num_power_pips: The power pip number to write
-        """
-        await self.write_value_to_offset(153, num_power_pips, "unsigned char")
-
-    async def num_shadow_pips(self) -> int:
-        """
-        The number of shadow pips this combat participant has
-        """
-        return await self.read_value_from_offset(154, "unsigned char")
-
-    async def write_num_shadow_pips(self, num_shadow_pips: int):
-        """
-        Write the number of shadow pips this combat participant has
-
-        Args:
-            num_shadow_pips: The power pip number to write
-        """
-        await self.write_value_to_offset(154, num_shadow_pips, "unsigned char")
+    primary_magic_school_id = MemoryField(148, "int")
+    """
+    This combat participant's primary school id
 
-    # async def pip_round_rates(self) -> class SharedPointer<class ModifyPipRoundRateData>:
-    #     return await self.read_value_from_offset(160, "class SharedPointer<class ModifyPipRoundRateData>")
+    Notes:
+        This is a template id
+    """
 
-    async def pips_suspended(self) -> bool:
-        """
-        If this participant's pips are suspended
-        """
-        return await self.read_value_from_offset(176, "bool")
+    write_primary_magic_school_id = primary_magic_school_id.writer()
+    """
+    Write this combat participant's primate school id
 
-    async def write_pips_suspended(self, pips_suspended: bool):
-        """
-        Write if this participant's pips are suspended
+    Args:
+        primary_magic_school_id: The school id to write
 
-        Args:
-            pips_suspended: bool if pips are suspended
-        """
-        await self.write_value_to_offset(176, pips_suspended, "bool")
+    Notes:
+        this is a template id
+    """
 
-    # TODO: finish docs
-    async def stunned(self) -> int:
-        return await self.read_value_from_offset(180, "int")
+    num_pips = MemoryField(152, "unsigned char")
+    """
+    The number of pips this combat participant has
+    """
 
-    async def write_stunned(self, stunned: int):
-        await self.write_value_to_offset(180, stunned, "int")
+    write_num_pips = num_pips.writer()
+    """
+    Write this participant's pip number
 
-    async def mindcontrolled(self) -> int:
-        return await self.read_value_from_offset(208, "int")
+    Args:
+        num_pips: The pip number to write
+    """
 
-    async def write_mindcontrolled(self, mindcontrolled: int):
-        await self.write_value_to_offset(208, mindcontrolled, "int")
+    num_power_pips = MemoryField(153, "unsigned char")
+    """
+    The number of power pips this combat participant has
+    """
 
-    async def original_team(self) -> int:
-        return await self.read_value_from_offset(216, "int")
+    write_num_power_pips = num_power_pips.writer()
+    """
+    Write the number of power pips this combat participant has
 
-    async def write_original_team(self, original_team: int):
-        await self.write_value_to_offset(216, original_team, "int")
+    Args:
+        num_power_pips: The power pip number to write
+    """
 
-    async def aura_turn_length(self) -> int:
-        return await self.read_value_from_offset(228, "int")
+    num_shadow_pips = MemoryField(154, "unsigned char")
+    """
+    The number of shadow pips this combat participant has
+    """
 
-    async def write_aura_turn_length(self, n_aura_turn_length: int):
-        await self.write_value_to_offset(228, n_aura_turn_length, "int")
+    write_num_shadow_pips = num_shadow_pips.writer()
+    """
+    Write the number of shadow pips this combat participant has
 
-    async def clue(self) -> int:
-        return await self.read_value_from_offset(220, "int")
+    Args:
+        num_shadow_pips: The power pip number to write
+    """
 
-    async def write_clue(self, clue: int):
-        await self.write_value_to_offset(220, clue, "int")
+    # async def pip_round_rates(self) -> class SharedPointer<class ModifyPipRoundRateData>:
+    #     return await self.read_value_from_offset(160, "class SharedPointer<class ModifyPipRoundRateData>")
 
-    async def rounds_dead(self) -> int:
-        return await self.read_value_from_offset(224, "int")
+    pips_suspended = MemoryField(176, "bool")
+    """
+    If this participant's pips are suspended
+    """
 
-    async def write_rounds_dead(self, rounds_dead: int):
-        await self.write_value_to_offset(224, rounds_dead, "int")
+    write_pips_suspended = pips_suspended.writer()
+    """
+    Write if this participant's pips are suspended
 
-    async def polymorph_turn_length(self) -> int:
-        return await self.read_value_from_offset(232, "int")
+    Args:
+        pips_suspended: bool if pips are suspended
+    """
 
-    async def write_polymorph_turn_length(self, n_polymorph_turn_length: int):
-        await self.write_value_to_offset(232, n_polymorph_turn_length, "int")
+    # TODO: finish docs
+    stunned = MemoryField(180, "int")
+    write_stunned = stunned.writer()
 
-    async def player_health(self) -> int:
-        return await self.read_value_from_offset(236, "int")
+    mindcontrolled = MemoryField(208, "int")
+    write_mindcontrolled = mindcontrolled.writer()
 
-    async def write_player_health(self, player_health: int):
-        await self.write_value_to_offset(236, player_health, "int")
+    original_team = MemoryField(216, "int")
+    write_original_team = original_team.writer()
 
-    async def max_player_health(self) -> int:
-        return await self.read_value_from_offset(240, "int")
+    aura_turn_length = MemoryField(228, "int")
+    write_aura_turn_length = aura_turn_length.writer()
 
-    async def write_max_player_health(self, max_player_health: int):
-        await self.write_value_to_offset(240, max_player_health, "int")
+    clue = MemoryField(220, "int")
+    write_clue = clue.writer()
 
-    async def hide_current_hp(self) -> bool:
-        return await self.read_value_from_offset(244, "bool")
+    rounds_dead = MemoryField(224, "int")
+    write_rounds_dead = rounds_dead.writer()
 
-    async def write_hide_current_hp(self, _hide_current_h_p: bool):
-        await self.write_value_to_offset(244, _hide_current_h_p, "bool")
+    polymorph_turn_length = MemoryField(232, "int")
+    write_polymorph_turn_length = polymorph_turn_length.writer()
 
-    async def max_hand_size(self) -> int:
-        return await self.read_value_from_offset(248, "int")
+    player_health = MemoryField(236, "int")
+    write_player_health = player_health.writer()
 
-    async def write_max_hand_size(self, max_hand_size: int):
-        await self.write_value_to_offset(248, max_hand_size, "int")
+    max_player_health = MemoryField(240, "int")
+    write_max_player_health = max_player_health.writer()
+
+    hide_current_hp = MemoryField(244, "bool")
+    write_hide_current_hp = hide_current_hp.writer()
+
+    max_hand_size = MemoryField(248, "int")
+    write_max_hand_size = max_hand_size.writer()
 
     async def hand(self) -> Optional[DynamicHand]:
         addr = await self.read_value_from_offset(256, "long long")
@@ -261,7 +211,7 @@ class CombatParticipant(PropertyClass):
         return DynamicHand(self.hook_handler, addr)
 
     async def play_deck(self) -> Optional[DynamicPlayDeck]:
-        addr = await self.read_value_from_offset(272, "long long")
+        addr = await self.read_pointer_from_offset(272, cache_tag="duel")
 
         if addr == 0:
             return None
@@ -269,7 +219,7 @@ class CombatParticipant(PropertyClass):
         return DynamicPlayDeck(self.hook_handler, addr)
 
     async def saved_play_deck(self) -> Optional[DynamicPlayDeck]:
-        addr = await self.read_value_from_offset(280, "long long")
+        addr = await self.read_pointer_from_offset(280, cache_tag="duel")
 
         if addr == 0:
             return None
@@ -277,15 +227,14 @@ class CombatParticipant(PropertyClass):
         return DynamicPlayDeck(self.hook_handler, addr)
 
     async def saved_game_stats(self) -> Optional[DynamicGameStats]:
-        addr = await self.read_value_from_offset(288, "long long")
+        addr = await self.read_pointer_from_offset(288, cache_tag="duel")
 
         if addr == 0:
             return None
 
         return DynamicGameStats(self.hook_handler, addr)
 
-    async def saved_primary_magic_school_id(self) -> int:
-        return await self.read_value_from_offset(304, "int")
+    saved_primary_magic_school_id = MemoryField(304, "int")
 
     async def write_saved_primary_magic_school_id(
         self, saved_primary_magic_school_id: int
@@ -293,7 +242,7 @@ class CombatParticipant(PropertyClass):
         await self.write_value_to_offset(304, saved_primary_magic_school_id, "int")
 
     async def game_stats(self) -> Optional[DynamicGameStats]:
-        addr = await self.read_value_from_offset(312, "long long")
+        addr = await self.read_pointer_from_offset(312, cache_tag="duel")
 
         if addr == 0:
             return None
@@ -307,47 +256,26 @@ class CombatParticipant(PropertyClass):
     # async def write_color(self, color: class Color):
     #     await self.write_value_to_offset(328, color, "class Color")
 
-    async def rotation(self) -> float:
-        return await self.read_value_from_offset(332, "float")
-
-    async def write_rotation(self, rotation: float):
-        await self.write_value_to_offset(332, rotation, "float")
-
-    async def radius(self) -> float:
-        return await self.read_value_from_offset(336, "float")
-
-    async def write_radius(self, radius: float):
-        await self.write_value_to_offset(336, radius, "float")
-
-    async def subcircle(self) -> int:
-        return await self.read_value_from_offset(340, "int")
+    rotation = MemoryField(332, "float")
+    write_rotation = rotation.writer()
 
-    async def write_subcircle(self, subcircle: int):
-        await self.write_value_to_offset(340, subcircle, "int")
+    radius = MemoryField(336, "float")
+    write_radius = radius.writer()
 
-    async def pvp(self) -> bool:
-        return await self.read_value_from_offset(344, "bool")
+    subcircle = MemoryField(340, "int")
+    write_subcircle = subcircle.writer()
 
-    async def write_pvp(self, pvp: bool):
-        await self.write_value_to_offset(344, pvp, "bool")
+    pvp = MemoryField(344, "bool")
+    write_pvp = pvp.writer()
 
-    async def accuracy_bonus(self) -> float:
-        return await self.read_value_from_offset(388, "float")
+    accuracy_bonus = MemoryField(388, "float")
+    write_accuracy_bonus = accuracy_bonus.writer()
 
-    async def write_accuracy_bonus(self, accuracy_bonus: float):
-        await self.write_value_to_offset(388, accuracy_bonus, "float")
+    minion_sub_circle = MemoryField(392, "int")
+    write_minion_sub_circle = minion_sub_circle.writer()
 
-    async def minion_sub_circle(self) -> int:
-        return await self.read_value_from_offset(392, "int")
-
-    async def write_minion_sub_circle(self, minion_sub_circle: int):
-        await self.write_value_to_offset(392, minion_sub_circle, "int")
-
-    async def is_minion(self) -> bool:
-        return await self.read_value_from_offset(396, "bool")
-
-    async def write_is_minion(self, is_minion: bool):
-        await self.write_value_to_offset(396, is_minion, "bool")
+    is_minion = MemoryField(396, "bool")
+    write_is_minion = is_minion.writer()
 
     async def hanging_effects(self) -> List[DynamicSpellEffect]:
         hanging_effects = []
@@ -396,8 +324,7 @@ class CombatParticipant(PropertyClass):
 
         return delay_cast_effects
 
-    async def polymorph_spell_template_id(self) -> int:
-        return await self.read_value_from_offset(568, "unsigned int")
+    polymorph_spell_template_id = MemoryField(568, "unsigned int")
 
     async def write_polymorph_spell_template_id(self, polymorph_spell_template_id: int):
         await self.write_value_to_offset(
@@ -410,59 +337,32 @@ class CombatParticipant(PropertyClass):
     async def write_side(self, side: str):
         await self.write_string_to_offset(592, side)
 
-    async def shadow_spells_disabled(self) -> bool:
-        return await self.read_value_from_offset(637, "bool")
-
-    async def write_shadow_spells_disabled(self, shadow_spells_disabled: bool):
-        await self.write_value_to_offset(637, shadow_spells_disabled, "bool")
-
-    async def boss_mob(self) -> bool:
-        return await self.read_value_from_offset(638, "bool")
-
-    async def write_boss_mob(self, boss_mob: bool):
-        await self.write_value_to_offset(638, boss_mob, "bool")
-
-    async def hide_pvp_enemy_chat(self) -> bool:
-        return await self.read_value_from_offset(639, "bool")
-
-    async def write_hide_pvp_enemy_chat(self, hide_pvp_enemy_chat: bool):
-        await self.write_value_to_offset(639, hide_pvp_enemy_chat, "bool")
-
-    async def combat_trigger_ids(self) -> int:
-        return await self.read_value_from_offset(664, "int")
-
-    async def write_combat_trigger_ids(self, combat_trigger_ids: int):
-        await self.write_value_to_offset(664, combat_trigger_ids, "int")
-
-    async def backlash(self) -> int:
-        return await self.read_value_from_offset(692, "int")
-
-    async def write_backlash(self, backlash: int):
-        await self.write_value_to_offset(692, backlash, "int")
+    shadow_spells_disabled = MemoryField(637, "bool")
+    write_shadow_spells_disabled = shadow_spells_disabled.writer()
 
-    async def past_backlash(self) -> int:
-        return await self.read_value_from_offset(696, "int")
+    boss_mob = MemoryField(638, "bool")
+    write_boss_mob = boss_mob.writer()
 
-    async def write_past_backlash(self, past_backlash: int):
-        await self.write_value_to_offset(696, past_backlash, "int")
+    hide_pvp_enemy_chat = MemoryField(639, "bool")
+    write_hide_pvp_enemy_chat = hide_pvp_enemy_chat.writer()
 
-    async def shadow_creature_level(self) -> int:
-        return await self.read_value_from_offset(700, "int")
+    combat_trigger_ids = MemoryField(664, "int")
+    write_combat_trigger_ids = combat_trigger_ids.writer()
 
-    async def write_shadow_creature_level(self, shadow_creature_level: int):
-        await self.write_value_to_offset(700, shadow_creature_level, "int")
+    backlash = MemoryField(692, "int")
+    write_backlash = backlash.writer()
 
-    async def past_shadow_creature_level(self) -> int:
-        return await self.read_value_from_offset(704, "int")
+    past_backlash = MemoryField(696, "int")
+    write_past_backlash = past_backlash.writer()
 
-    async def write_past_shadow_creature_level(self, past_shadow_creature_level: int):
-        await self.write_value_to_offset(704, past_shadow_creature_level, "int")
+    shadow_creature_level = MemoryField(700, "int")
+    write_shadow_creature_level = shadow_creature_level.writer()
 
-    async def shadow_creature_level_count(self) -> int:
-        return await self.read_value_from_offset(712, "int")
+    past_shadow_creature_level = MemoryField(704, "int")
+    write_past_shadow_creature_level = past_shadow_creature_level.writer()
 
-    async def write_shadow_creature_level_count(self, shadow_creature_level_count: int):
-        await self.write_value_to_offset(712, shadow_creature_level_count, "int")
+    shadow_creature_level_count = MemoryField(712, "int")
+    write_shadow_creature_level_count = shadow_creature_level_count.writer()
 
     async def intercept_effect(self) -> Optional[DynamicSpellEffect]:
         addr = await self.read_value_from_offset(736, "long long")
@@ -472,11 +372,8 @@ class CombatParticipant(PropertyClass):
 
         return DynamicSpellEffect(self.hook_handler, addr)
 
-    async def rounds_since_shadow_pip(self) -> int:
-        return await self.read_value_from_offset(768, "int")
-
-    async def write_rounds_since_shadow_pip(self, rounds_since_shadow_pip: int):
-        await self.write_value_to_offset(768, rounds_since_shadow_pip, "int")
+    rounds_since_shadow_pip = MemoryField(768, "int")
+    write_rounds_since_shadow_pip = rounds_since_shadow_pip.writer()
 
     async def polymorph_effect(self) -> Optional[DynamicSpellEffect]:
         addr = await self.read_value_from_offset(792, "long long")
@@ -486,83 +383,44 @@ class CombatParticipant(PropertyClass):
 
         return DynamicSpellEffect(self.hook_handler, addr)
 
-    async def confused(self) -> int:
-        return await self.read_value_from_offset(188, "int")
-
-    async def write_confused(self, confused: int):
-        await self.write_value_to_offset(188, confused, "int")
-
-    async def confusion_trigger(self) -> int:
-        return await self.read_value_from_offset(192, "int")
-
-    async def write_confusion_trigger(self, confusion_trigger: int):
-        await self.write_value_to_offset(192, confusion_trigger, "int")
-
-    async def confusion_display(self) -> bool:
-        return await self.read_value_from_offset(196, "bool")
-
-    async def write_confusion_display(self, confusion_display: bool):
-        await self.write_value_to_offset(196, confusion_display, "bool")
-
-    async def confused_target(self) -> bool:
-        return await self.read_value_from_offset(197, "bool")
-
-    async def write_confused_target(self, confused_target: bool):
-        await self.write_value_to_offset(197, confused_target, "bool")
-
-    async def untargetable(self) -> bool:
-        return await self.read_value_from_offset(198, "bool")
-
-    async def write_untargetable(self, untargetable: bool):
-        await self.write_value_to_offset(198, untargetable, "bool")
-
-    async def untargetable_rounds(self) -> int:
-        return await self.read_value_from_offset(200, "int")
-
-    async def write_untargetable_rounds(self, untargetable_rounds: int):
-        await self.write_value_to_offset(200, untargetable_rounds, "int")
-
-    async def restricted_target(self) -> bool:
-        return await self.read_value_from_offset(204, "bool")
+    confused = MemoryField(188, "int")
+    write_confused = confused.writer()
 
-    async def write_restricted_target(self, restricted_target: bool):
-        await self.write_value_to_offset(204, restricted_target, "bool")
+    confusion_trigger = MemoryField(192, "int")
+    write_confusion_trigger = confusion_trigger.writer()
 
-    async def exit_combat(self) -> bool:
-        return await self.read_value_from_offset(205, "bool")
+    confusion_display = MemoryField(196, "bool")
+    write_confusion_display = confusion_display.writer()
 
-    async def write_exit_combat(self, exit_combat: bool):
-        await self.write_value_to_offset(205, exit_combat, "bool")
+    confused_target = MemoryField(197, "bool")
+    write_confused_target = confused_target.writer()
 
-    async def stunned_display(self) -> bool:
-        return await self.read_value_from_offset(184, "bool")
+    untargetable = MemoryField(198, "bool")
+    write_untargetable = untargetable.writer()
 
-    async def write_stunned_display(self, stunned_display: bool):
-        await self.write_value_to_offset(184, stunned_display, "bool")
+    untargetable_rounds = MemoryField(200, "int")
+    write_untargetable_rounds = untargetable_rounds.writer()
 
-    async def mindcontrolled_display(self) -> bool:
-        return await self.read_value_from_offset(212, "bool")
+    restricted_target = MemoryField(204, "bool")
+    write_restricted_target = restricted_target.writer()
 
-    async def write_mindcontrolled_display(self, mindcontrolled_display: bool):
-        await self.write_value_to_offset(212, mindcontrolled_display, "bool")
+    exit_combat = MemoryField(205, "bool")
+    write_exit_combat = exit_combat.writer()
 
-    async def auto_pass(self) -> bool:
-        return await self.read_value_from_offset(688, "bool")
+    stunned_display = MemoryField(184, "bool")
+    write_stunned_display = stunned_display.writer()
 
-    async def write_auto_pass(self, auto_pass: bool):
-        await self.write_value_to_offset(688, auto_pass, "bool")
+    mindcontrolled_display = MemoryField(212, "bool")
+    write_mindcontrolled_display = mindcontrolled_display.writer()
 
-    async def vanish(self) -> bool:
-        return await self.read_value_from_offset(689, "bool")
+    auto_pass = MemoryField(688, "bool")
+    write_auto_pass = auto_pass.writer()
 
-    async def write_vanish(self, vanish: bool):
-        await self.write_value_to_offset(689, vanish, "bool")
+    vanish = MemoryField(689, "bool")
+    write_vanish = vanish.writer()
 
-    async def my_team_turn(self) -> bool:
-        return await self.read_value_from_offset(690, "bool")
-
-    async def write_my_team_turn(self, my_team_turn: bool):
-        await self.write_value_to_offset(690, my_team_turn, "bool")
+    my_team_turn = MemoryField(690, "bool")
+    write_my_team_turn = my_team_turn.writer()
 
     async def planning_phase_pip_aquired_type(self) -> PipAquiredByEnum:
         return await self.read_enum(784, PipAquiredByEnum)
@@ -575,75 +433,42 @@ class CombatParticipant(PropertyClass):
     # async def cheat_settings(self) -> class SharedPointer<class CombatCheatSettings>:
     #     return await self.read_value_from_offset(96, "class SharedPointer<class CombatCheatSettings>")
 
-    async def is_monster(self) -> int:
-        return await self.read_value_from_offset(400, "unsigned int")
-
-    async def write_is_monster(self, is_monster: int):
-        await self.write_value_to_offset(400, is_monster, "unsigned int")
+    is_monster = MemoryField(400, "unsigned int")
+    write_is_monster = is_monster.writer()
 
     # async def weapon_nif_sound_list(self) -> class SharedPointer<class SpellNifSoundOverride>:
     #     return await self.read_value_from_offset(80, "class SharedPointer<class SpellNifSoundOverride>")
 
-    async def pet_combat_trigger(self) -> int:
-        return await self.read_value_from_offset(680, "int")
-
-    async def write_pet_combat_trigger(self, pet_combat_trigger: int):
-        await self.write_value_to_offset(680, pet_combat_trigger, "int")
-
-    async def pet_combat_trigger_target(self) -> int:
-        return await self.read_value_from_offset(684, "int")
-
-    async def write_pet_combat_trigger_target(self, pet_combat_trigger_target: int):
-        await self.write_value_to_offset(684, pet_combat_trigger_target, "int")
-
-    async def shadow_pip_rate_threshold(self) -> float:
-        return await self.read_value_from_offset(808, "float")
-
-    async def write_shadow_pip_rate_threshold(self, shadow_pip_rate_threshold: float):
-        await self.write_value_to_offset(808, shadow_pip_rate_threshold, "float")
-
-    async def base_spell_damage(self) -> int:
-        return await self.read_value_from_offset(812, "int")
-
-    async def write_base_spell_damage(self, base_spell_damage: int):
-        await self.write_value_to_offset(812, base_spell_damage, "int")
-
-    async def stat_damage(self) -> float:
-        return await self.read_value_from_offset(816, "float")
-
-    async def write_stat_damage(self, stat_damage: float):
-        await self.write_value_to_offset(816, stat_damage, "float")
-
-    async def stat_resist(self) -> float:
-        return await self.read_value_from_offset(820, "float")
+    pet_combat_trigger = MemoryField(680, "int")
+    write_pet_combat_trigger = pet_combat_trigger.writer()
 
-    async def write_stat_resist(self, stat_resist: float):
-        await self.write_value_to_offset(820, stat_resist, "float")
+    pet_combat_trigger_target = MemoryField(684, "int")
+    write_pet_combat_trigger_target = pet_combat_trigger_target.writer()
 
-    async def stat_pierce(self) -> float:
-        return await self.read_value_from_offset(824, "float")
+    shadow_pip_rate_threshold = MemoryField(808, "float")
+    write_shadow_pip_rate_threshold = shadow_pip_rate_threshold.writer()
 
-    async def write_stat_pierce(self, stat_pierce: float):
-        await self.write_value_to_offset(824, stat_pierce, "float")
+    base_spell_damage = MemoryField(812, "int")
+    write_base_spell_damage = base_spell_damage.writer()
 
-    async def mob_level(self) -> int:
-        return await self.read_value_from_offset(828, "int")
+    stat_damage = MemoryField(816, "float")
+    write_stat_damage = stat_damage.writer()
 
-    async def write_mob_level(self, mob_level: int):
-        await self.write_value_to_offset(828, mob_level, "int")
+    stat_resist = MemoryField(820, "float")
+    write_stat_resist = stat_resist.writer()
 
-    async def player_time_updated(self) -> bool:
-        return await self.read_value_from_offset(832, "bool")
+    stat_pierce = MemoryField(824, "float")
+    write_stat_pierce = stat_pierce.writer()
 
-    async def write_player_time_updated(self, player_time_updated: bool):
-        await self.write_value_to_offset(832, player_time_updated, "bool")
+    mob_level = MemoryField(828, "int")
+    write_mob_level = mob_level.writer()
 
-    async def player_time_eliminated(self) -> bool:
-        return await self.read_value_from_offset(833, "bool")
+    player_time_updated = MemoryField(832, "bool")
+    write_player_time_updated = player_time_updated.writer()
 
-    async def write_player_time_eliminated(self, player_time_eliminated: bool):
-        await self.write_value_to_offset(833, player_time_eliminated, "bool")
+    player_time_eliminated = MemoryField(833, "bool")
+    write_player_time_eliminated = player_time_eliminated.writer()
 
 
 class DynamicCombatParticipant(DynamicMemoryObject, CombatParticipant):
-    pass
+    __slots__ = ()
@@ -5,6 +5,8 @@ from .spell_effect import DynamicSpellEffect
 
 
 class CombatResolver(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -31,4 +33,4 @@ class CombatResolver(PropertyClass):
 
 
 class DynamicCombatResolver(DynamicMemoryObject, CombatResolver):
-    pass
+    __slots__ = ()
@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from wizwalker.utils import XYZ
+from wizwalker.memory.memory_field import MemoryField
 from wizwalker.memory.memory_object import PropertyClass
 from .combat_participant import DynamicCombatParticipant
 from .enums import DuelExecutionOrder, DuelPhase, SigilInitiativeSwitchMode
@@ -9,6 +10,8 @@ from .combat_resolver import DynamicCombatResolver
 
 # TODO: add m_gameEffectInfo and friends, and fix offsets
 class Duel(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -26,35 +29,22 @@ class Duel(PropertyClass):
     # TODO: need to add new type
     # async def dynamicTeams offset=104
 
-    async def dynamic_turn(self) -> int:
-        return await self.read_value_from_offset(120, "unsigned int")
-
-    async def write_dynamic_turn(self, dynamic_turn: int):
-        await self.write_value_to_offset(120, dynamic_turn, "unsigned int")
+    dynamic_turn = MemoryField(120, "unsigned int")
+    write_dynamic_turn = dynamic_turn.writer()
 
-    async def dynamic_turn_subcircles(self) -> int:
-        return await self.read_value_from_offset(124, "unsigned int")
+    dynamic_turn_subcircles = MemoryField(124, "unsigned int")
 
     async def write_dynamic_turn_subcircle(self, dynamic_turn_subcircle: int):
         await self.write_value_to_offset(124, dynamic_turn_subcircle, "unsigned int")
 
-    async def dynamic_turn_counter(self) -> int:
-        return await self.read_value_from_offset(128, "int")
-
-    async def write_dynamic_turn_counter(self, dynamic_turn_counter: int):
-        await self.write_value_to_offset(128, dynamic_turn_counter, "int")
+    dynamic_turn_counter = MemoryField(128, "int")
+    write_dynamic_turn_counter = dynamic_turn_counter.writer()
 
-    async def duel_id_full(self) -> int:
-        return await self.read_value_from_offset(72, "unsigned long long")
+    duel_id_full = MemoryField(72, "unsigned long long")
+    write_duel_id_full = duel_id_full.writer()
 
-    async def write_duel_id_full(self, duel_id_full: int):
-        await self.write_value_to_offset(72, duel_id_full, "unsigned long long")
-
-    async def planning_timer(self) -> float:
-        return await self.read_value_from_offset(144, "float")
-
-    async def write_planning_timer(self, planning_timer: float):
-        await self.write_value_to_offset(144, planning_timer, "float")
+    planning_timer = MemoryField(144, "float")
+    write_planning_timer = planning_timer.writer()
 
     async def position(self) -> XYZ:
         return await self.read_xyz(148)
@@ -62,67 +52,40 @@ class Duel(PropertyClass):
     async def write_position(self, position: XYZ):
         await self.write_xyz(148, position)
 
-    async def yaw(self) -> float:
-        return await self.read_value_from_offset(160, "float")
-
-    async def write_yaw(self, yaw: float):
-        await self.write_value_to_offset(160, yaw, "float")
+    yaw = MemoryField(160, "float")
+    write_yaw = yaw.writer()
 
-    async def disable_timer(self) -> bool:
-        return await self.read_value_from_offset(179, "bool")
+    disable_timer = MemoryField(179, "bool")
+    write_disable_timer = disable_timer.writer()
 
-    async def write_disable_timer(self, disable_timer: bool):
-        await self.write_value_to_offset(179, disable_timer, "bool")
+    tutorial_mode = MemoryField(180, "bool")
+    write_tutorial_mode = tutorial_mode.writer()
 
-    async def tutorial_mode(self) -> bool:
-        return await self.read_value_from_offset(180, "bool")
-
-    async def write_tutorial_mode(self, tutorial_mode: bool):
-        await self.write_value_to_offset(180, tutorial_mode, "bool")
-
-    async def first_team_to_act(self) -> int:
-        return await self.read_value_from_offset(184, "int")
-
-    async def write_first_team_to_act(self, first_team_to_act: int):
-        await self.write_value_to_offset(184, first_team_to_act, "int")
+    first_team_to_act = MemoryField(184, "int")
+    write_first_team_to_act = first_team_to_act.writer()
 
     async def combat_resolver(self) -> Optional[DynamicCombatResolver]:
-        addr = await self.read_value_from_offset(136, "long long")
+        addr = await self.read_pointer_from_offset(136, cache_tag="duel")
 
         if addr == 0:
             return None
 
         return DynamicCombatResolver(self.hook_handler, addr)
 
-    async def pvp(self) -> bool:
-        return await self.read_value_from_offset(176, "bool")
-
-    async def write_pvp(self, pvp: bool):
-        await self.write_value_to_offset(176, pvp, "bool")
-
-    async def battleground(self) -> bool:
-        return await self.read_value_from_offset(177, "bool")
+    pvp = MemoryField(176, "bool")
+    write_pvp = pvp.writer()
 
-    async def write_battleground(self, b_battleground: bool):
-        await self.write_value_to_offset(177, b_battleground, "bool")
+    battleground = MemoryField(177, "bool")
+    write_battleground = battleground.writer()
 
-    async def raid(self) -> bool:
-        return await self.read_value_from_offset(178, "bool")
+    raid = MemoryField(178, "bool")
+    write_raid = raid.writer()
 
-    async def write_raid(self, raid: bool):
-        await self.write_value_to_offset(178, raid, "bool")
+    round_num = MemoryField(192, "int")
+    write_round_num = round_num.writer()
 
-    async def round_num(self) -> int:
-        return await self.read_value_from_offset(192, "int")
-
-    async def write_round_num(self, round_num: int):
-        await self.write_value_to_offset(192, round_num, "int")
-
-    async def execution_phase_timer(self) -> float:
-        return await self.read_value_from_offset(200, "float")
-
-    async def write_execution_phase_timer(self, execution_phase_timer: float):
-        await self.write_value_to_offset(200, execution_phase_timer, "float")
+    execution_phase_timer = MemoryField(200, "float")
+    write_execution_phase_timer = execution_phase_timer.writer()
 
     # note: this seems to be unused
     # async def execution_phase_combat_actions(self) -> class CombatAction:
@@ -155,11 +118,8 @@ class Duel(PropertyClass):
     ):
         await self.write_enum(384, initiative_switch_mode)
 
-    async def initiative_switch_rounds(self) -> int:
-        return await self.read_value_from_offset(388, "int")
-
-    async def write_initiative_switch_rounds(self, initiative_switch_rounds: int):
-        await self.write_value_to_offset(388, initiative_switch_rounds, "int")
+    initiative_switch_rounds = MemoryField(388, "int")
+    write_initiative_switch_rounds = initiative_switch_rounds.writer()
 
     # async def combat_rules(self) -> class SharedPointer<class CombatRule>:
     #     return await self.read_value_from_offset(464, "class SharedPointer<class CombatRule>")
@@ -170,17 +130,11 @@ class Duel(PropertyClass):
     # async def game_effect_info(self):
     #     pass
 
-    async def alt_turn_counter(self) -> int:
-        return await self.read_value_from_offset(456, "int")
-
-    async def write_alt_turn_counter(self, alt_turn_counter: int):
-        await self.write_value_to_offset(456, alt_turn_counter, "int")
+    alt_turn_counter = MemoryField(456, "int")
+    write_alt_turn_counter = alt_turn_counter.writer()
 
-    async def original_first_team_to_act(self) -> int:
-        return await self.read_value_from_offset(188, "int")
-
-    async def write_original_first_team_to_act(self, original_first_team_to_act: int):
-        await self.write_value_to_offset(188, original_first_team_to_act, "int")
+    original_first_team_to_act = MemoryField(188, "int")
+    write_original_first_team_to_act = original_first_team_to_act.writer()
 
     async def execution_order(self) -> DuelExecutionOrder:
         return await self.read_enum(528, DuelExecutionOrder)
@@ -188,156 +142,81 @@ class Duel(PropertyClass):
     async def write_execution_order(self, execution_order: DuelExecutionOrder):
         await self.write_enum(528, execution_order)
 
-    async def no_henchmen(self) -> bool:
-        return await self.read_value_from_offset(532, "bool")
-
-    async def write_no_henchmen(self, no_henchmen: bool):
-        await self.write_value_to_offset(532, no_henchmen, "bool")
-
-    async def spell_truncation(self) -> bool:
-        return await self.read_value_from_offset(540, "bool")
-
-    async def write_spell_truncation(self, spell_truncation: bool):
-        await self.write_value_to_offset(540, spell_truncation, "bool")
-
-    async def shadow_threshold_factor(self) -> float:
-        return await self.read_value_from_offset(548, "float")
+    no_henchmen = MemoryField(532, "bool")
+    write_no_henchmen = no_henchmen.writer()
 
-    async def write_shadow_threshold_factor(self, shadow_threshold_factor: float):
-        await self.write_value_to_offset(548, shadow_threshold_factor, "float")
+    spell_truncation = MemoryField(540, "bool")
+    write_spell_truncation = spell_truncation.writer()
 
-    async def shadow_pip_rating_factor(self) -> float:
-        return await self.read_value_from_offset(552, "float")
+    shadow_threshold_factor = MemoryField(548, "float")
+    write_shadow_threshold_factor = shadow_threshold_factor.writer()
 
-    async def write_shadow_pip_rating_factor(self, shadow_pip_rating_factor: float):
-        await self.write_value_to_offset(552, shadow_pip_rating_factor, "float")
+    shadow_pip_rating_factor = MemoryField(552, "float")
+    write_shadow_pip_rating_factor = shadow_pip_rating_factor.writer()
 
-    async def default_shadow_pip_rating(self) -> float:
-        return await self.read_value_from_offset(556, "float")
+    default_shadow_pip_rating = MemoryField(556, "float")
+    write_default_shadow_pip_rating = default_shadow_pip_rating.writer()
 
-    async def write_default_shadow_pip_rating(self, default_shadow_pip_rating: float):
-        await self.write_value_to_offset(556, default_shadow_pip_rating, "float")
+    shadow_pip_threshold_team0 = MemoryField(560, "float")
+    write_shadow_pip_threshold_team0 = shadow_pip_threshold_team0.writer()
 
-    async def shadow_pip_threshold_team0(self) -> float:
-        return await self.read_value_from_offset(560, "float")
+    shadow_pip_threshold_team1 = MemoryField(564, "float")
+    write_shadow_pip_threshold_team1 = shadow_pip_threshold_team1.writer()
 
-    async def write_shadow_pip_threshold_team0(self, shadow_pip_threshold_team0: float):
-        await self.write_value_to_offset(560, shadow_pip_threshold_team0, "float")
+    scalar_damage = MemoryField(592, "float")
+    write_scalar_damage = scalar_damage.writer()
 
-    async def shadow_pip_threshold_team1(self) -> float:
-        return await self.read_value_from_offset(564, "float")
+    scalar_resist = MemoryField(596, "float")
+    write_scalar_resist = scalar_resist.writer()
 
-    async def write_shadow_pip_threshold_team1(self, shadow_pip_threshold_team1: float):
-        await self.write_value_to_offset(564, shadow_pip_threshold_team1, "float")
+    scalar_pierce = MemoryField(600, "float")
+    write_scalar_pierce = scalar_pierce.writer()
 
-    async def scalar_damage(self) -> float:
-        return await self.read_value_from_offset(592, "float")
-
-    async def write_scalar_damage(self, scalar_damage: float):
-        await self.write_value_to_offset(592, scalar_damage, "float")
-
-    async def scalar_resist(self) -> float:
-        return await self.read_value_from_offset(596, "float")
-
-    async def write_scalar_resist(self, scalar_resist: float):
-        await self.write_value_to_offset(596, scalar_resist, "float")
-
-    async def scalar_pierce(self) -> float:
-        return await self.read_value_from_offset(600, "float")
-
-    async def write_scalar_pierce(self, scalar_pierce: float):
-        await self.write_value_to_offset(600, scalar_pierce, "float")
-
-    async def damage_limit(self) -> float:
-        return await self.read_value_from_offset(604, "float")
-
-    async def write_damage_limit(self, damage_limit: float):
-        await self.write_value_to_offset(604, damage_limit, "float")
+    damage_limit = MemoryField(604, "float")
+    write_damage_limit = damage_limit.writer()
 
     # TODO 2.0: this d_ shouldn't be here
-    async def d_k0(self) -> float:
-        return await self.read_value_from_offset(608, "float")
-
-    async def write_d_k0(self, d_k0: float):
-        await self.write_value_to_offset(608, d_k0, "float")
-
-    async def d_n0(self) -> float:
-        return await self.read_value_from_offset(612, "float")
-
-    async def write_d_n0(self, d_n0: float):
-        await self.write_value_to_offset(612, d_n0, "float")
-
-    async def resist_limit(self) -> float:
-        return await self.read_value_from_offset(616, "float")
-
-    async def write_resist_limit(self, resist_limit: float):
-        await self.write_value_to_offset(616, resist_limit, "float")
-
-    async def r_k0(self) -> float:
-        return await self.read_value_from_offset(620, "float")
-
-    async def write_r_k0(self, r_k0: float):
-        await self.write_value_to_offset(620, r_k0, "float")
-
-    async def r_n0(self) -> float:
-        return await self.read_value_from_offset(624, "float")
-
-    async def write_r_n0(self, r_n0: float):
-        await self.write_value_to_offset(624, r_n0, "float")
-
-    async def full_party_group(self) -> bool:
-        return await self.read_value_from_offset(628, "bool")
-
-    async def write_full_party_group(self, full_party_group: bool):
-        await self.write_value_to_offset(628, full_party_group, "bool")
-
-    async def match_timer(self) -> float:
-        return await self.read_value_from_offset(648, "float")
-
-    async def write_match_timer(self, match_timer: float):
-        await self.write_value_to_offset(648, match_timer, "float")
-
-    async def bonus_time(self) -> int:
-        return await self.read_value_from_offset(652, "int")
+    d_k0 = MemoryField(608, "float")
+    write_d_k0 = d_k0.writer()
 
-    async def write_bonus_time(self, bonus_time: int):
-        await self.write_value_to_offset(652, bonus_time, "int")
+    d_n0 = MemoryField(612, "float")
+    write_d_n0 = d_n0.writer()
 
-    async def pass_penalty(self) -> int:
-        return await self.read_value_from_offset(656, "int")
+    resist_limit = MemoryField(616, "float")
+    write_resist_limit = resist_limit.writer()
 
-    async def write_pass_penalty(self, pass_penalty: int):
-        await self.write_value_to_offset(656, pass_penalty, "int")
+    r_k0 = MemoryField(620, "float")
+    write_r_k0 = r_k0.writer()
 
-    async def yellow_time(self) -> int:
-        return await self.read_value_from_offset(660, "int")
+    r_n0 = MemoryField(624, "float")
+    write_r_n0 = r_n0.writer()
 
-    async def write_yellow_time(self, yellow_time: int):
-        await self.write_value_to_offset(660, yellow_time, "int")
+    full_party_group = MemoryField(628, "bool")
+    write_full_party_group = full_party_group.writer()
 
-    async def red_time(self) -> int:
-        return await self.read_value_from_offset(664, "int")
+    match_timer = MemoryField(648, "float")
+    write_match_timer = match_timer.writer()
 
-    async def write_red_time(self, red_time: int):
-        await self.write_value_to_offset(664, red_time, "int")
+    bonus_time = MemoryField(652, "int")
+    write_bonus_time = bonus_time.writer()
 
-    async def min_turn_time(self) -> int:
-        return await self.read_value_from_offset(668, "int")
+    pass_penalty = MemoryField(656, "int")
+    write_pass_penalty = pass_penalty.writer()
 
-    async def write_min_turn_time(self, min_turn_time: int):
-        await self.write_value_to_offset(668, min_turn_time, "int")
+    yellow_time = MemoryField(660, "int")
+    write_yellow_time = yellow_time.writer()
 
-    async def is_player_timed_duel(self) -> bool:
-        return await self.read_value_from_offset(629, "bool")
+    red_time = MemoryField(664, "int")
+    write_red_time = red_time.writer()
 
-    async def write_is_player_timed_duel(self, is_player_timed_duel: bool):
-        await self.write_value_to_offset(629, is_player_timed_duel, "bool")
+    min_turn_time = MemoryField(668, "int")
+    write_min_turn_time = min_turn_time.writer()
 
-    async def hide_noncombatant_distance(self) -> float:
-        return await self.read_value_from_offset(536, "float")
+    is_player_timed_duel = MemoryField(629, "bool")
+    write_is_player_timed_duel = is_player_timed_duel.writer()
 
-    async def write_hide_noncombatant_distance(self, hide_noncombatant_distance: float):
-        await self.write_value_to_offset(536, hide_noncombatant_distance, "float")
+    hide_noncombatant_distance = MemoryField(536, "float")
+    write_hide_noncombatant_distance = hide_noncombatant_distance.writer()
 
 
 class CurrentDuel(Duel):
@@ -15,6 +15,8 @@ from .gamebryo_presenter import DynamicGamebryoPresenter
 
 # note: not defined
 class GameClient(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
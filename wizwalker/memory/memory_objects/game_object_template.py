@@ -6,6 +6,8 @@ from .behavior_template import DynamicBehaviorTemplate
 
 
 class WizGameObjectTemplate(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -123,4 +125,4 @@ class WizGameObjectTemplate(PropertyClass):
 
 
 class DynamicWizGameObjectTemplate(DynamicMemoryObject, WizGameObjectTemplate):
-    pass
+    __slots__ = ()
@@ -1,9 +1,12 @@
 from typing import List
 
+from wizwalker.memory.memory_field import MemoryField
 from wizwalker.memory.memory_object import DynamicMemoryObject, PropertyClass
 
 
 class GameStats(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -11,101 +14,57 @@ class GameStats(PropertyClass):
         """
         Client's max hitpoints; base + bonus
         """
-        base = await self.base_hitpoints()
-        bonus = await self.bonus_hitpoints()
-        return base + bonus
+        values = await self.read_fields("base_hitpoints", "bonus_hitpoints")
+        return values["base_hitpoints"] + values["bonus_hitpoints"]
 
     async def max_mana(self) -> int:
         """
         Clients's max mana; base + bonus
         """
-        base = await self.base_mana()
-        bonus = await self.bonus_mana()
-        return base + bonus
-
-    async def base_hitpoints(self) -> int:
-        return await self.read_value_from_offset(80, "int")
-
-    async def write_base_hitpoints(self, base_hitpoints: int):
-        await self.write_value_to_offset(80, base_hitpoints, "int")
-
-    async def base_mana(self) -> int:
-        return await self.read_value_from_offset(84, "int")
-
-    async def write_base_mana(self, base_mana: int):
-        await self.write_value_to_offset(84, base_mana, "int")
-
-    async def base_gold_pouch(self) -> int:
-        return await self.read_value_from_offset(88, "int")
-
-    async def write_base_gold_pouch(self, base_gold_pouch: int):
-        await self.write_value_to_offset(88, base_gold_pouch, "int")
-
-    async def base_event_currency1_pouch(self) -> int:
-        return await self.read_value_from_offset(92, "int")
-
-    async def write_base_event_currency1_pouch(self, base_event_currency1_pouch: int):
-        await self.write_value_to_offset(92, base_event_currency1_pouch, "int")
-
-    async def base_event_currency2_pouch(self) -> int:
-        return await self.read_value_from_offset(96, "int")
-
-    async def write_base_event_currency2_pouch(self, base_event_currency2_pouch: int):
-        await self.write_value_to_offset(96, base_event_currency2_pouch, "int")
+        values = await self.read_fields("base_mana", "bonus_mana")
+        return values["base_mana"] + values["bonus_mana"]
 
-    async def base_pvp_currency_pouch(self) -> int:
-        return await self.read_value_from_offset(100, "int")
+    base_hitpoints = MemoryField(80, "int")
+    write_base_hitpoints = base_hitpoints.writer()
 
-    async def write_base_pvp_currency_pouch(self, base_pvp_currency_pouch: int):
-        await self.write_value_to_offset(100, base_pvp_currency_pouch, "int")
+    base_mana = MemoryField(84, "int")
+    write_base_mana = base_mana.writer()
 
-    async def energy_max(self) -> int:
-        return await self.read_value_from_offset(104, "int")
+    base_gold_pouch = MemoryField(88, "int")
+    write_base_gold_pouch = base_gold_pouch.writer()
 
-    async def write_energy_max(self, energy_max: int):
-        await self.write_value_to_offset(104, energy_max, "int")
+    base_event_currency1_pouch = MemoryField(92, "int")
+    write_base_event_currency1_pouch = base_event_currency1_pouch.writer()
 
-    async def current_hitpoints(self) -> int:
-        return await self.read_value_from_offset(108, "int")
+    base_event_currency2_pouch = MemoryField(96, "int")
+    write_base_event_currency2_pouch = base_event_currency2_pouch.writer()
 
-    async def write_current_hitpoints(self, current_hitpoints: int):
-        await self.write_value_to_offset(108, current_hitpoints, "int")
+    base_pvp_currency_pouch = MemoryField(100, "int")
+    write_base_pvp_currency_pouch = base_pvp_currency_pouch.writer()
 
-    async def current_gold(self) -> int:
-        return await self.read_value_from_offset(112, "int")
+    energy_max = MemoryField(104, "int")
+    write_energy_max = energy_max.writer()
 
-    async def write_current_gold(self, current_gold: int):
-        await self.write_value_to_offset(112, current_gold, "int")
+    current_hitpoints = MemoryField(108, "int")
+    write_current_hitpoints = current_hitpoints.writer()
 
-    async def current_event_currency1(self) -> int:
-        return await self.read_value_from_offset(116, "int")
+    current_gold = MemoryField(112, "int")
+    write_current_gold = current_gold.writer()
 
-    async def write_current_event_currency1(self, current_event_currency1: int):
-        await self.write_value_to_offset(116, current_event_currency1, "int")
+    current_event_currency1 = MemoryField(116, "int")
+    write_current_event_currency1 = current_event_currency1.writer()
 
-    async def current_event_currency2(self) -> int:
-        return await self.read_value_from_offset(120, "int")
+    current_event_currency2 = MemoryField(120, "int")
+    write_current_event_currency2 = current_event_currency2.writer()
 
-    async def write_current_event_currency2(self, current_event_currency2: int):
-        await self.write_value_to_offset(120, current_event_currency2, "int")
+    current_pvp_currency = MemoryField(124, "int")
+    write_current_pvp_currency = current_pvp_currency.writer()
 
-    async def current_pvp_currency(self) -> int:
-        return await self.read_value_from_offset(124, "int")
+    current_mana = MemoryField(128, "int")
+    write_current_mana = current_mana.writer()
 
-    async def write_current_pvp_currency(self, current_pvp_currency: int):
-        await self.write_value_to_offset(124, current_pvp_currency, "int")
-
-    async def current_mana(self) -> int:
-        return await self.read_value_from_offset(128, "int")
-
-    async def write_current_mana(self, current_mana: int):
-        await self.write_value_to_offset(128, current_mana, "int")
-
-    async def current_arena_points(self) -> int:
-        return await self.read_value_from_offset(132, "int")
-
-    async def write_current_arena_points(self, current_arena_points: int):
-        await self.write_value_to_offset(132, current_arena_points, "int")
+    current_arena_points = MemoryField(132, "int")
+    write_current_arena_points = current_arena_points.writer()
 
     async def spell_charge_base(self) -> List[int]:
         return await self.read_dynamic_vector(136, "int")
@@ -114,17 +73,11 @@ class GameStats(PropertyClass):
     # async def write_spell_charge_base(self, spell_charge_base: int):
     #     await self.write_value_to_offset(128, spell_charge_base, "int")
 
-    async def potion_max(self) -> float:
-        return await self.read_value_from_offset(160, "float")
-
-    async def write_potion_max(self, potion_max: float):
-        await self.write_value_to_offset(160, potion_max, "float")
-
-    async def potion_charge(self) -> float:
-        return await self.read_value_from_offset(164, "float")
+    potion_max = MemoryField(160, "float")
+    write_potion_max = potion_max.writer()
 
-    async def write_potion_charge(self, potion_charge: float):
-        await self.write_value_to_offset(164, potion_charge, "float")
+    potion_charge = MemoryField(164, "float")
+    write_potion_charge = potion_charge.writer()
 
     # async def arena_ladder(self) -> class SharedPointer<class Ladder>:
     #     return await self.read_value_from_offset(160, "class SharedPointer<class Ladder>")
@@ -135,67 +88,35 @@ class GameStats(PropertyClass):
     # async def bracket_lader(self) -> class SharedPointer<class Ladder>:
     #     return await self.read_value_from_offset(192, "class SharedPointer<class Ladder>")
 
-    async def bonus_hitpoints(self) -> int:
-        return await self.read_value_from_offset(216, "int")
-
-    async def write_bonus_hitpoints(self, bonus_hitpoints: int):
-        await self.write_value_to_offset(216, bonus_hitpoints, "int")
-
-    async def bonus_mana(self) -> int:
-        return await self.read_value_from_offset(220, "int")
-
-    async def write_bonus_mana(self, bonus_mana: int):
-        await self.write_value_to_offset(220, bonus_mana, "int")
-
-    async def bonus_energy(self) -> int:
-        return await self.read_value_from_offset(236, "int")
-
-    async def write_bonus_energy(self, bonus_energy: int):
-        await self.write_value_to_offset(236, bonus_energy, "int")
+    bonus_hitpoints = MemoryField(216, "int")
+    write_bonus_hitpoints = bonus_hitpoints.writer()
 
-    async def critical_hit_percent_all(self) -> float:
-        return await self.read_value_from_offset(240, "float")
+    bonus_mana = MemoryField(220, "int")
+    write_bonus_mana = bonus_mana.writer()
 
-    async def write_critical_hit_percent_all(self, critical_hit_percent_all: float):
-        await self.write_value_to_offset(240, critical_hit_percent_all, "float")
+    bonus_energy = MemoryField(236, "int")
+    write_bonus_energy = bonus_energy.writer()
 
-    async def block_percent_all(self) -> float:
-        return await self.read_value_from_offset(244, "float")
+    critical_hit_percent_all = MemoryField(240, "float")
+    write_critical_hit_percent_all = critical_hit_percent_all.writer()
 
-    async def write_block_percent_all(self, block_percent_all: float):
-        await self.write_value_to_offset(244, block_percent_all, "float")
+    block_percent_all = MemoryField(244, "float")
+    write_block_percent_all = block_percent_all.writer()
 
-    async def critical_hit_rating_all(self) -> float:
-        return await self.read_value_from_offset(248, "float")
+    critical_hit_rating_all = MemoryField(248, "float")
+    write_critical_hit_rating_all = critical_hit_rating_all.writer()
 
-    async def write_critical_hit_rating_all(self, critical_hit_rating_all: float):
-        await self.write_value_to_offset(248, critical_hit_rating_all, "float")
+    block_rating_all = MemoryField(252, "float")
+    write_block_rating_all = block_rating_all.writer()
 
-    async def block_rating_all(self) -> float:
-        return await self.read_value_from_offset(252, "float")
+    reference_level = MemoryField(316, "int")
+    write_reference_level = reference_level.writer()
 
-    async def write_block_rating_all(self, block_rating_all: float):
-        await self.write_value_to_offset(252, block_rating_all, "float")
+    highest_character_level_on_account = MemoryField(320, "int")
+    write_highest_character_level_on_account = highest_character_level_on_account.writer()
 
-    async def reference_level(self) -> int:
-        return await self.read_value_from_offset(316, "int")
-
-    async def write_reference_level(self, reference_level: int):
-        await self.write_value_to_offset(316, reference_level, "int")
-
-    async def highest_character_level_on_account(self) -> int:
-        return await self.read_value_from_offset(320, "int")
-
-    async def write_highest_character_level_on_account(
-        self, highest_character_level_on_account: int
-    ):
-        await self.write_value_to_offset(320, highest_character_level_on_account, "int")
-
-    async def pet_act_chance(self) -> int:
-        return await self.read_value_from_offset(324, "int")
-
-    async def write_pet_act_chance(self, pet_act_chance: int):
-        await self.write_value_to_offset(324, pet_act_chance, "int")
+    pet_act_chance = MemoryField(324, "int")
+    write_pet_act_chance = pet_act_chance.writer()
 
     async def dmg_bonus_percent(self) -> List[float]:
         return await self.read_dynamic_vector(328, "float")
@@ -257,85 +178,48 @@ class GameStats(PropertyClass):
     async def write_spell_charge_bonus(self, spell_charge_bonus: int):
         await self.write_value_to_offset(568, spell_charge_bonus, "int")
 
-    async def dmg_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(688, "float")
-
-    async def write_dmg_bonus_percent_all(self, dmg_bonus_percent_all: float):
-        await self.write_value_to_offset(688, dmg_bonus_percent_all, "float")
-
-    async def dmg_bonus_flat_all(self) -> float:
-        return await self.read_value_from_offset(692, "float")
-
-    async def write_dmg_bonus_flat_all(self, dmg_bonus_flat_all: float):
-        await self.write_value_to_offset(692, dmg_bonus_flat_all, "float")
-
-    async def acc_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(696, "float")
-
-    async def write_acc_bonus_percent_all(self, acc_bonus_percent_all: float):
-        await self.write_value_to_offset(696, acc_bonus_percent_all, "float")
+    dmg_bonus_percent_all = MemoryField(688, "float")
+    write_dmg_bonus_percent_all = dmg_bonus_percent_all.writer()
 
-    async def ap_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(700, "float")
+    dmg_bonus_flat_all = MemoryField(692, "float")
+    write_dmg_bonus_flat_all = dmg_bonus_flat_all.writer()
 
-    async def write_ap_bonus_percent_all(self, ap_bonus_percent_all: float):
-        await self.write_value_to_offset(700, ap_bonus_percent_all, "float")
+    acc_bonus_percent_all = MemoryField(696, "float")
+    write_acc_bonus_percent_all = acc_bonus_percent_all.writer()
 
-    async def dmg_reduce_percent_all(self) -> float:
-        return await self.read_value_from_offset(704, "float")
+    ap_bonus_percent_all = MemoryField(700, "float")
+    write_ap_bonus_percent_all = ap_bonus_percent_all.writer()
 
-    async def write_dmg_reduce_percent_all(self, dmg_reduce_percent_all: float):
-        await self.write_value_to_offset(704, dmg_reduce_percent_all, "float")
+    dmg_reduce_percent_all = MemoryField(704, "float")
+    write_dmg_reduce_percent_all = dmg_reduce_percent_all.writer()
 
-    async def dmg_reduce_flat_all(self) -> float:
-        return await self.read_value_from_offset(708, "float")
+    dmg_reduce_flat_all = MemoryField(708, "float")
+    write_dmg_reduce_flat_all = dmg_reduce_flat_all.writer()
 
-    async def write_dmg_reduce_flat_all(self, dmg_reduce_flat_all: float):
-        await self.write_value_to_offset(708, dmg_reduce_flat_all, "float")
+    acc_reduce_percent_all = MemoryField(712, "float")
+    write_acc_reduce_percent_all = acc_reduce_percent_all.writer()
 
-    async def acc_reduce_percent_all(self) -> float:
-        return await self.read_value_from_offset(712, "float")
+    heal_bonus_percent_all = MemoryField(716, "float")
+    write_heal_bonus_percent_all = heal_bonus_percent_all.writer()
 
-    async def write_acc_reduce_percent_all(self, acc_reduce_percent_all: float):
-        await self.write_value_to_offset(712, acc_reduce_percent_all, "float")
+    heal_inc_bonus_percent_all = MemoryField(720, "float")
+    write_heal_inc_bonus_percent_all = heal_inc_bonus_percent_all.writer()
 
-    async def heal_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(716, "float")
+    spell_charge_bonus_all = MemoryField(728, "int")
+    write_spell_charge_bonus_all = spell_charge_bonus_all.writer()
 
-    async def write_heal_bonus_percent_all(self, heal_bonus_percent_all: float):
-        await self.write_value_to_offset(716, heal_bonus_percent_all, "float")
+    power_pip_base = MemoryField(732, "float")
+    write_power_pip_base = power_pip_base.writer()
 
-    async def heal_inc_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(720, "float")
-
-    async def write_heal_inc_bonus_percent_all(self, heal_inc_bonus_percent_all: float):
-        await self.write_value_to_offset(720, heal_inc_bonus_percent_all, "float")
-
-    async def spell_charge_bonus_all(self) -> int:
-        return await self.read_value_from_offset(728, "int")
-
-    async def write_spell_charge_bonus_all(self, spell_charge_bonus_all: int):
-        await self.write_value_to_offset(728, spell_charge_bonus_all, "int")
-
-    async def power_pip_base(self) -> float:
-        return await self.read_value_from_offset(732, "float")
-
-    async def write_power_pip_base(self, power_pip_base: float):
-        await self.write_value_to_offset(732, power_pip_base, "float")
-
-    async def power_pip_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(768, "float")
+    power_pip_bonus_percent_all = MemoryField(768, "float")
 
     async def write_power_pip_bonus_percent_all(
         self, power_pip_bonus_percent_all: float
     ):
         await self.write_value_to_offset(768, power_pip_bonus_percent_all, "float")
 
-    async def xp_percent_increase(self) -> float:
-        return await self.read_value_from_offset(776, "float")
-
-    async def write_xp_percent_increase(self, xp_percent_increase: float):
-        await self.write_value_to_offset(776, xp_percent_increase, "float")
+    xp_percent_increase = MemoryField(776, "float")
+    write_xp_percent_increase = xp_percent_increase.writer()
 
     async def critical_hit_percent_by_school(self) -> List[float]:
         return await self.read_dynamic_vector(592, "float")
@@ -365,127 +249,69 @@ class GameStats(PropertyClass):
     async def write_block_rating_by_school(self, block_rating_by_school: float):
         await self.write_value_to_offset(664, block_rating_by_school, "float")
 
-    async def balance_mastery(self) -> int:
-        return await self.read_value_from_offset(804, "int")
-
-    async def write_balance_mastery(self, balance_mastery: int):
-        await self.write_value_to_offset(804, balance_mastery, "int")
-
-    async def death_mastery(self) -> int:
-        return await self.read_value_from_offset(808, "int")
-
-    async def write_death_mastery(self, death_mastery: int):
-        await self.write_value_to_offset(808, death_mastery, "int")
+    balance_mastery = MemoryField(804, "int")
+    write_balance_mastery = balance_mastery.writer()
 
-    async def fire_mastery(self) -> int:
-        return await self.read_value_from_offset(812, "int")
+    death_mastery = MemoryField(808, "int")
+    write_death_mastery = death_mastery.writer()
 
-    async def write_fire_mastery(self, fire_mastery: int):
-        await self.write_value_to_offset(812, fire_mastery, "int")
+    fire_mastery = MemoryField(812, "int")
+    write_fire_mastery = fire_mastery.writer()
 
-    async def ice_mastery(self) -> int:
-        return await self.read_value_from_offset(816, "int")
+    ice_mastery = MemoryField(816, "int")
+    write_ice_mastery = ice_mastery.writer()
 
-    async def write_ice_mastery(self, ice_mastery: int):
-        await self.write_value_to_offset(816, ice_mastery, "int")
+    life_mastery = MemoryField(820, "int")
+    write_life_mastery = life_mastery.writer()
 
-    async def life_mastery(self) -> int:
-        return await self.read_value_from_offset(820, "int")
+    myth_mastery = MemoryField(824, "int")
+    write_myth_mastery = myth_mastery.writer()
 
-    async def write_life_mastery(self, life_mastery: int):
-        await self.write_value_to_offset(820, life_mastery, "int")
+    storm_mastery = MemoryField(828, "int")
+    write_storm_mastery = storm_mastery.writer()
 
-    async def myth_mastery(self) -> int:
-        return await self.read_value_from_offset(824, "int")
+    maximum_number_of_islands = MemoryField(832, "int")
+    write_maximum_number_of_islands = maximum_number_of_islands.writer()
 
-    async def write_myth_mastery(self, myth_mastery: int):
-        await self.write_value_to_offset(824, myth_mastery, "int")
+    gardening_level = MemoryField(836, "unsigned char")
+    write_gardening_level = gardening_level.writer()
 
-    async def storm_mastery(self) -> int:
-        return await self.read_value_from_offset(828, "int")
+    gardening_xp = MemoryField(840, "int")
+    write_gardening_xp = gardening_xp.writer()
 
-    async def write_storm_mastery(self, storm_mastery: int):
-        await self.write_value_to_offset(828, storm_mastery, "int")
+    invisible_to_friends = MemoryField(844, "bool")
+    write_invisible_to_friends = invisible_to_friends.writer()
 
-    async def maximum_number_of_islands(self) -> int:
-        return await self.read_value_from_offset(832, "int")
+    show_item_lock = MemoryField(845, "bool")
+    write_show_item_lock = show_item_lock.writer()
 
-    async def write_maximum_number_of_islands(self, maximum_number_of_islands: int):
-        await self.write_value_to_offset(832, maximum_number_of_islands, "int")
+    quest_finder_enabled = MemoryField(846, "bool")
+    write_quest_finder_enabled = quest_finder_enabled.writer()
 
-    async def gardening_level(self) -> int:
-        return await self.read_value_from_offset(836, "unsigned char")
+    buddy_list_limit = MemoryField(848, "int")
+    write_buddy_list_limit = buddy_list_limit.writer()
 
-    async def write_gardening_level(self, gardening_level: int):
-        await self.write_value_to_offset(836, gardening_level, "unsigned char")
-
-    async def gardening_xp(self) -> int:
-        return await self.read_value_from_offset(840, "int")
-
-    async def write_gardening_xp(self, gardening_xp: int):
-        await self.write_value_to_offset(840, gardening_xp, "int")
-
-    async def invisible_to_friends(self) -> bool:
-        return await self.read_value_from_offset(844, "bool")
-
-    async def write_invisible_to_friends(self, invisible_to_friends: bool):
-        await self.write_value_to_offset(844, invisible_to_friends, "bool")
-
-    async def show_item_lock(self) -> bool:
-        return await self.read_value_from_offset(845, "bool")
-
-    async def write_show_item_lock(self, show_item_lock: bool):
-        await self.write_value_to_offset(845, show_item_lock, "bool")
-
-    async def quest_finder_enabled(self) -> bool:
-        return await self.read_value_from_offset(846, "bool")
-
-    async def write_quest_finder_enabled(self, quest_finder_enabled: bool):
-        await self.write_value_to_offset(846, quest_finder_enabled, "bool")
-
-    async def buddy_list_limit(self) -> int:
-        return await self.read_value_from_offset(848, "int")
-
-    async def write_buddy_list_limit(self, buddy_list_limit: int):
-        await self.write_value_to_offset(848, buddy_list_limit, "int")
-
-    async def dont_allow_friend_finder_codes(self) -> bool:
-        return await self.read_value_from_offset(856, "bool")
+    dont_allow_friend_finder_codes = MemoryField(856, "bool")
 
     async def write_dont_allow_friend_finder_codes(
         self, dont_allow_friend_finder_codes: bool
     ):
         await self.write_value_to_offset(856, dont_allow_friend_finder_codes, "bool")
 
-    async def stun_resistance_percent(self) -> float:
-        return await self.read_value_from_offset(852, "float")
+    stun_resistance_percent = MemoryField(852, "float")
+    write_stun_resistance_percent = stun_resistance_percent.writer()
 
-    async def write_stun_resistance_percent(self, stun_resistance_percent: float):
-        await self.write_value_to_offset(852, stun_resistance_percent, "float")
+    shadow_magic_unlocked = MemoryField(864, "bool")
+    write_shadow_magic_unlocked = shadow_magic_unlocked.writer()
 
-    async def shadow_magic_unlocked(self) -> bool:
-        return await self.read_value_from_offset(864, "bool")
+    shadow_pip_max = MemoryField(860, "int")
+    write_shadow_pip_max = shadow_pip_max.writer()
 
-    async def write_shadow_magic_unlocked(self, shadow_magic_unlocked: bool):
-        await self.write_value_to_offset(864, shadow_magic_unlocked, "bool")
+    fishing_level = MemoryField(865, "unsigned char")
+    write_fishing_level = fishing_level.writer()
 
-    async def shadow_pip_max(self) -> int:
-        return await self.read_value_from_offset(860, "int")
-
-    async def write_shadow_pip_max(self, shadow_pip_max: int):
-        await self.write_value_to_offset(860, shadow_pip_max, "int")
-
-    async def fishing_level(self) -> int:
-        return await self.read_value_from_offset(865, "unsigned char")
-
-    async def write_fishing_level(self, fishing_level: int):
-        await self.write_value_to_offset(865, fishing_level, "unsigned char")
-
-    async def fishing_xp(self) -> int:
-        return await self.read_value_from_offset(868, "int")
-
-    async def write_fishing_xp(self, fishing_xp: int):
-        await self.write_value_to_offset(868, fishing_xp, "int")
+    fishing_xp = MemoryField(868, "int")
+    write_fishing_xp = fishing_xp.writer()
 
     async def fishing_luck_bonus_percent(self) -> List[float]:
         return await self.read_dynamic_vector(544, "float")
@@ -493,43 +319,27 @@ class GameStats(PropertyClass):
     async def write_fishing_luck_bonus_percent(self, fishing_luck_bonus_percent: float):
         await self.write_value_to_offset(544, fishing_luck_bonus_percent, "float")
 
-    async def fishing_luck_bonus_percent_all(self) -> float:
-        return await self.read_value_from_offset(724, "float")
+    fishing_luck_bonus_percent_all = MemoryField(724, "float")
 
     async def write_fishing_luck_bonus_percent_all(
         self, fishing_luck_bonus_percent_all: float
     ):
         await self.write_value_to_offset(724, fishing_luck_bonus_percent_all, "float")
 
-    async def subscriber_benefit_flags(self) -> int:
-        return await self.read_value_from_offset(872, "unsigned int")
-
-    async def write_subscriber_benefit_flags(self, subscriber_benefit_flags: int):
-        await self.write_value_to_offset(872, subscriber_benefit_flags, "unsigned int")
+    subscriber_benefit_flags = MemoryField(872, "unsigned int")
+    write_subscriber_benefit_flags = subscriber_benefit_flags.writer()
 
-    async def elixir_benefit_flags(self) -> int:
-        return await self.read_value_from_offset(876, "unsigned int")
+    elixir_benefit_flags = MemoryField(876, "unsigned int")
+    write_elixir_benefit_flags = elixir_benefit_flags.writer()
 
-    async def write_elixir_benefit_flags(self, elixir_benefit_flags: int):
-        await self.write_value_to_offset(876, elixir_benefit_flags, "unsigned int")
+    shadow_pip_bonus_percent = MemoryField(772, "float")
+    write_shadow_pip_bonus_percent = shadow_pip_bonus_percent.writer()
 
-    async def shadow_pip_bonus_percent(self) -> float:
-        return await self.read_value_from_offset(772, "float")
+    wisp_bonus_percent = MemoryField(796, "float")
+    write_wisp_bonus_percent = wisp_bonus_percent.writer()
 
-    async def write_shadow_pip_bonus_percent(self, shadow_pip_bonus_percent: float):
-        await self.write_value_to_offset(772, shadow_pip_bonus_percent, "float")
-
-    async def wisp_bonus_percent(self) -> float:
-        return await self.read_value_from_offset(796, "float")
-
-    async def write_wisp_bonus_percent(self, wisp_bonus_percent: float):
-        await self.write_value_to_offset(796, wisp_bonus_percent, "float")
-
-    async def pip_conversion_rating_all(self) -> float:
-        return await self.read_value_from_offset(280, "float")
-
-    async def write_pip_conversion_rating_all(self, pip_conversion_rating_all: float):
-        await self.write_value_to_offset(280, pip_conversion_rating_all, "float")
+    pip_conversion_rating_all = MemoryField(280, "float")
+    write_pip_conversion_rating_all = pip_conversion_rating_all.writer()
 
     async def pip_conversion_rating_per_school(self) -> List[float]:
         return await self.read_dynamic_vector(256, "float")
@@ -539,11 +349,8 @@ class GameStats(PropertyClass):
     ):
         await self.write_value_to_offset(256, pip_conversion_rating_per_school, "float")
 
-    async def pip_conversion_percent_all(self) -> float:
-        return await self.read_value_from_offset(312, "float")
-
-    async def write_pip_conversion_percent_all(self, pip_conversion_percent_all: float):
-        await self.write_value_to_offset(312, pip_conversion_percent_all, "float")
+    pip_conversion_percent_all = MemoryField(312, "float")
+    write_pip_conversion_percent_all = pip_conversion_percent_all.writer()
 
     async def pip_conversion_percent_per_school(self) -> List[float]:
         return await self.read_dynamic_vector(288, "float")
@@ -555,48 +362,33 @@ class GameStats(PropertyClass):
             288, pip_conversion_percent_per_school, "float"
         )
 
-    async def monster_magic_level(self) -> int:
-        return await self.read_value_from_offset(880, "unsigned char")
+    monster_magic_level = MemoryField(880, "unsigned char")
+    write_monster_magic_level = monster_magic_level.writer()
 
-    async def write_monster_magic_level(self, monster_magic_level: int):
-        await self.write_value_to_offset(880, monster_magic_level, "unsigned char")
+    monster_magic_xp = MemoryField(884, "int")
+    write_monster_magic_xp = monster_magic_xp.writer()
 
-    async def monster_magic_xp(self) -> int:
-        return await self.read_value_from_offset(884, "int")
-
-    async def write_monster_magic_xp(self, monster_magic_xp: int):
-        await self.write_value_to_offset(884, monster_magic_xp, "int")
-
-    async def player_chat_channel_is_public(self) -> bool:
-        return await self.read_value_from_offset(888, "bool")
+    player_chat_channel_is_public = MemoryField(888, "bool")
 
     async def write_player_chat_channel_is_public(
         self, player_chat_channel_is_public: bool
     ):
         await self.write_value_to_offset(888, player_chat_channel_is_public, "bool")
 
-    async def extra_inventory_space(self) -> int:
-        return await self.read_value_from_offset(892, "int")
-
-    async def write_extra_inventory_space(self, extra_inventory_space: int):
-        await self.write_value_to_offset(892, extra_inventory_space, "int")
+    extra_inventory_space = MemoryField(892, "int")
+    write_extra_inventory_space = extra_inventory_space.writer()
 
-    async def remember_last_realm(self) -> bool:
-        return await self.read_value_from_offset(896, "bool")
+    remember_last_realm = MemoryField(896, "bool")
+    write_remember_last_realm = remember_last_realm.writer()
 
-    async def write_remember_last_realm(self, remember_last_realm: bool):
-        await self.write_value_to_offset(896, remember_last_realm, "bool")
-
-    async def new_spellbook_layout_warning(self) -> bool:
-        return await self.read_value_from_offset(897, "bool")
+    new_spellbook_layout_warning = MemoryField(897, "bool")
 
     async def write_new_spellbook_layout_warning(
         self, new_spellbook_layout_warning: bool
     ):
         await self.write_value_to_offset(897, new_spellbook_layout_warning, "bool")
 
-    async def pip_conversion_base_all_schools(self) -> int:
-        return await self.read_value_from_offset(736, "int")
+    pip_conversion_base_all_schools = MemoryField(736, "int")
 
     async def write_pip_conversion_base_all_schools(
         self, pip_conversion_base_all_schools: int
@@ -611,14 +403,10 @@ class GameStats(PropertyClass):
     ):
         await self.write_value_to_offset(744, pip_conversion_base_per_school, "int")
 
-    async def purchased_custom_emotes1(self) -> int:
-        return await self.read_value_from_offset(900, "unsigned int")
-
-    async def write_purchased_custom_emotes1(self, purchased_custom_emotes1: int):
-        await self.write_value_to_offset(900, purchased_custom_emotes1, "unsigned int")
+    purchased_custom_emotes1 = MemoryField(900, "unsigned int")
+    write_purchased_custom_emotes1 = purchased_custom_emotes1.writer()
 
-    async def purchased_custom_teleport_effects1(self) -> int:
-        return await self.read_value_from_offset(904, "unsigned int")
+    purchased_custom_teleport_effects1 = MemoryField(904, "unsigned int")
 
     async def write_purchased_custom_teleport_effects1(
         self, purchased_custom_teleport_effects1: int
@@ -627,40 +415,26 @@ class GameStats(PropertyClass):
             904, purchased_custom_teleport_effects1, "unsigned int"
         )
 
-    async def equipped_teleport_effect(self) -> int:
-        return await self.read_value_from_offset(908, "unsigned int")
-
-    async def write_equipped_teleport_effect(self, equipped_teleport_effect: int):
-        await self.write_value_to_offset(908, equipped_teleport_effect, "unsigned int")
+    equipped_teleport_effect = MemoryField(908, "unsigned int")
+    write_equipped_teleport_effect = equipped_teleport_effect.writer()
 
-    async def highest_world1_id(self) -> int:
-        return await self.read_value_from_offset(912, "unsigned int")
+    highest_world1_id = MemoryField(912, "unsigned int")
+    write_highest_world1_id = highest_world1_id.writer()
 
-    async def write_highest_world1_id(self, highest_world1_id: int):
-        await self.write_value_to_offset(912, highest_world1_id, "unsigned int")
+    highest_world2_id = MemoryField(916, "unsigned int")
+    write_highest_world2_id = highest_world2_id.writer()
 
-    async def highest_world2_id(self) -> int:
-        return await self.read_value_from_offset(916, "unsigned int")
-
-    async def write_highest_world2_id(self, highest_world2_i_d: int):
-        await self.write_value_to_offset(916, highest_world2_i_d, "unsigned int")
-
-    async def active_class_projects_list(self) -> int:
-        return await self.read_value_from_offset(920, "unsigned int")
+    active_class_projects_list = MemoryField(920, "unsigned int")
 
     async def write_active_class_projects_list(self, active_class_projects_list: int):
         await self.write_value_to_offset(
             920, active_class_projects_list, "unsigned int"
         )
 
-    async def disabled_item_slot_ids(self) -> int:
-        return await self.read_value_from_offset(936, "unsigned int")
-
-    async def write_disabled_item_slot_ids(self, disabled_item_slot_ids: int):
-        await self.write_value_to_offset(936, disabled_item_slot_ids, "unsigned int")
+    disabled_item_slot_ids = MemoryField(936, "unsigned int")
+    write_disabled_item_slot_ids = disabled_item_slot_ids.writer()
 
-    async def adventure_power_cooldown_time(self) -> int:
-        return await self.read_value_from_offset(952, "unsigned int")
+    adventure_power_cooldown_time = MemoryField(952, "unsigned int")
 
     async def write_adventure_power_cooldown_time(
         self, adventure_power_cooldown_time: int
@@ -669,14 +443,10 @@ class GameStats(PropertyClass):
             952, adventure_power_cooldown_time, "unsigned int"
         )
 
-    async def purchased_custom_emotes2(self) -> int:
-        return await self.read_value_from_offset(956, "unsigned int")
+    purchased_custom_emotes2 = MemoryField(956, "unsigned int")
+    write_purchased_custom_emotes2 = purchased_custom_emotes2.writer()
 
-    async def write_purchased_custom_emotes2(self, purchased_custom_emotes2: int):
-        await self.write_value_to_offset(956, purchased_custom_emotes2, "unsigned int")
-
-    async def purchased_custom_teleport_effects2(self) -> int:
-        return await self.read_value_from_offset(960, "unsigned int")
+    purchased_custom_teleport_effects2 = MemoryField(960, "unsigned int")
 
     async def write_purchased_custom_teleport_effects2(
         self, purchased_custom_teleport_effects2: int
@@ -685,14 +455,10 @@ class GameStats(PropertyClass):
             960, purchased_custom_teleport_effects2, "unsigned int"
         )
 
-    async def purchased_custom_emotes3(self) -> int:
-        return await self.read_value_from_offset(964, "unsigned int")
-
-    async def write_purchased_custom_emotes3(self, purchased_custom_emotes3: int):
-        await self.write_value_to_offset(964, purchased_custom_emotes3, "unsigned int")
+    purchased_custom_emotes3 = MemoryField(964, "unsigned int")
+    write_purchased_custom_emotes3 = purchased_custom_emotes3.writer()
 
-    async def purchased_custom_teleport_effects3(self) -> int:
-        return await self.read_value_from_offset(968, "unsigned int")
+    purchased_custom_teleport_effects3 = MemoryField(968, "unsigned int")
 
     async def write_purchased_custom_teleport_effects3(
         self, purchased_custom_teleport_effects3: int
@@ -701,73 +467,42 @@ class GameStats(PropertyClass):
             968, purchased_custom_teleport_effects3, "unsigned int"
         )
 
-    async def shadow_pip_rating(self) -> float:
-        return await self.read_value_from_offset(972, "float")
+    shadow_pip_rating = MemoryField(972, "float")
+    write_shadow_pip_rating = shadow_pip_rating.writer()
 
-    async def write_shadow_pip_rating(self, shadow_pip_rating: float):
-        await self.write_value_to_offset(972, shadow_pip_rating, "float")
+    bonus_shadow_pip_rating = MemoryField(976, "float")
+    write_bonus_shadow_pip_rating = bonus_shadow_pip_rating.writer()
 
-    async def bonus_shadow_pip_rating(self) -> float:
-        return await self.read_value_from_offset(976, "float")
-
-    async def write_bonus_shadow_pip_rating(self, bonus_shadow_pip_rating: float):
-        await self.write_value_to_offset(976, bonus_shadow_pip_rating, "float")
-
-    async def shadow_pip_rate_accumulated(self) -> float:
-        return await self.read_value_from_offset(980, "float")
+    shadow_pip_rate_accumulated = MemoryField(980, "float")
 
     async def write_shadow_pip_rate_accumulated(
         self, shadow_pip_rate_accumulated: float
     ):
         await self.write_value_to_offset(980, shadow_pip_rate_accumulated, "float")
 
-    async def shadow_pip_rate_threshold(self) -> float:
-        return await self.read_value_from_offset(984, "float")
-
-    async def write_shadow_pip_rate_threshold(self, shadow_pip_rate_threshold: float):
-        await self.write_value_to_offset(984, shadow_pip_rate_threshold, "float")
-
-    async def shadow_pip_rate_percentage(self) -> int:
-        return await self.read_value_from_offset(988, "int")
-
-    async def write_shadow_pip_rate_percentage(self, shadow_pip_rate_percentage: int):
-        await self.write_value_to_offset(988, shadow_pip_rate_percentage, "int")
-
-    async def friendly_player(self) -> bool:
-        return await self.read_value_from_offset(992, "bool")
-
-    async def write_friendly_player(self, friendly_player: bool):
-        await self.write_value_to_offset(992, friendly_player, "bool")
-
-    async def emoji_skin_tone(self) -> int:
-        return await self.read_value_from_offset(996, "int")
-
-    async def write_emoji_skin_tone(self, emoji_skin_tone: int):
-        await self.write_value_to_offset(996, emoji_skin_tone, "int")
-
-    async def show_pvp_option(self) -> int:
-        return await self.read_value_from_offset(1000, "unsigned int")
+    shadow_pip_rate_threshold = MemoryField(984, "float")
+    write_shadow_pip_rate_threshold = shadow_pip_rate_threshold.writer()
 
-    async def write_show_pvp_option(self, show_pvp_option: int):
-        await self.write_value_to_offset(1000, show_pvp_option, "unsigned int")
+    shadow_pip_rate_percentage = MemoryField(988, "int")
+    write_shadow_pip_rate_percentage = shadow_pip_rate_percentage.writer()
 
-    async def favorite_slot(self) -> int:
-        return await self.read_value_from_offset(1004, "int")
+    friendly_player = MemoryField(992, "bool")
+    write_friendly_player = friendly_player.writer()
 
-    async def write_favorite_slot(self, favorite_slot: int):
-        await self.write_value_to_offset(1004, favorite_slot, "int")
+    emoji_skin_tone = MemoryField(996, "int")
+    write_emoji_skin_tone = emoji_skin_tone.writer()
 
-    async def cantrip_level(self) -> int:
-        return await self.read_value_from_offset(1008, "unsigned char")
+    show_pvp_option = MemoryField(1000, "unsigned int")
+    write_show_pvp_option = show_pvp_option.writer()
 
-    async def write_cantrip_level(self, cantrip_level: int):
-        await self.write_value_to_offset(1008, cantrip_level, "unsigned char")
+    favorite_slot = MemoryField(1004, "int")
+    write_favorite_slot = favorite_slot.writer()
 
-    async def cantrip_xp(self) -> int:
-        return await self.read_value_from_offset(1012, "int")
+    cantrip_level = MemoryField(1008, "unsigned char")
+    write_cantrip_level = cantrip_level.writer()
 
-    async def write_cantrip_xp(self, cantrip_xp: int):
-        await self.write_value_to_offset(1012, cantrip_xp, "int")
+    cantrip_xp = MemoryField(1012, "int")
+    write_cantrip_xp = cantrip_xp.writer()
 
 
 class CurrentGameStats(GameStats):
@@ -776,4 +511,4 @@ class CurrentGameStats(GameStats):
 
 
 class DynamicGameStats(DynamicMemoryObject, GameStats):
-    pass
+    __slots__ = ()
@@ -3,6 +3,8 @@ from wizwalker.memory.memory_objects.scene_manager import DynamicSceneManager
 
 
 class GamebryoPresenter(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -58,4 +60,4 @@ class GamebryoPresenter(MemoryObject):
 
 
 class DynamicGamebryoPresenter(DynamicMemoryObject, GamebryoPresenter):
-    pass
+    __slots__ = ()
@@ -4,6 +4,8 @@ from wizwalker.memory.memory_object import PropertyClass, DynamicMemoryObject
 
 
 class PlayDeck(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -23,10 +25,12 @@ class PlayDeck(PropertyClass):
 
 
 class DynamicPlayDeck(DynamicMemoryObject, PlayDeck):
-    pass
+    __slots__ = ()
 
 
 class PlaySpellData(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -38,4 +42,4 @@ class PlaySpellData(PropertyClass):
 
 
 class DynamicPlaySpellData(DynamicMemoryObject, PlaySpellData):
-    pass
+    __slots__ = ()
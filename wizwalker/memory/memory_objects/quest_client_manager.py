@@ -4,6 +4,8 @@ from wizwalker.memory.memory_object import MemoryObject, DynamicMemoryObject
 
 
 class QuestClientManager(MemoryObject):
+    __slots__ = ()
+
     async def quest_data_mapping(self) -> dict:
         pass
 
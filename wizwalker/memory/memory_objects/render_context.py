@@ -2,6 +2,8 @@ from wizwalker.memory.memory_object import MemoryObject
 
 
 class RenderContext(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -2,6 +2,8 @@ from wizwalker.memory.memory_object import MemoryObject, DynamicMemoryObject
 from .enums import FogMode
 
 class SceneManager(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -61,4 +63,4 @@ class SceneManager(MemoryObject):
 
 
 class DynamicSceneManager(DynamicMemoryObject, SceneManager):
-    pass
+    __slots__ = ()
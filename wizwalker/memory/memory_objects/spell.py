@@ -14,6 +14,8 @@ class RankStruct:
 
 
 class Spell(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -179,19 +181,23 @@ class Spell(PropertyClass):
 
 
 class GraphicalSpell(Spell):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
 
 class DynamicSpell(DynamicMemoryObject, Spell):
-    pass
+    __slots__ = ()
 
 
 class DynamicGraphicalSpell(DynamicMemoryObject, GraphicalSpell):
-    pass
+    __slots__ = ()
 
 
 class Hand(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -204,4 +210,4 @@ class Hand(PropertyClass):
 
 
 class DynamicHand(DynamicMemoryObject, Hand):
-    pass
+    __slots__ = ()
@@ -5,6 +5,8 @@ from .enums import SpellEffects, EffectTarget, HangingDisposition
 
 
 class SpellEffect(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -152,4 +154,4 @@ class SpellEffect(PropertyClass):
 
 
 class DynamicSpellEffect(DynamicMemoryObject, SpellEffect):
-    pass
+    __slots__ = ()
@@ -6,6 +6,8 @@ from .spell_effect import DynamicSpellEffect
 
 
 class SpellTemplate(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -300,4 +302,4 @@ class SpellTemplate(PropertyClass):
 
 
 class DynamicSpellTemplate(DynamicMemoryObject, SpellTemplate):
-    pass
+    __slots__ = ()
@@ -3,6 +3,8 @@ from wizwalker.memory.memory_object import MemoryObject
 
 
 class TeleportHelper(MemoryObject):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         return await self.hook_handler.read_teleport_helper()
 
@@ -1,6 +1,6 @@
+import asyncio
 import struct
-from typing import Callable, List, Optional
-from contextlib import suppress
+from typing import Callable, List, Optional, Tuple
 
 from loguru import logger
 
@@ -13,6 +13,8 @@ from wizwalker import AddressOutOfRange, MemoryReadError, Rectangle, utils, type
 
 # TODO: Window.click
 class Window(PropertyClass):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -39,54 +41,137 @@ class Window(PropertyClass):
 
         return rect.scale_to_client(parent_rects, ui_scale)
 
-    async def get_windows_with_type(self, type_name: str) -> List["DynamicWindow"]:
+    async def get_windows_with_type(self, type_name: str, **kwargs) -> List["DynamicWindow"]:
+        """
+        Get child windows with a type name
+        kwargs are passed to get_windows_with_predicate
+        """
         async def _pred(window):
-            return await window.maybe_read_type_name() == type_name
+            try:
+                return await window.maybe_read_type_name() == type_name
+            except (ValueError, MemoryReadError, AddressOutOfRange):
+                return False
 
-        return await self.get_windows_with_predicate(_pred)
+        return await self.get_windows_with_predicate(_pred, **kwargs)
 
-    async def get_windows_with_name(self, name: str) -> List["DynamicWindow"]:
+    async def get_windows_with_name(self, name: str, **kwargs) -> List["DynamicWindow"]:
+        """
+        Get child windows with a name
+        kwargs are passed to get_windows_with_predicate
+        """
         async def _pred(window):
-            return await window.name() == name
+            try:
+                return await window.name() == name
+            except (ValueError, MemoryReadError, AddressOutOfRange):
+                return False
 
-        return await self.get_windows_with_predicate(_pred)
+        return await self.get_windows_with_predicate(_pred, **kwargs)
+
+    @staticmethod
+    async def _maybe_children(window: "Window") -> List["DynamicWindow"]:
+        try:
+            return await window.children()
+        except (ValueError, MemoryReadError, AddressOutOfRange):
+            return []
 
-    async def _recursive_get_windows_by_predicate(self, predicate, windows):
-        with suppress(ValueError, MemoryReadError, AddressOutOfRange):
-            for child in await self.children():
-                if await predicate(child):
-                    windows.append(child)
+    @staticmethod
+    async def _maybe_visible(window: "Window") -> bool:
+        try:
+            return await window.is_visible()
+        except (ValueError, MemoryReadError, AddressOutOfRange):
+            return False
 
-                await child._recursive_get_windows_by_predicate(predicate, windows)
+    @staticmethod
+    def _tree_order_key(path: Tuple[int, ...]) -> tuple:
+        # direct children come first, then every deeper window in depth first order
+        return len(path) != 1, path
 
     async def get_windows_with_predicate(
-        self, predicate: Callable
+        self,
+        predicate: Callable,
+        *,
+        find_first: bool = False,
+        max_depth: Optional[int] = None,
+        visible_only: bool = False,
     ) -> List["DynamicWindow"]:
         """
-        async def my_pred(window) -> bool:
-            if await window.name() == "friend's list":
-              return True
+        Get child windows that match a predicate
 
-            return False
+        The tree is searched a level at a time; every window of a level has
+        its children and the predicate read together. Matches are returned in
+        the order a depth first search finds them: direct children first, then
+        the windows below each child
+
+        Examples:
+            .. code-block:: py
+
+                async def my_pred(window) -> bool:
+                  if await window.name() == "friend's list":
+                    return True
+
+                  return False
+
+                await client.root_window.get_windows_with_predicate(my_pred)
+
+        Args:
+            predicate: Awaitable that returns True or False on if to add a window
 
-        await client.root_window.get_windows_by_predicate(my_pred)
+        Keyword Args:
+            find_first: Stop searching once the first match is known
+            max_depth: How many levels below this window to search or None for all
+            visible_only: Skip invisible windows and everything below them
+
+        Returns:
+            The matching windows
         """
-        windows = []
+        # (order key, window)
+        matches = []
 
-        # check our own children
-        try:
-            children = await self.children()
-        except (ValueError, MemoryReadError, AddressOutOfRange):
+        # windows are paired with their child index path from this window
+        level = [((), self)]
+        depth = 0
+        while level and (max_depth is None or depth < max_depth):
             children = []
+            for (path, _), window_children in zip(
+                level,
+                await asyncio.gather(*(self._maybe_children(window) for _, window in level)),
+            ):
+                children += [
+                    ((*path, index), child) for index, child in enumerate(window_children)
+                ]
+
+            if visible_only:
+                visible = await asyncio.gather(
+                    *(self._maybe_visible(child) for _, child in children)
+                )
+                children = [
+                    child for child, is_visible in zip(children, visible) if is_visible
+                ]
 
-        for child in children:
-            if await predicate(child):
-                windows.append(child)
+            matched = await asyncio.gather(*(predicate(child) for _, child in children))
+            for (path, child), is_match in zip(children, matched):
+                if is_match:
+                    matches.append((self._tree_order_key(path), child))
 
-        for child in children:
-            await child._recursive_get_windows_by_predicate(predicate, windows)
+            if find_first and matches:
+                first_key = min(key for key, _ in matches)
 
-        return windows
+                # a direct child can't be beaten
+                if not first_key[0]:
+                    break
+
+                # only windows before the first match can have an earlier one below them
+                children = [(path, child) for path, child in children if path < first_key[1]]
+
+            level = children
+            depth += 1
+
+        matches.sort(key=lambda match: match[0])
+
+        if find_first:
+            return [window for _, window in matches[:1]]
+
+        return [window for _, window in matches]
 
     async def get_parents(self) -> List["DynamicWindow"]:
         parents = []
@@ -278,6 +363,8 @@ class Window(PropertyClass):
 
 
 class DeckListControlSpellEntry(DynamicMemoryObject):
+    __slots__ = ()
+
     async def graphical_spell(self) -> Optional[DynamicGraphicalSpell]:
         addr = await self.read_value_from_offset(0, "unsigned long long")
 
@@ -288,6 +375,8 @@ class DeckListControlSpellEntry(DynamicMemoryObject):
 
 
 class SpellListControlSpellEntry(DynamicMemoryObject):
+    __slots__ = ()
+
     async def graphical_spell(self) -> Optional[DynamicGraphicalSpell]:
         addr = await self.read_value_from_offset(0, "unsigned long long")
 
@@ -320,6 +409,8 @@ class SpellListControlSpellEntry(DynamicMemoryObject):
 
 
 class DeckListControl(Window):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -340,6 +431,8 @@ class DeckListControl(Window):
 
 
 class SpellListControl(Window):
+    __slots__ = ()
+
     async def read_base_address(self) -> int:
         raise NotImplementedError()
 
@@ -354,15 +447,15 @@ class SpellListControl(Window):
 
 
 class DynamicWindow(DynamicMemoryObject, Window):
-    pass
+    __slots__ = ()
 
 
 class DynamicDeckListControl(DynamicWindow, DeckListControl):
-    pass
+    __slots__ = ()
 
 
 class DynamicSpellListControl(DynamicWindow, SpellListControl):
-    pass
+    __slots__ = ()
 
 
 class CurrentRootWindow(Window):
@@ -2,11 +2,15 @@ import asyncio
 import functools
 import regex
 import struct
-from typing import Any, Union
+import os
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import pefile
 import pymem
 import pymem.exception
+import pymem.memory
 import pymem.process
 import pymem.ressources.structure
 
@@ -20,6 +24,61 @@ from wizwalker import (
     type_format_dict,
     utils,
 )
+from .module_mirror import ModuleMirror, get_module_mirror
+from .pattern_cache import get_pattern_cache
+from .io_worker import get_io_worker
+from .read_coalescer import get_read_coalescer
+from .read_snapshot import get_active_snapshot, read_snapshot
+
+
+# precompiled so read_typed doesn't parse formats on every call
+type_struct_dict = {
+    data_type: struct.Struct(type_format)
+    for data_type, type_format in type_format_dict.items()
+}
+
+
+# regions are split into chunks of this size for scanning
+SCAN_CHUNK_SIZE = 0x100000
+# extra bytes read past each chunk so matches crossing chunks aren't missed;
+# patterns longer than this can be missed at chunk boundaries
+SCAN_CHUNK_OVERLAP = 0x1000
+
+# shared by every reader so scans from many clients share one bounded pool
+_scan_executor = None
+_scan_executor_workers = min(32, (os.cpu_count() or 1) + 4)
+
+
+def set_scan_workers(workers: int):
+    """
+    Set how many threads pattern scans are split across; scans already
+    running finish on the old threads, which exit once they're done
+
+    Args:
+        workers: The number of worker threads
+    """
+    global _scan_executor, _scan_executor_workers
+
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    # running scans hold the old executor; its threads exit when it's collected
+    _scan_executor = None
+    _scan_executor_workers = workers
+
+
+def get_scan_executor() -> ThreadPoolExecutor:
+    """
+    Get the executor pattern scans are run in
+    """
+    global _scan_executor
+
+    if _scan_executor is None:
+        _scan_executor = ThreadPoolExecutor(
+            max_workers=_scan_executor_workers, thread_name_prefix="wizwalker-scan"
+        )
+
+    return _scan_executor
 
 
 class MemoryReader:
@@ -27,11 +86,15 @@ class MemoryReader:
     Represents anything that needs to read/write from/to memory
     """
 
+    __slots__ = ("process",)
+
+    # file path -> exported symbols; exports don't depend on the process so
+    # every reader shares one table
+    _symbol_table: Dict[str, Dict[str, int]] = {}
+
     def __init__(self, process: pymem.Pymem):
         self.process = process
 
-        self._symbol_table = {}
-
     # TODO: 2.0 make this a property
     def is_running(self) -> bool:
         """
@@ -54,6 +117,24 @@ class MemoryReader:
 
         return await loop.run_in_executor(None, function)
 
+    def snapshot(self, *, page_size: int = 0x1000):
+        """
+        Async context manager that serves reads from whole pages read once
+        so every read in the scope sees the same state; writes go through
+        and drop the pages they touch
+
+        Examples:
+            .. code-block:: py
+
+                async with client.snapshot():
+                    health = await member.health()
+                    max_health = await member.max_health()
+
+        Keyword Args:
+            page_size: How many bytes to read at a time, must be a power of 2
+        """
+        return read_snapshot(self.process.process_id, page_size=page_size)
+
     def _get_symbols(self, file_path: str, *, force_reload: bool = False):
         if (dll_table := self._symbol_table.get(file_path)) and not force_reload:
             return dll_table
@@ -74,67 +155,233 @@ class MemoryReader:
         return symbols
 
     @staticmethod
-    def _scan_page_return_all(handle, address, pattern):
-        mbi = pymem.memory.virtual_query(handle, address)
-        next_region = mbi.BaseAddress + mbi.RegionSize
+    def _get_scan_regions(handle: int, start: int, end: int) -> List[Tuple[int, int]]:
         allowed_protections = [
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_EXECUTE_READ,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_EXECUTE_READWRITE,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_READWRITE,
             pymem.ressources.structure.MEMORY_PROTECTION.PAGE_READONLY,
         ]
-        if (
-            mbi.state != pymem.ressources.structure.MEMORY_STATE.MEM_COMMIT
-            or mbi.protect not in allowed_protections
-        ):
-            return next_region, None
 
-        page_bytes = pymem.memory.read_bytes(handle, address, mbi.RegionSize)
+        regions = []
+        address = start
+        while address < end:
+            mbi = pymem.memory.virtual_query(handle, address)
+            if (
+                mbi.state == pymem.ressources.structure.MEMORY_STATE.MEM_COMMIT
+                and mbi.protect in allowed_protections
+            ):
+                regions.append((address, mbi.RegionSize))
 
-        found = []
+            address = mbi.BaseAddress + mbi.RegionSize
 
-        for match in regex.finditer(pattern, page_bytes, regex.DOTALL):
-            found_address = address + match.span()[0]
-            found.append(found_address)
+        return regions
 
-        return next_region, found
+    @staticmethod
+    def _split_scan_regions(
+        regions: List[Tuple[int, int]], chunk_size: int, overlap: int
+    ) -> List[Tuple[int, int, int, int]]:
+        # (region index, address, size, read size); chunks read overlap extra bytes
+        # so matches crossing a chunk boundary are still found by the earlier chunk
+        chunks = []
+        for region_index, (region_address, region_size) in enumerate(regions):
+            for offset in range(0, region_size, chunk_size):
+                size = min(chunk_size, region_size - offset)
+                read_size = min(size + overlap, region_size - offset)
+                chunks.append((region_index, region_address + offset, size, read_size))
+
+        return chunks
 
-    def _scan_all(
-        self,
+    @staticmethod
+    def _read_scan_chunk(
+        handle: int, address: int, size: int, mirror: Optional[ModuleMirror]
+    ) -> Optional[bytes]:
+        if mirror is not None and (chunk_bytes := mirror.read(address, size)) is not None:
+            return chunk_bytes
+
+        try:
+            return pymem.memory.read_bytes(handle, address, size)
+        # region was freed after it was queried
+        except pymem.exception.WinAPIError:
+            return None
+
+    @classmethod
+    def _scan_chunk(
+        cls,
         handle: int,
+        address: int,
+        size: int,
+        read_size: int,
         pattern: bytes,
-        return_multiple: bool = False,
-    ):
-        next_region = 0
+        mirror: Optional[ModuleMirror] = None,
+    ) -> List[Tuple[int, int]]:
+        chunk_bytes = cls._read_scan_chunk(handle, address, read_size, mirror)
 
-        found = []
-        while next_region < 0x7FFFFFFF0000:
-            next_region, page_found = self._scan_page_return_all(
-                handle, next_region, pattern
-            )
-            if page_found:
-                found += page_found
+        if chunk_bytes is None:
+            return []
 
-            if not return_multiple and found:
-                break
+        found = []
+        # concurrent releases the gil so chunks are really scanned in parallel
+        for match in regex.finditer(pattern, chunk_bytes, regex.DOTALL, concurrent=True):
+            # matches starting in the overlap belong to the next chunk
+            if match.start() < size:
+                found.append((address + match.start(), match.end() - match.start()))
 
         return found
 
-    def _scan_entire_module(self, handle, module, pattern):
-        base_address = module.lpBaseOfDll
-        max_address = module.lpBaseOfDll + module.SizeOfImage
-        page_address = base_address
+    @classmethod
+    def _scan_chunk_for_pointers(
+        cls,
+        handle: int,
+        address: int,
+        size: int,
+        pointers: frozenset,
+        mirror: Optional[ModuleMirror] = None,
+    ) -> List[Tuple[int, int]]:
+        chunk_bytes = cls._read_scan_chunk(handle, address, size, mirror)
+
+        if chunk_bytes is None:
+            return []
+
+        # one hashed pass over the chunk's aligned values; only the pointers
+        # actually present are searched for
+        values = memoryview(chunk_bytes)[:size - size % 8].cast("Q")
+        present = pointers.intersection(values)
 
         found = []
-        while page_address < max_address:
-            page_address, page_found = self._scan_page_return_all(
-                handle, page_address, pattern
-            )
-            if page_found:
-                found += page_found
+        for pointer in present:
+            pointer_bytes = struct.pack("<Q", pointer)
+            position = chunk_bytes.find(pointer_bytes)
+            while position != -1:
+                if position % 8 == 0:
+                    found.append((pointer, address + position))
+
+                position = chunk_bytes.find(pointer_bytes, position + 1)
 
         return found
 
+    async def _scan_regions(
+        self, regions: List[Tuple[int, int]], pattern: bytes, return_multiple: bool
+    ) -> List[Tuple[int, int]]:
+        # returns (address, match length) pairs
+        loop = asyncio.get_event_loop()
+        # captured once so set_scan_workers can't change them mid scan
+        executor = get_scan_executor()
+        wave_size = _scan_executor_workers
+        handle = self.process.process_handle
+        mirror = get_module_mirror(self.process)
+
+        chunks = self._split_scan_regions(regions, SCAN_CHUNK_SIZE, SCAN_CHUNK_OVERLAP)
+
+        def _submit(chunk):
+            _, address, size, read_size = chunk
+            return loop.run_in_executor(
+                executor,
+                self._scan_chunk,
+                handle,
+                address,
+                size,
+                read_size,
+                pattern,
+                mirror,
+            )
+
+        if return_multiple:
+            results = await asyncio.gather(*(_submit(chunk) for chunk in chunks))
+            return [match for chunk_found in results for match in chunk_found]
+
+        # without return_multiple only the first region with results is used
+        # so chunks are scanned a wave at a time to stop early
+        for wave_start in range(0, len(chunks), wave_size):
+            wave = chunks[wave_start:wave_start + wave_size]
+            results = await asyncio.gather(*(_submit(chunk) for chunk in wave))
+
+            found_regions = [
+                chunk[0] for chunk, chunk_found in zip(wave, results) if chunk_found
+            ]
+            if not found_regions:
+                continue
+
+            first_region = min(found_regions)
+
+            found = []
+            for chunk, chunk_found in zip(wave, results):
+                if chunk[0] == first_region:
+                    found += chunk_found
+
+            # the region can continue past this wave
+            rest = [
+                chunk
+                for chunk in chunks[wave_start + wave_size:]
+                if chunk[0] == first_region
+            ]
+            for chunk_found in await asyncio.gather(*(_submit(chunk) for chunk in rest)):
+                found += chunk_found
+
+            return found
+
+        return []
+
+    async def _get_module_key(self, module_name: str, module_object) -> str:
+        base_address = module_object.lpBaseOfDll
+        nt_headers_offset = await self.read_typed(base_address + 0x3C, "unsigned int")
+        timestamp = await self.read_typed(
+            base_address + nt_headers_offset + 8, "unsigned int"
+        )
+
+        return f"{module_name.lower()}-{timestamp:x}-{module_object.SizeOfImage:x}"
+
+    async def _scan_module_cached(
+        self, module_name: str, module_object, pattern: bytes
+    ) -> List[int]:
+        base_address = module_object.lpBaseOfDll
+        pattern_cache = get_pattern_cache()
+
+        if not pattern_cache.enabled:
+            return await self._scan_module(module_object, pattern)
+
+        module_key = await self._get_module_key(module_name, module_object)
+
+        # other clients of the same build wait on one scan instead of repeating it
+        async with pattern_cache.lock(module_key, pattern):
+            if (cached := pattern_cache.get(module_key, pattern)) is not None:
+                cached_bytes = await asyncio.gather(
+                    *(
+                        self.read_bytes(base_address + offset, length)
+                        for offset, length in cached
+                    )
+                )
+
+                # hooks or a patch that kept the timestamp could have changed them
+                if all(
+                    regex.fullmatch(pattern, data, regex.DOTALL)
+                    for data in cached_bytes
+                ):
+                    return [base_address + offset for offset, _ in cached]
+
+            found = await self._scan_module(module_object, pattern)
+
+            if found:
+                await pattern_cache.set(
+                    module_key,
+                    pattern,
+                    [(address - base_address, length) for address, length in found],
+                )
+
+        return [address for address, _ in found]
+
+    async def _scan_module(self, module_object, pattern: bytes) -> List[Tuple[int, int]]:
+        base_address = module_object.lpBaseOfDll
+
+        regions = await self.run_in_executor(
+            self._get_scan_regions,
+            self.process.process_handle,
+            base_address,
+            base_address + module_object.SizeOfImage,
+        )
+        # modules have every result collected
+        return await self._scan_regions(regions, pattern, True)
+
     async def pattern_scan(
         self, pattern: bytes, *, module: str = None, return_multiple: bool = False
     ) -> Union[list, int]:
@@ -159,22 +406,14 @@ class MemoryReader:
             if module_object is None:
                 raise ValueError(f"{module} module not found.")
 
-            # this can take a long time to run when collecting multiple results
-            # so must be run in an executor
-            found_addresses = await self.run_in_executor(
-                self._scan_entire_module,
-                self.process.process_handle,
-                module_object,
-                pattern,
-            )
+            found_addresses = await self._scan_module_cached(module, module_object, pattern)
 
         else:
-            found_addresses = await self.run_in_executor(
-                self._scan_all,
-                self.process.process_handle,
-                pattern,
-                return_multiple,
+            regions = await self.run_in_executor(
+                self._get_scan_regions, self.process.process_handle, 0, 0x7FFFFFFF0000
             )
+            found = await self._scan_regions(regions, pattern, return_multiple)
+            found_addresses = [address for address, _ in found]
 
         if (found_length := len(found_addresses)) == 0:
             raise PatternFailed(pattern)
@@ -185,6 +424,68 @@ class MemoryReader:
         else:
             return found_addresses[0]
 
+    async def scan_for_pointers(
+        self, pointers: Iterable[int], *, module: str = None
+    ) -> Dict[int, List[int]]:
+        """
+        Find every 8 byte aligned occurrence of many pointers in one pass
+
+        Args:
+            pointers: The pointer values to search for
+            module: What module to search or None to search all
+
+        Returns:
+            A dict of pointer to the addresses it was found at; pointers
+            that weren't found aren't included
+        """
+        pointers = frozenset(pointers)
+        found = defaultdict(list)
+
+        if not pointers:
+            return found
+
+        if module:
+            module_object = pymem.process.module_from_name(self.process.process_handle, module)
+
+            if module_object is None:
+                raise ValueError(f"{module} module not found.")
+
+            start = module_object.lpBaseOfDll
+            end = module_object.lpBaseOfDll + module_object.SizeOfImage
+
+        else:
+            start = 0
+            end = 0x7FFFFFFF0000
+
+        handle = self.process.process_handle
+        mirror = get_module_mirror(self.process)
+        regions = await self.run_in_executor(self._get_scan_regions, handle, start, end)
+        # values are aligned so chunks don't need to overlap
+        chunks = self._split_scan_regions(regions, SCAN_CHUNK_SIZE, 0)
+
+        loop = asyncio.get_event_loop()
+        executor = get_scan_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    self._scan_chunk_for_pointers,
+                    handle,
+                    address,
+                    size,
+                    pointers,
+                    mirror,
+                )
+                for _, address, size, _ in chunks
+            )
+        )
+
+        for chunk_found in results:
+            for pointer, address in chunk_found:
+                found[pointer].append(address)
+
+        return found
+
     async def get_address_from_symbol(
         self,
         module_name: str,
@@ -276,7 +577,22 @@ class MemoryReader:
         if not 0 < address <= 0x7FFFFFFFFFFFFFFF:
             raise AddressOutOfRange(address)
 
+        # read-only module sections can be served locally
+        if (mirror := get_module_mirror(self.process)) is not None:
+            if (mirrored := mirror.read(address, size)) is not None:
+                return mirrored
+
         try:
+            if (snapshot := get_active_snapshot(self.process.process_id)) is not None:
+                return snapshot.read(self.process, address, size)
+
+            # the worker merges reads too so it replaces the coalescer
+            if (io_worker := get_io_worker(self.process.process_id)) is not None:
+                return await io_worker.read(address, size)
+
+            if (coalescer := get_read_coalescer(self.process.process_id)) is not None:
+                return await coalescer.read(address, size)
+
             return self.process.read_bytes(address, size)
         except pymem.exception.MemoryReadError:
             # we don't want to run is running for every read
@@ -297,7 +613,11 @@ class MemoryReader:
         size = len(value)
 
         try:
-            self.process.write_bytes(address, value, size)
+            if (io_worker := get_io_worker(self.process.process_id)) is not None:
+                await io_worker.write(address, value)
+
+            else:
+                self.process.write_bytes(address, value, size)
         except pymem.exception.MemoryWriteError:
             # see read_bytes
             if not self.is_running():
@@ -305,6 +625,14 @@ class MemoryReader:
             else:
                 raise MemoryWriteError(address)
 
+        # later reads in the scope have to see the write
+        if (snapshot := get_active_snapshot(self.process.process_id)) is not None:
+            snapshot.invalidate(address, size)
+
+        # keep mirrored code matching what was just patched
+        if (mirror := get_module_mirror(self.process)) is not None:
+            mirror.write(address, value)
+
     async def read_typed(self, address: int, data_type: str) -> Any:
         """
         Read typed bytes from memory
@@ -316,12 +644,12 @@ class MemoryReader:
         Returns:
             The converted data type
         """
-        type_format = type_format_dict.get(data_type)
-        if type_format is None:
+        type_struct = type_struct_dict.get(data_type)
+        if type_struct is None:
             raise ValueError(f"{data_type} is not a valid data type")
 
-        data = await self.read_bytes(address, struct.calcsize(type_format))
-        return struct.unpack(type_format, data)[0]
+        data = await self.read_bytes(address, type_struct.size)
+        return type_struct.unpack(data)[0]
 
     async def write_typed(self, address: int, value: Any, data_type: str):
         """
@@ -332,9 +660,9 @@ class MemoryReader:
             value: The value to convert and then write
             data_type: The data type to convert to
         """
-        type_format = type_format_dict.get(data_type)
-        if type_format is None:
+        type_struct = type_struct_dict.get(data_type)
+        if type_struct is None:
             raise ValueError(f"{data_type} is not a valid data type")
 
-        packed_data = struct.pack(type_format, value)
+        packed_data = type_struct.pack(value)
         await self.write_bytes(address, packed_data)
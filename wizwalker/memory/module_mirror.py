@@ -0,0 +1,153 @@
+import struct
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import pymem
+
+# sections with this characteristic can change at runtime
+IMAGE_SCN_MEM_WRITE = 0x80000000
+
+_section_header_struct = struct.Struct("<8sIIIIIIHHI")
+
+
+class ModuleMirror:
+    """
+    A local copy of a module's read-only sections
+
+    Reads that fall inside a mirrored section are served from the copy; writes
+    made through a MemoryReader (i.e. hooks) are applied to it so it keeps
+    matching the process
+
+    Args:
+        sections: Mapping of section start address to its bytes
+    """
+
+    def __init__(self, sections: Dict[int, bytearray]):
+        self._starts: List[int] = sorted(sections)
+        self._sections: List[bytearray] = [sections[start] for start in self._starts]
+
+    def __len__(self):
+        return sum(len(section) for section in self._sections)
+
+    def _find_section(self, address: int, size: int) -> Optional[int]:
+        index = bisect_right(self._starts, address) - 1
+
+        if index < 0:
+            return None
+
+        if address + size > self._starts[index] + len(self._sections[index]):
+            return None
+
+        return index
+
+    def read(self, address: int, size: int) -> Optional[bytes]:
+        """
+        Read from the mirror
+
+        Args:
+            address: The address to read from
+            size: The number of bytes to read
+
+        Returns:
+            The bytes or None if the range isn't entirely mirrored
+        """
+        index = self._find_section(address, size)
+
+        if index is None:
+            return None
+
+        offset = address - self._starts[index]
+        return bytes(self._sections[index][offset:offset + size])
+
+    def write(self, address: int, value: bytes):
+        """
+        Apply a write made to the process to any mirrored bytes it overlaps
+
+        Args:
+            address: The address that was written to
+            value: The bytes that were written
+        """
+        end = address + len(value)
+
+        for start, section in zip(self._starts, self._sections):
+            section_end = start + len(section)
+            if end <= start or address >= section_end:
+                continue
+
+            write_start = max(address, start)
+            write_end = min(end, section_end)
+            section[write_start - start:write_end - start] = value[
+                write_start - address:write_end - address
+            ]
+
+    @classmethod
+    async def from_module(cls, reader, base_address: int) -> "ModuleMirror":
+        """
+        Copy the read-only sections of a loaded module
+
+        Args:
+            reader: MemoryReader of the process the module is loaded in
+            base_address: Base address of the module
+        """
+        nt_headers = base_address + await reader.read_typed(
+            base_address + 0x3C, "unsigned int"
+        )
+        section_count = await reader.read_typed(nt_headers + 6, "unsigned short")
+        optional_header_size = await reader.read_typed(nt_headers + 20, "unsigned short")
+
+        section_table = await reader.read_bytes(
+            nt_headers + 24 + optional_header_size,
+            section_count * _section_header_struct.size,
+        )
+
+        sections = {}
+        for header in _section_header_struct.iter_unpack(section_table):
+            virtual_size, virtual_address, characteristics = header[1], header[2], header[9]
+
+            if characteristics & IMAGE_SCN_MEM_WRITE or virtual_size == 0:
+                continue
+
+            section_address = base_address + virtual_address
+            # sections are megabytes so they're read off the event loop
+            sections[section_address] = bytearray(
+                await reader.run_in_executor(
+                    reader.process.read_bytes, section_address, virtual_size
+                )
+            )
+
+        return cls(sections)
+
+
+# (process id, process handle) -> mirror of that process's main module; the
+# handle is part of the key so a new process reusing a dead one's id isn't
+# served the old process's bytes
+_module_mirrors: Dict[Tuple[int, int], ModuleMirror] = {}
+
+
+def get_module_mirror(process: pymem.Pymem) -> Optional[ModuleMirror]:
+    """
+    Get the mirror loaded for a process
+
+    Args:
+        process: The process
+
+    Returns:
+        The mirror or None if one hasn't been loaded
+    """
+    return _module_mirrors.get((process.process_id, process.process_handle))
+
+
+def set_module_mirror(process: pymem.Pymem, mirror: Optional[ModuleMirror]):
+    """
+    Set or remove the mirror used for a process; mirrors of other processes
+    that had the same id are dropped
+
+    Args:
+        process: The process
+        mirror: The mirror or None to stop using one
+    """
+    for key in [key for key in _module_mirrors if key[0] == process.process_id]:
+        del _module_mirrors[key]
+
+    if mirror is not None:
+        _module_mirrors[(process.process_id, process.process_handle)] = mirror
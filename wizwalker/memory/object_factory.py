@@ -0,0 +1,144 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Type
+
+from .memory_object import DynamicMemoryObject, PropertyClass
+from .memory_objects.actor_body import DynamicActorBody
+from .memory_objects.behavior_instance import DynamicBehaviorInstance
+from .memory_objects.behavior_template import DynamicBehaviorTemplate
+from .memory_objects.character_registry import DynamicCharacterRegistry
+from .memory_objects.client_object import DynamicClientObject
+from .memory_objects.combat_participant import DynamicCombatParticipant
+from .memory_objects.combat_resolver import DynamicCombatResolver
+from .memory_objects.game_object_template import DynamicWizGameObjectTemplate
+from .memory_objects.game_stats import DynamicGameStats
+from .memory_objects.play_deck import DynamicPlayDeck
+from .memory_objects.spell import DynamicGraphicalSpell, DynamicHand, DynamicSpell
+from .memory_objects.spell_effect import DynamicSpellEffect
+from .memory_objects.spell_template import DynamicSpellTemplate
+from .memory_objects.window import (
+    DynamicDeckListControl,
+    DynamicSpellListControl,
+    DynamicWindow,
+)
+
+
+class _DynamicPropertyClass(DynamicMemoryObject, PropertyClass):
+    __slots__ = ()
+
+
+# type name -> most specific wrapper
+_type_classes: Dict[str, Type[DynamicMemoryObject]] = {
+    "ActorBody": DynamicActorBody,
+    "BehaviorInstance": DynamicBehaviorInstance,
+    "BehaviorTemplate": DynamicBehaviorTemplate,
+    "CharacterRegistry": DynamicCharacterRegistry,
+    "ClientObject": DynamicClientObject,
+    "WizClientObject": DynamicClientObject,
+    "CombatParticipant": DynamicCombatParticipant,
+    "CombatResolver": DynamicCombatResolver,
+    "WizGameObjectTemplate": DynamicWizGameObjectTemplate,
+    "WizGameStats": DynamicGameStats,
+    "PlayDeck": DynamicPlayDeck,
+    "Spell": DynamicSpell,
+    "GraphicalSpell": DynamicGraphicalSpell,
+    "Hand": DynamicHand,
+    "SpellEffect": DynamicSpellEffect,
+    "RandomSpellEffect": DynamicSpellEffect,
+    "RandomPerTargetSpellEffect": DynamicSpellEffect,
+    "VariableSpellEffect": DynamicSpellEffect,
+    "SpellTemplate": DynamicSpellTemplate,
+    "Window": DynamicWindow,
+    "DeckListControl": DynamicDeckListControl,
+    "SpellListControl": DynamicSpellListControl,
+}
+
+# unregistered type names like these are wrapped as DynamicWindow
+# i.e. ControlButton, ControlSpellCheckBox, MessageBoxModalWindow, CombatantControl
+_window_prefixes = ("Control",)
+_window_suffixes = ("Window", "Control")
+
+# (exe build key, vtable offset) -> wrapper or None if the type isn't registered
+# least recently used first; see read_type_name for the key
+_vtable_classes: "OrderedDict[Hashable, Optional[Type[DynamicMemoryObject]]]" = OrderedDict()
+_max_vtable_classes = 4096
+
+
+def register_dynamic_type(type_name: str, dynamic_class: Type[DynamicMemoryObject]):
+    """
+    Register the wrapper dynamic_object_from_address returns for a type
+
+    Args:
+        type_name: The game's type name, i.e. SpellCheckBox
+        dynamic_class: The Dynamic* class to wrap objects of that type in
+    """
+    _type_classes[type_name] = dynamic_class
+    # lookups that missed this type would be stale
+    _vtable_classes.clear()
+
+
+def _lookup_type_class(type_name: str) -> Optional[Type[DynamicMemoryObject]]:
+    if (dynamic_class := _type_classes.get(type_name)) is not None:
+        return dynamic_class
+
+    if type_name.startswith(_window_prefixes) or type_name.endswith(_window_suffixes):
+        return DynamicWindow
+
+    return None
+
+
+async def dynamic_object_from_address(
+    hook_handler,
+    address: int,
+    default: Type[DynamicMemoryObject] = None,
+) -> DynamicMemoryObject:
+    """
+    Wrap an object in the Dynamic* class registered for its type
+
+    The class is looked up by vtable so after the first object of a type
+    this is a single 8 byte read. Window types that aren't registered, i.e.
+    ControlButton, are wrapped as DynamicWindow
+
+    Examples:
+        .. code-block:: py
+
+            window = await dynamic_object_from_address(
+                client.hook_handler, address, default=DynamicWindow
+            )
+
+    Args:
+        hook_handler: The HookHandler of the client the object is in
+        address: Address of the object
+        default: Class to use if the type isn't registered
+
+    Raises:
+        ValueError: If the type isn't registered and there is no default
+
+    Returns:
+        The wrapped object
+    """
+    vtable = await hook_handler.read_typed(address, "long long")
+
+    exe_module = await hook_handler.get_exe_module()
+    cache_key = (await hook_handler.get_exe_module_key(), vtable - exe_module.lpBaseOfDll)
+
+    try:
+        dynamic_class = _vtable_classes[cache_key]
+    except KeyError:
+        type_name = await _DynamicPropertyClass(hook_handler, address).read_type_name()
+        dynamic_class = _vtable_classes[cache_key] = _lookup_type_class(type_name)
+
+        while len(_vtable_classes) > _max_vtable_classes:
+            _vtable_classes.popitem(last=False)
+
+    else:
+        _vtable_classes.move_to_end(cache_key)
+
+    if dynamic_class is None:
+        if default is None:
+            # the name is cached by vtable so this doesn't decode it again
+            type_name = await _DynamicPropertyClass(hook_handler, address).read_type_name()
+            raise ValueError(f"No dynamic type registered for {type_name}")
+
+        dynamic_class = default
+
+    return dynamic_class(hook_handler, address)
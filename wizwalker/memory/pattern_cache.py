@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiofiles
+from loguru import logger
+
+from wizwalker import utils
+
+
+class PatternCache:
+    """
+    Shares module relative pattern scan results between clients and launches
+
+    Results are grouped by a key built from the module's PE timestamp and
+    image size, so every client running the same build reuses one scan and
+    a game patch starts a fresh group; the old groups are dropped when the
+    cache is saved
+
+    Keyword Args:
+        enabled: If results should be read from and written to the cache
+        persist: If results should also be saved to disk
+        path: File to store the cache in, defaults to pattern_cache.json in the cache folder
+    """
+
+    def __init__(self, *, enabled: bool = True, persist: bool = True, path: Path = None):
+        self.enabled = enabled
+        self.persist = persist
+        self._path = path
+
+        # module key -> pattern hex -> [(offset, match length)]
+        self._results: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}
+        self._loaded = False
+        # made on first use so they belong to the running loop
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._save_lock: Optional[asyncio.Lock] = None
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = utils.get_cache_folder() / "pattern_cache.json"
+
+        return self._path
+
+    async def load(self):
+        """
+        Load the cache file if it hasn't been loaded yet; concurrent callers
+        wait for the same load
+        """
+        if self._loaded or not self.persist:
+            return
+
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            try:
+                loaded = await self._read_file()
+            finally:
+                self._loaded = True
+
+            # results set while the file was read are newer than the file's
+            for module_key, patterns in loaded.items():
+                module_results = self._results.setdefault(module_key, {})
+                for pattern, results in patterns.items():
+                    module_results.setdefault(pattern, results)
+
+    async def _read_file(self) -> Dict[str, Dict[str, List[Tuple[int, int]]]]:
+        try:
+            async with aiofiles.open(self.path) as fp:
+                data = await fp.read()
+        except FileNotFoundError:
+            return {}
+        # patterns are scanned again instead
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.warning(f"Couldn't load pattern cache from {self.path}: {exc}")
+            return {}
+
+        try:
+            return {
+                module_key: {
+                    pattern: [tuple(result) for result in results]
+                    for pattern, results in patterns.items()
+                }
+                for module_key, patterns in json.loads(data).items()
+            }
+        except (ValueError, AttributeError, TypeError):
+            logger.warning(f"Ignoring invalid pattern cache at {self.path}")
+            return {}
+
+    async def save(self):
+        """
+        Write the cache file; it's written to a temporary file first and then
+        swapped in so readers never see a partial write
+        """
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        async with self._save_lock:
+            try:
+                async with aiofiles.open(temp_path, "w+") as fp:
+                    await fp.write(json.dumps(self._results))
+
+                os.replace(temp_path, self.path)
+            # results are still shared in memory
+            except OSError as exc:
+                logger.warning(f"Couldn't save pattern cache to {self.path}: {exc}")
+
+    @asynccontextmanager
+    async def lock(self, module_key: str, pattern: bytes):
+        """
+        Hold the lock for scanning a pattern in a module; holding it while
+        checking the cache and scanning makes concurrent scans of the same
+        pattern wait for the first one instead of repeating it
+
+        The cache file is loaded before the lock is taken so a waiter never
+        misses a result that's only in the file
+
+        Args:
+            module_key: Key of the module being scanned
+            pattern: The pattern being scanned for
+        """
+        await self.load()
+
+        key = (module_key, pattern.hex())
+
+        if (lock := self._locks.get(key)) is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        async with lock:
+            yield
+
+    def get(self, module_key: str, pattern: bytes) -> Optional[List[Tuple[int, int]]]:
+        """
+        Get cached results
+
+        Args:
+            module_key: Key of the module that was scanned
+            pattern: The pattern that was scanned for
+
+        Returns:
+            A list of (module offset, match length) or None if not cached
+        """
+        if not self.enabled:
+            return None
+
+        return self._results.get(module_key, {}).get(pattern.hex())
+
+    async def set(self, module_key: str, pattern: bytes, results: List[Tuple[int, int]]):
+        """
+        Cache results and save them
+
+        Args:
+            module_key: Key of the module that was scanned
+            pattern: The pattern that was scanned for
+            results: A list of (module offset, match length)
+        """
+        if not self.enabled:
+            return
+
+        module_name = module_key.rsplit("-", 2)[0]
+        # results for older builds of this module won't be used again
+        for old_key in list(self._results):
+            if old_key != module_key and old_key.rsplit("-", 2)[0] == module_name:
+                del self._results[old_key]
+
+        self._results.setdefault(module_key, {})[pattern.hex()] = list(results)
+
+        if self.persist:
+            await self.save()
+
+    def clear(self):
+        """
+        Drop every cached result; the file is rewritten on the next set
+        """
+        self._results = {}
+
+
+_pattern_cache = PatternCache()
+
+
+def get_pattern_cache() -> PatternCache:
+    """
+    Get the pattern cache shared by every reader
+    """
+    return _pattern_cache
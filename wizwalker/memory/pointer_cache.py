@@ -0,0 +1,70 @@
+from typing import Dict, Hashable, Optional, Set
+
+
+class PointerCache:
+    """
+    Memoizes resolved base addresses so accessors don't re-read pointer chains
+
+    Entries are grouped by tag so they can be dropped when the game moves
+    them; the client invalidates "zone" entries on zone changes and loading
+    screens and "duel" entries when the current duel's address changes
+
+    Disabled by default; enable with `client.hook_handler.pointer_cache.enabled = True`
+
+    Keyword Args:
+        enabled: If lookups should be served from the cache
+    """
+
+    def __init__(self, *, enabled: bool = False):
+        self.enabled = enabled
+
+        self._addresses: Dict[Hashable, int] = {}
+        self._tagged_keys: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self):
+        return len(self._addresses)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """
+        Get a cached address
+
+        Args:
+            key: The key the address was cached under
+
+        Returns:
+            The address or None if it isn't cached or the cache is disabled
+        """
+        if not self.enabled:
+            return None
+
+        return self._addresses.get(key)
+
+    def set(self, key: Hashable, address: int, tag: str = "zone"):
+        """
+        Cache an address
+
+        Args:
+            key: Key to cache the address under
+            address: The resolved address
+            tag: Group the entry is invalidated with
+        """
+        if not self.enabled:
+            return
+
+        self._addresses[key] = address
+        self._tagged_keys.setdefault(tag, set()).add(key)
+
+    def invalidate(self, tag: str = None):
+        """
+        Drop cached addresses
+
+        Args:
+            tag: Only drop entries with this tag or None to drop everything
+        """
+        if tag is None:
+            self._addresses.clear()
+            self._tagged_keys.clear()
+            return
+
+        for key in self._tagged_keys.pop(tag, ()):
+            self._addresses.pop(key, None)
@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import pymem
+import pymem.exception
+
+
+def merge_read_requests(
+    requests: List[Tuple[int, int, Any]], max_gap: int, max_size: int
+) -> List[Tuple[int, int, List[Tuple[int, int, Any]]]]:
+    """
+    Merge (address, size, ...) read requests into larger ranges
+
+    Args:
+        requests: The requests to merge
+        max_gap: Largest gap between two ranges that still merges them
+        max_size: Largest merged range
+
+    Returns:
+        A list of (start, end, requests in the range)
+    """
+    merged = []
+
+    for request in sorted(requests, key=lambda pending: pending[0]):
+        address, size = request[0], request[1]
+
+        if merged:
+            start, end, range_requests = merged[-1]
+            new_end = max(end, address + size)
+
+            if address <= end + max_gap and new_end - start <= max_size:
+                merged[-1] = (start, new_end, range_requests)
+                range_requests.append(request)
+                continue
+
+        merged.append((address, address + size, [request]))
+
+    return merged
+
+
+class ReadCoalescer:
+    """
+    Merges reads of one process requested in the same loop iteration
+
+    Reads are queued and flushed on the next loop iteration; ranges that
+    overlap or are within max_gap bytes of each other are read together and
+    each caller gets its slice of the result
+
+    Args:
+        process: The process to read from
+
+    Keyword Args:
+        max_gap: Largest gap between two ranges that still merges them
+        max_size: Largest merged read
+    """
+
+    def __init__(
+        self, process: pymem.Pymem, *, max_gap: int = 64, max_size: int = 0x10000
+    ):
+        self.process = process
+        self.max_gap = max_gap
+        self.max_size = max_size
+
+        self._pending: List[Tuple[int, int, asyncio.Future]] = []
+        self._flush_scheduled = False
+
+    async def read(self, address: int, size: int) -> bytes:
+        """
+        Queue a read and wait for it
+
+        Args:
+            address: The address to read from
+            size: The number of bytes to read
+
+        Raises:
+            pymem.exception.MemoryReadError: If the range couldn't be read
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._pending.append((address, size, future))
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            # everything else that's ready this iteration queues first
+            loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self):
+        pending = self._pending
+        self._pending = []
+        self._flush_scheduled = False
+
+        try:
+            self._read_merged(pending)
+        # anything raised here has to reach the waiting tasks
+        except Exception as exc:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+
+    def _read_merged(self, pending: List[Tuple[int, int, asyncio.Future]]):
+        for start, end, requests in merge_read_requests(pending, self.max_gap, self.max_size):
+            try:
+                data = self.process.read_bytes(start, end - start)
+            except pymem.exception.MemoryReadError:
+                # one of the ranges or a gap isn't readable, read them alone
+                self._read_separately(requests)
+                continue
+
+            for address, size, future in requests:
+                if not future.done():
+                    future.set_result(data[address - start:address - start + size])
+
+    def _read_separately(self, requests: List[Tuple[int, int, asyncio.Future]]):
+        for address, size, future in requests:
+            if future.done():
+                continue
+
+            try:
+                future.set_result(self.process.read_bytes(address, size))
+            except Exception as exc:
+                future.set_exception(exc)
+
+
+# process id -> coalescer reads of that process go through
+_read_coalescers: Dict[int, ReadCoalescer] = {}
+
+
+def get_read_coalescer(process_id: int) -> Optional[ReadCoalescer]:
+    """
+    Get the coalescer used for a process
+
+    Args:
+        process_id: Id of the process
+
+    Returns:
+        The coalescer or None if reads aren't coalesced
+    """
+    return _read_coalescers.get(process_id)
+
+
+def set_read_coalescer(process_id: int, coalescer: Optional[ReadCoalescer]):
+    """
+    Set or remove the coalescer used for a process
+
+    Args:
+        process_id: Id of the process
+        coalescer: The coalescer or None to read directly
+    """
+    if coalescer is None:
+        _read_coalescers.pop(process_id, None)
+
+    else:
+        _read_coalescers[process_id] = coalescer
@@ -0,0 +1,128 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+import pymem
+import pymem.exception
+
+
+class ReadSnapshot:
+    """
+    Copies of whole pages read while a snapshot scope is active
+
+    The first read touching a page reads the entire page; later reads of it
+    are served locally so every read in the scope sees the same state
+
+    Args:
+        process_id: Id of the process this snapshot is of
+
+    Keyword Args:
+        page_size: How many bytes to read at a time, must be a power of 2
+    """
+
+    def __init__(self, process_id: int, *, page_size: int = 0x1000):
+        if page_size <= 0 or page_size & (page_size - 1):
+            raise ValueError("page_size must be a power of 2")
+
+        self.process_id = process_id
+        self.page_size = page_size
+
+        self._pages: Dict[int, bytes] = {}
+
+    def __len__(self):
+        return len(self._pages)
+
+    def read(self, process: pymem.Pymem, address: int, size: int) -> bytes:
+        """
+        Read through the snapshot
+
+        Args:
+            process: The process to read pages from
+            address: The address to read from
+            size: The number of bytes to read
+        """
+        page_mask = ~(self.page_size - 1)
+        first_page = address & page_mask
+        last_page = (address + size - 1) & page_mask
+
+        pages = []
+        for page_address in range(first_page, last_page + 1, self.page_size):
+            if (page := self._pages.get(page_address)) is None:
+                try:
+                    page = process.read_bytes(page_address, self.page_size)
+                # part of the page isn't readable so just read what was asked for
+                except pymem.exception.MemoryReadError:
+                    return process.read_bytes(address, size)
+
+                self._pages[page_address] = page
+
+            pages.append(page)
+
+        start = address - first_page
+        if len(pages) == 1:
+            return pages[0][start:start + size]
+
+        return b"".join(pages)[start:start + size]
+
+    def invalidate(self, address: int, size: int):
+        """
+        Drop the pages a range touches
+
+        Args:
+            address: Start of the range
+            size: Length of the range
+        """
+        page_mask = ~(self.page_size - 1)
+        first_page = address & page_mask
+        last_page = (address + size - 1) & page_mask
+
+        for page_address in range(first_page, last_page + 1, self.page_size):
+            self._pages.pop(page_address, None)
+
+
+# process id -> snapshot for the scopes active in the current context; tasks
+# started inside a scope inherit it
+_active_snapshots = ContextVar("wizwalker_active_snapshots", default=None)
+
+
+def get_active_snapshot(process_id: int) -> Optional[ReadSnapshot]:
+    """
+    Get the snapshot of a process active in the current context
+
+    Args:
+        process_id: Id of the process
+
+    Returns:
+        The snapshot or None if there isn't one active
+    """
+    if (snapshots := _active_snapshots.get()) is None:
+        return None
+
+    return snapshots.get(process_id)
+
+
+@asynccontextmanager
+async def read_snapshot(process_id: int, *, page_size: int = 0x1000):
+    """
+    Serve reads of a process from a ReadSnapshot until the scope exits;
+    nested scopes of the same process reuse the outer snapshot
+
+    Args:
+        process_id: Id of the process
+
+    Keyword Args:
+        page_size: How many bytes to read at a time, must be a power of 2
+    """
+    if (snapshot := get_active_snapshot(process_id)) is not None:
+        yield snapshot
+        return
+
+    snapshot = ReadSnapshot(process_id, page_size=page_size)
+    token = _active_snapshots.set(
+        {**(_active_snapshots.get() or {}), process_id: snapshot}
+    )
+
+    try:
+        yield snapshot
+    finally:
+        _active_snapshots.reset(token)
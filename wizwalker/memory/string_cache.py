@@ -0,0 +1,103 @@
+import zlib
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+
+class StringCache:
+    """
+    Bounded least recently used cache of decoded heap strings
+
+    Entries are keyed by process, buffer address, length, encoding and a
+    checksum of the buffer's first check_size bytes, so a hit only costs
+    reading that prefix and skips reading the rest and decoding
+
+    Disabled by default; enable with `get_string_cache().enabled = True`
+
+    Keyword Args:
+        enabled: If string reads should use the cache
+        max_size: How many strings to remember
+        check_size: How many bytes from the start of the buffer are checksummed
+        verify: Read the whole buffer on hits and compare it to the cached bytes
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        max_size: int = 4096,
+        check_size: int = 16,
+        verify: bool = False,
+    ):
+        self.enabled = enabled
+        self.max_size = max_size
+        self.check_size = check_size
+        self.verify = verify
+
+        # key -> (raw bytes, decoded string)
+        self._strings: "OrderedDict[Hashable, Tuple[bytes, str]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._strings)
+
+    def make_key(
+        self, process_id: int, address: int, size: int, encoding: str, prefix: bytes
+    ) -> Hashable:
+        """
+        Build the key a string is cached under
+
+        Args:
+            process_id: Id of the process the string is in
+            address: Address of the string's buffer
+            size: Size of the string in bytes
+            encoding: Encoding the string is decoded with
+            prefix: The first check_size bytes of the buffer
+        """
+        return process_id, address, size, encoding, zlib.crc32(prefix)
+
+    def get(self, key: Hashable) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a cached string
+
+        Args:
+            key: The key from make_key
+
+        Returns:
+            (raw bytes, string) or None if it isn't cached
+        """
+        entry = self._strings.get(key)
+
+        if entry is not None:
+            self._strings.move_to_end(key)
+
+        return entry
+
+    def set(self, key: Hashable, raw: bytes, string: str):
+        """
+        Cache a string
+
+        Args:
+            key: The key from make_key
+            raw: The string's bytes
+            string: The decoded string
+        """
+        self._strings[key] = (raw, string)
+        self._strings.move_to_end(key)
+
+        while len(self._strings) > self.max_size:
+            self._strings.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop every cached string
+        """
+        self._strings.clear()
+
+
+_string_cache = StringCache()
+
+
+def get_string_cache() -> StringCache:
+    """
+    Get the string cache shared by every object
+    """
+    return _string_cache
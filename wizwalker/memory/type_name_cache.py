@@ -0,0 +1,71 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class TypeNameCache:
+    """
+    Bounded least recently used map of vtables to type names
+
+    Type names only depend on the vtable, so one cache is shared by every
+    object and client; keys are the exe's build key (see
+    HookHandler.get_exe_module_key) and the vtable's offset into the exe so
+    clients of one build share entries and different builds don't mix
+
+    Keyword Args:
+        max_size: How many vtables to remember
+    """
+
+    def __init__(self, *, max_size: int = 4096):
+        self.max_size = max_size
+
+        self._type_names = OrderedDict()
+
+    def __len__(self):
+        return len(self._type_names)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Get a cached type name
+
+        Args:
+            key: The key the name was cached under
+
+        Returns:
+            The type name or None if it isn't cached
+        """
+        type_name = self._type_names.get(key)
+
+        if type_name is not None:
+            self._type_names.move_to_end(key)
+
+        return type_name
+
+    def set(self, key: Hashable, type_name: str):
+        """
+        Cache a type name
+
+        Args:
+            key: Key to cache the name under
+            type_name: The type name
+        """
+        self._type_names[key] = type_name
+        self._type_names.move_to_end(key)
+
+        while len(self._type_names) > self.max_size:
+            self._type_names.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop every cached type name
+        """
+        self._type_names.clear()
+
+
+_type_name_cache = TypeNameCache()
+
+
+def get_type_name_cache() -> TypeNameCache:
+    """
+    Get the type name cache shared by every object
+    """
+    return _type_name_cache
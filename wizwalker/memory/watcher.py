@@ -0,0 +1,404 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from loguru import logger
+
+from wizwalker.utils import run_callback
+from .memory_reader import MemoryReader, type_struct_dict
+from .read_coalescer import merge_read_requests
+
+
+# put in a watch's queue when it's closed
+_CLOSED = object()
+
+
+class FieldWatch:
+    """
+    A watched field; iterate it with `async for` to get each new value
+
+    The first value delivered is the field's value when it was first polled,
+    after that only changes are delivered
+
+    Made with FieldWatcher.watch or FieldWatcher.watch_address
+    """
+
+    def __init__(
+        self,
+        watcher: "FieldWatcher",
+        *,
+        accessor: Optional[Callable[[], Awaitable[Any]]] = None,
+        address: Optional[int] = None,
+        data_type: Optional[str] = None,
+        callback: Optional[Callable[[Any], Any]] = None,
+        ignore_errors: bool = True,
+        max_interval: float,
+    ):
+        self.watcher = watcher
+        self.accessor = accessor
+        self.address = address
+        self.data_type = data_type
+        self.callback = callback
+        self.ignore_errors = ignore_errors
+        self.max_interval = max_interval
+
+        self.value = None
+        self.has_value = False
+        self.closed = False
+
+        self._queue = asyncio.Queue()
+        self._interval = watcher.min_interval
+        self._next_poll = 0.0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self._queue.get()
+
+        if item is _CLOSED:
+            # let other iterators of this watch stop too
+            self._queue.put_nowait(_CLOSED)
+            raise StopAsyncIteration
+
+        if isinstance(item, BaseException):
+            raise item
+
+        return item
+
+    async def wait_for(
+        self, predicate: Callable[[Any], bool], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Wait for a value predicate returns True for
+
+        Args:
+            predicate: Called with each new value
+            timeout: How long to wait or None for no timeout
+
+        Returns:
+            The value predicate returned True for
+
+        Raises:
+            asyncio.TimeoutError: If the timeout ran out
+            RuntimeError: If the watch was closed first
+        """
+
+        async def _wait():
+            async for value in self:
+                if predicate(value):
+                    return value
+
+            raise RuntimeError("Watch was closed")
+
+        return await asyncio.wait_for(_wait(), timeout)
+
+    def close(self):
+        """
+        Stop watching; iterators of this watch stop
+        """
+        if self.closed:
+            return
+
+        self.closed = True
+        self.watcher._remove(self)
+        self._queue.put_nowait(_CLOSED)
+
+    def _deliver(self, value: Any):
+        # closed while it was being polled
+        if self.closed:
+            return
+
+        if self.has_value and value == self.value:
+            self._interval = min(self._interval * self.watcher.backoff, self.max_interval)
+            return
+
+        self.value = value
+        self.has_value = True
+        self._interval = self.watcher.min_interval
+        self._queue.put_nowait(value)
+
+        if self.callback is not None:
+            run_callback(self.callback, value)
+
+    def _fail(self, exc: BaseException):
+        if self.closed:
+            return
+
+        if self.ignore_errors:
+            self._interval = min(self._interval * self.watcher.backoff, self.max_interval)
+            return
+
+        self._queue.put_nowait(exc)
+        self.close()
+
+
+class FieldWatcher:
+    """
+    Polls every watched field of one client from a single task
+
+    Fields due at the same time are polled together; raw addresses are
+    merged into as few reads as possible and accessors are gathered. Each
+    field is polled every min_interval seconds while it changes and backs
+    off up to its max_interval while it doesn't
+
+    Args:
+        reader: The reader to poll with
+
+    Keyword Args:
+        min_interval: Seconds between polls of a field that just changed
+        max_interval: Default for the most seconds between polls of a field
+        backoff: What the interval is multiplied by each poll without a change
+        max_gap: Largest gap between two addresses that still merges their reads
+        max_size: Largest merged read
+    """
+
+    def __init__(
+        self,
+        reader: MemoryReader,
+        *,
+        min_interval: float = 0.05,
+        max_interval: float = 0.5,
+        backoff: float = 2.0,
+        max_gap: int = 64,
+        max_size: int = 0x10000,
+    ):
+        self.reader = reader
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_gap = max_gap
+        self.max_size = max_size
+
+        self._watches: List[FieldWatch] = []
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def __len__(self):
+        return len(self._watches)
+
+    def watch(
+        self,
+        accessor: Callable[[], Awaitable[Any]],
+        *,
+        callback: Optional[Callable[[Any], Any]] = None,
+        ignore_errors: bool = True,
+        max_interval: Optional[float] = None,
+    ) -> FieldWatch:
+        """
+        Watch what an accessor returns i.e. client.duel.duel_phase
+
+        Args:
+            accessor: Coroutine function to poll
+
+        Keyword Args:
+            callback: Called with each new value; awaitables it returns are scheduled
+            ignore_errors: If errors should be ignored instead of ending the watch
+            max_interval: Most seconds between polls or None for the watcher's default
+        """
+        return self._add(
+            FieldWatch(
+                self,
+                accessor=accessor,
+                callback=callback,
+                ignore_errors=ignore_errors,
+                max_interval=self.max_interval if max_interval is None else max_interval,
+            )
+        )
+
+    def watch_address(
+        self,
+        address: int,
+        data_type: str,
+        *,
+        callback: Optional[Callable[[Any], Any]] = None,
+        ignore_errors: bool = True,
+        max_interval: Optional[float] = None,
+    ) -> FieldWatch:
+        """
+        Watch a typed value at an address
+
+        Args:
+            address: The address to watch
+            data_type: The type to read (defined in constants)
+
+        Keyword Args:
+            callback: Called with each new value; awaitables it returns are scheduled
+            ignore_errors: If errors should be ignored instead of ending the watch
+            max_interval: Most seconds between polls or None for the watcher's default
+        """
+        if data_type not in type_struct_dict:
+            raise ValueError(f"{data_type} is not a valid data type")
+
+        return self._add(
+            FieldWatch(
+                self,
+                address=address,
+                data_type=data_type,
+                callback=callback,
+                ignore_errors=ignore_errors,
+                max_interval=self.max_interval if max_interval is None else max_interval,
+            )
+        )
+
+    async def wait_for(
+        self,
+        accessor: Callable[[], Awaitable[Any]],
+        predicate: Callable[[Any], bool],
+        *,
+        timeout: Optional[float] = None,
+        ignore_errors: bool = True,
+        max_interval: Optional[float] = None,
+    ) -> Any:
+        """
+        Wait for an accessor to return a value predicate returns True for
+
+        Args:
+            accessor: Coroutine function to poll
+            predicate: Called with each new value
+
+        Keyword Args:
+            timeout: How long to wait or None for no timeout
+            ignore_errors: If errors should be ignored instead of raised
+            max_interval: Most seconds between polls or None for the watcher's default
+
+        Returns:
+            The value predicate returned True for
+        """
+        field_watch = self.watch(
+            accessor, ignore_errors=ignore_errors, max_interval=max_interval
+        )
+
+        try:
+            return await field_watch.wait_for(predicate, timeout)
+        finally:
+            field_watch.close()
+
+    def close(self):
+        """
+        Close every watch and stop polling
+        """
+        for field_watch in list(self._watches):
+            field_watch.close()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _add(self, field_watch: FieldWatch) -> FieldWatch:
+        self._watches.append(field_watch)
+
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+
+        else:
+            # poll the new watch now instead of after the current sleep
+            self._wake.set()
+
+        return field_watch
+
+    def _remove(self, field_watch: FieldWatch):
+        try:
+            self._watches.remove(field_watch)
+        except ValueError:
+            pass
+
+    async def _run(self):
+        loop = asyncio.get_event_loop()
+
+        while self._watches:
+            now = loop.time()
+            due = [
+                field_watch
+                for field_watch in self._watches
+                if field_watch._next_poll <= now
+            ]
+
+            if due:
+                # one bad poll can't be allowed to end every watch of the client
+                try:
+                    await self._poll(due)
+                except Exception:
+                    logger.exception("Error while polling watched fields")
+
+                now = loop.time()
+                for field_watch in due:
+                    field_watch._next_poll = now + field_watch._interval
+
+            if not self._watches:
+                break
+
+            next_poll = min(field_watch._next_poll for field_watch in self._watches)
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), max(next_poll - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, due: List[FieldWatch]):
+        address_watches = []
+        accessor_watches = []
+        for field_watch in due:
+            if field_watch.accessor is None:
+                address_watches.append(field_watch)
+
+            else:
+                accessor_watches.append(field_watch)
+
+        accessor_results = asyncio.gather(
+            *(field_watch.accessor() for field_watch in accessor_watches),
+            return_exceptions=True,
+        )
+        await asyncio.gather(self._poll_addresses(address_watches), accessor_results)
+
+        for field_watch, result in zip(accessor_watches, accessor_results.result()):
+            if isinstance(result, Exception):
+                field_watch._fail(result)
+
+            else:
+                field_watch._deliver(result)
+
+    async def _poll_addresses(self, address_watches: List[FieldWatch]):
+        requests = [
+            (
+                field_watch.address,
+                type_struct_dict[field_watch.data_type].size,
+                field_watch,
+            )
+            for field_watch in address_watches
+        ]
+
+        async def _read_range(start: int, end: int, range_requests):
+            try:
+                data = await self.reader.read_bytes(start, end - start)
+            except Exception as exc:
+                if len(range_requests) == 1:
+                    range_requests[0][2]._fail(exc)
+                    return
+
+                # one of the addresses or a gap isn't readable, read them alone
+                await asyncio.gather(
+                    *(
+                        _read_range(request[0], request[0] + request[1], [request])
+                        for request in range_requests
+                    )
+                )
+                return
+
+            for address, size, field_watch in range_requests:
+                type_struct = type_struct_dict[field_watch.data_type]
+                field_watch._deliver(
+                    type_struct.unpack_from(data, address - start)[0]
+                )
+
+        await asyncio.gather(
+            *(
+                _read_range(start, end, range_requests)
+                for start, end, range_requests in merge_read_requests(
+                    requests, self.max_gap, self.max_size
+                )
+            )
+        )
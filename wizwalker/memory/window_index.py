@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from wizwalker import AddressOutOfRange, MemoryReadError
+from .memory_objects.window import DynamicWindow, Window
+
+
+@dataclass
+class WindowIndexEntry:
+    path: str
+    # address of the root window the window was found under
+    root: int
+    # (address, vtable, name) from the root's child down to the window itself
+    chain: List[Tuple[int, int, str]]
+
+
+class WindowIndex:
+    """
+    Remembers where windows are in the ui tree so repeated name lookups
+    don't have to scan the whole tree
+
+    A cached window is validated by re-reading its vtable and name before it
+    is returned; if it's gone only the subtree under its closest still valid
+    ancestor is searched again
+
+    Args:
+        root_window: The window to index from
+    """
+
+    def __init__(self, root_window: Window):
+        self.root_window = root_window
+
+        self._entries: Dict[str, WindowIndexEntry] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def paths(self) -> Dict[str, str]:
+        """
+        The paths of indexed windows
+
+        Returns:
+            A dict of window name to path, i.e. {"WorldView": "root/WorldView"}
+        """
+        return {name: entry.path for name, entry in self._entries.items()}
+
+    def invalidate(self, name: str = None):
+        """
+        Drop indexed windows
+
+        Args:
+            name: Only drop the window with this name or None to drop everything
+        """
+        if name is None:
+            self._entries.clear()
+
+        else:
+            self._entries.pop(name, None)
+
+    async def get_window_with_name(
+        self, name: str, *, validate: bool = True
+    ) -> Optional[DynamicWindow]:
+        """
+        Get a window with a name, using the index when possible
+
+        Args:
+            name: Name of the window
+
+        Keyword Args:
+            validate: Re-read a cached window's vtable and name before returning it;
+                cached windows are always dropped if the root window changed, which
+                is free to check while the root window's address is cached
+
+        Returns:
+            The window or None if no window has that name
+        """
+        entry = self._entries.get(name)
+
+        if entry is not None:
+            # windows found under another root window belong to a torn down ui tree
+            if await self.root_window.read_base_address() != entry.root:
+                entry = None
+
+            elif not validate:
+                return DynamicWindow(self.root_window.hook_handler, entry.chain[-1][0])
+
+        search_from = self.root_window
+        if entry is not None:
+            # walk up the cached chain until something is still where it was
+            for address, vtable, chain_name in reversed(entry.chain):
+                if await self._is_valid(address, vtable, chain_name):
+                    window = DynamicWindow(self.root_window.hook_handler, address)
+
+                    if chain_name == name:
+                        return window
+
+                    search_from = window
+                    break
+
+        window = await self._search(search_from, name)
+
+        # the window could have moved out of the subtree
+        if window is None and search_from is not self.root_window:
+            window = await self._search(self.root_window, name)
+
+        if window is None:
+            self._entries.pop(name, None)
+            return None
+
+        self._entries[name] = await self._make_entry(window)
+        return window
+
+    async def _is_valid(self, address: int, vtable: int, name: str) -> bool:
+        window = DynamicWindow(self.root_window.hook_handler, address)
+
+        try:
+            if await window.read_value_from_offset(0, "unsigned long long") != vtable:
+                return False
+
+            return await window.name() == name
+        except (ValueError, MemoryReadError, AddressOutOfRange):
+            return False
+
+    @staticmethod
+    async def _search(window: Window, name: str) -> Optional[DynamicWindow]:
+        possible = await window.get_windows_with_name(name, find_first=True)
+
+        if possible:
+            return possible[0]
+
+        return None
+
+    async def _make_entry(self, window: DynamicWindow) -> WindowIndexEntry:
+        # get_parents ends at the root, which isn't part of the chain
+        windows = [*reversed(await window.get_parents()), window][1:]
+
+        chain = []
+        for chain_window in windows:
+            chain.append(
+                (
+                    await chain_window.read_base_address(),
+                    await chain_window.read_value_from_offset(0, "unsigned long long"),
+                    await chain_window.name(),
+                )
+            )
+
+        path = "/".join(["root", *(chain_name for _, _, chain_name in chain)])
+        return WindowIndexEntry(path, await self.root_window.read_base_address(), chain)
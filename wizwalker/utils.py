@@ -1,6 +1,7 @@
 import asyncio
 import ctypes
 import ctypes.wintypes
+import inspect
 import io
 import math
 import struct
@@ -9,10 +10,12 @@ import subprocess
 # noinspection PyCompatibility
 import winreg
 import zlib
+from array import array
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Optional
 
 import appdirs
+from loguru import logger
 
 from wizwalker import ExceptionalTimeout
 from wizwalker.constants import Keycode, kernel32, user32, gdi32
@@ -39,6 +42,8 @@ async def async_sorted(iterable, /, *, key=None, reverse=False):
 
 
 class XYZ:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
@@ -88,6 +93,150 @@ class XYZ:
         return self.yaw(other)
 
 
+class XYZArray:
+    """
+    Many xyz points in one contiguous float64 buffer
+
+    Distance and yaw work like XYZ.distance and XYZ.yaw, so they ignore the z axis
+
+    Args:
+        values: Flat x, y, z values, i.e. [x1, y1, z1, x2, y2, z2]
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Iterable[float] = ()):
+        self._values = array("d", values)
+
+        if len(self._values) % 3 != 0:
+            raise ValueError("values must be a multiple of 3 long")
+
+    @classmethod
+    def from_xyzs(cls, xyzs: Iterable[XYZ]) -> "XYZArray":
+        """
+        Build an array from XYZs
+        """
+        return cls(value for xyz in xyzs for value in xyz)
+
+    @classmethod
+    def from_buffer(cls, data: bytes) -> "XYZArray":
+        """
+        Build an array from packed float32 x, y, z triples as they are stored in memory
+        """
+        return cls(array("f", data))
+
+    def __len__(self):
+        return len(self._values) // 3
+
+    def __getitem__(self, index: int) -> XYZ:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("XYZArray index out of range")
+
+        return XYZ(*self._values[index * 3:index * 3 + 3])
+
+    def __iter__(self):
+        values = self._values
+        return (XYZ(*values[i:i + 3]) for i in range(0, len(values), 3))
+
+    def __str__(self):
+        return f"<XYZArray {len(self)} points>"
+
+    def __repr__(self):
+        return str(self)
+
+    def append(self, xyz: XYZ):
+        """
+        Add a point to the end
+        """
+        self._values.extend((xyz.x, xyz.y, xyz.z))
+
+    def xs(self) -> array:
+        """
+        The x values of every point
+        """
+        return self._values[0::3]
+
+    def ys(self) -> array:
+        """
+        The y values of every point
+        """
+        return self._values[1::3]
+
+    def zs(self) -> array:
+        """
+        The z values of every point
+        """
+        return self._values[2::3]
+
+    def distance_to(self, xyz: XYZ) -> List[float]:
+        """
+        Distance from every point to an xyz
+
+        Args:
+            xyz: The point to measure to
+
+        Returns:
+            The distances in the same order as the points
+        """
+        x, y = xyz.x, xyz.y
+        hypot = math.hypot
+        return [hypot(px - x, py - y) for px, py in zip(self.xs(), self.ys())]
+
+    def nearest(self, xyz: XYZ) -> Optional[int]:
+        """
+        Index of the point closest to an xyz
+
+        Args:
+            xyz: The point to measure to
+
+        Returns:
+            The index or None if the array is empty
+        """
+        if not self._values:
+            return None
+
+        distances = self.distance_to(xyz)
+        return min(range(len(distances)), key=distances.__getitem__)
+
+    def within_radius(self, xyz: XYZ, radius: float) -> List[int]:
+        """
+        Indexes of points within a radius of an xyz
+
+        Args:
+            xyz: The center point
+            radius: The max distance from the center
+
+        Returns:
+            The indexes in order
+        """
+        return [
+            index
+            for index, distance in enumerate(self.distance_to(xyz))
+            if distance <= radius
+        ]
+
+    def yaw_to(self, xyz: XYZ) -> List[float]:
+        """
+        Perfect yaw from every point to reach an xyz, see calculate_perfect_yaw
+
+        Args:
+            xyz: The point to reach
+
+        Returns:
+            The yaws in the same order as the points
+        """
+        x, y = xyz.x, xyz.y
+        atan2 = math.atan2
+        tau = math.tau
+        # closed form of calculate_perfect_yaw
+        return [
+            atan2(px - x, py - y) % tau for px, py in zip(self.xs(), self.ys())
+        ]
+
+
 class Rectangle:
     def __init__(self, x1: int, y1: int, x2: int, y2: int):
         self.x1 = x1
@@ -377,6 +526,30 @@ async def wait_for_value(
                 raise e
 
 
+def run_callback(callback: Callable, *args):
+    """
+    Call a callback without letting its errors escape; errors are logged and
+    awaitables it returns are scheduled with their errors logged too
+
+    Args:
+        callback: The callback to call
+        args: What to call it with
+    """
+
+    def _log_task_error(task: asyncio.Future):
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.opt(exception=exc).error(f"Callback {callback!r} raised")
+
+    try:
+        result = callback(*args)
+    except Exception:
+        logger.exception(f"Callback {callback!r} raised")
+        return
+
+    if inspect.isawaitable(result):
+        asyncio.ensure_future(result).add_done_callback(_log_task_error)
+
+
 async def wait_for_non_error(coro, sleep_time: float = 0.5):
     """
     Wait for a coro to not error